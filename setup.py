@@ -36,6 +36,7 @@ setup(
         "gevent-websocket",
         "websocket-client",
         "python-dotenv",
+        "numpy",
     ],
     extras_require={
         "development": [
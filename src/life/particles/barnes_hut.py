@@ -0,0 +1,402 @@
+# src/life/particles/barnes_hut.py
+
+import time
+
+import numpy as np
+
+from src.life.particles.spatial_hash import COULOMB_CONSTANT, _expand
+
+# Eksen başına Morton anahtarı bit sayısı (3 x 21 = 63 bit)
+BITS = 21
+
+
+def _spread(values: np.ndarray) -> np.ndarray:
+    # 21 bitlik değerin bitlerini üçer bit aralıkla yerleştirir
+    values = values.astype(np.uint64) & np.uint64(0x1FFFFF)
+    for shift, mask in (
+        (32, 0x1F00000000FFFF),
+        (16, 0x1F0000FF0000FF),
+        (8, 0x100F00F00F00F00F),
+        (4, 0x10C30C30C30C30C3),
+        (2, 0x1249249249249249),
+    ):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def morton_keys(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Tamsayı ızgara koordinatlarının (N x 3) Morton (Z sırası) anahtarları.
+    """
+    return (
+        _spread(coordinates[:, 0])
+        | (_spread(coordinates[:, 1]) << np.uint64(1))
+        | (_spread(coordinates[:, 2]) << np.uint64(2))
+    )
+
+
+def _coulomb(delta, charges, sources, coulomb, softening) -> np.ndarray:
+    # F = k * q1 * q2 * r / (|r|² + ε²)^(3/2); benzer yükler birbirini iter
+    squared = np.einsum("ij,ij->i", delta, delta) + softening * softening
+    with np.errstate(all="ignore"):
+        scale = coulomb * charges * sources / (squared * np.sqrt(squared))
+    return delta * scale[:, None]
+
+
+def direct_forces(
+    positions,
+    charges,
+    coulomb: float = COULOMB_CONSTANT,
+    softening: float = 1e-3,
+    chunk: int = 1024,
+) -> np.ndarray:
+    """
+    Tüm çiftleri toplayan O(n²) Coulomb kuvvetleri; Barnes-Hut için referans.
+
+    :param positions: Konumlar (N x 3); sonlu olmayan konumlar kuvvet almaz ve
+        uygulamaz.
+    :param charges: Yükler (N).
+    :param coulomb: Coulomb sabiti.
+    :param softening: Yakın çiftlerin tekilliğini önleyen yumuşatma uzaklığı.
+    :param chunk: Bellek kullanımını sınırlayan hedef parça boyutu.
+    :return: Kuvvetler (N x 3).
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    charges = np.asarray(charges, dtype=np.float64).reshape(-1)
+    forces = np.zeros_like(positions)
+    valid = np.flatnonzero(np.all(np.isfinite(positions), axis=1))
+    points, sources = positions[valid], charges[valid]
+    for start in range(0, len(valid), chunk):
+        stop = start + chunk
+        targets = points[start:stop]
+        delta = targets[:, None, :] - points[None, :, :]
+        squared = np.einsum("ijk,ijk->ij", delta, delta) + softening * softening
+        with np.errstate(all="ignore"):
+            scale = sources[None, :] / (squared * np.sqrt(squared))
+        # Parçacık kendisine kuvvet uygulamaz
+        rows = np.arange(len(targets))
+        scale[rows, rows + start] = 0.0
+        forces[valid[start:stop]] = (
+            coulomb * sources[start:stop, None] * np.einsum("ij,ijk->ik", scale, delta)
+        )
+    return forces
+
+
+class BarnesHut:
+    """
+    Yüklü parçacıklar arasındaki uzun menzilli Coulomb kuvvetlerini O(n log n)
+    sürede hesaplayan Barnes-Hut çözücüsü.
+
+    Parçacıklar Morton anahtarlarına göre sıralanır; sekizli ağacın (octree)
+    her düğümü sıralı dizide bir aralıktır ve düzey düzey vektörel olarak
+    kurulur. Düğümler pozitif ve negatif yükler için ayrı tek kutuplu
+    (monopole) özet tutar; böylece zıt yükler birbirini götürdüğünde de özet
+    doğru kalır. Hedef parçacığı içermeyen ve boyut / uzaklık < theta olan
+    düğümler özetiyle, diğerleri çocuklarıyla, yapraklar doğrudan toplanır.
+    theta = 0 doğrudan toplamı verir; theta büyüdükçe hız artar, doğruluk azalır.
+    En derin düzeyde yaprak boyutunu aşan düğümlerin parçacıkları aynı hücrededir
+    ve çakışık sayılır: birbirlerine kuvvet uygulamaz, diğer parçacıklara özetle
+    etki eder. Böylece çakışık parçacıklar O(n²) doğrudan toplama dönüşmez.
+    """
+
+    def __init__(
+        self,
+        theta: float = 0.5,
+        leaf_size: int = 8,
+        softening: float = 1e-3,
+        coulomb: float = COULOMB_CONSTANT,
+        chunk: int = 2048,
+    ) -> None:
+        """
+        :param theta: Açılma açısı; düğüm boyutunun uzaklığa oranı bundan küçükse
+            düğüm tek kutuplu özetiyle hesaplanır.
+        :param leaf_size: Yaprak düğümdeki en fazla parçacık sayısı.
+        :param softening: Yakın çiftlerin tekilliğini önleyen yumuşatma uzaklığı.
+        :param coulomb: Coulomb sabiti.
+        :param chunk: Ağaçta birlikte dolaşılan hedef parçacık sayısı.
+        """
+        if theta < 0:
+            raise ValueError("Theta cannot be negative.")
+        if leaf_size < 1:
+            raise ValueError("Leaf size must be a positive value.")
+        self.theta = theta
+        self.leaf_size = leaf_size
+        self.softening = softening
+        self.coulomb = coulomb
+        self.chunk = chunk
+        self.depth = 0
+        self.nodes = 0
+        self.collapsed = np.zeros(0, dtype=bool)
+        # metrics
+        self.builds = 0
+        self.interactions = 0  # son hesaplamada özetle hesaplanan düğüm sayısı
+        self.direct = 0  # son hesaplamada doğrudan toplanan çift sayısı
+        self.build_seconds = 0.0
+        self.force_seconds = 0.0
+
+    def build(self, positions, charges) -> "BarnesHut":
+        """
+        Sekizli ağacı konumlar ve yüklerle kurar.
+
+        :param positions: Konumlar (N x 3); sonlu olmayan konumlar ağaca alınmaz.
+        :param charges: Yükler (N).
+        """
+        started = time.perf_counter()
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        charges = np.asarray(charges, dtype=np.float64).reshape(-1)
+        self.size = len(positions)
+        indices = np.flatnonzero(np.all(np.isfinite(positions), axis=1))
+        points = positions[indices]
+        low = points.min(axis=0) if len(points) else np.zeros(3)
+        side = float(np.max(points.max(axis=0) - low)) if len(points) else 0.0
+        side = side * (1 + 1e-9) or 1.0
+        scale = 2**BITS / side
+        with np.errstate(all="ignore"):
+            coordinates = np.floor((points - low) * scale)
+        coordinates = np.clip(coordinates, 0, 2**BITS - 1).astype(np.uint64)
+        keys = morton_keys(coordinates)
+        order = np.argsort(keys, kind="stable")
+        self.order = indices[order]  # sıralı dizi -> parçacık indeksi
+        self.keys = keys[order]
+        self.points = points[order]
+        self.charges = charges[indices][order]
+
+        positive = np.maximum(self.charges, 0.0)
+        negative = np.maximum(-self.charges, 0.0)
+        levels = []
+        for level in range(BITS + 1):
+            shift = np.uint64(3 * (BITS - level))
+            prefixes, starts, counts = np.unique(
+                self.keys >> shift, return_index=True, return_counts=True
+            )
+            levels.append((level, prefixes, starts, counts))
+            if len(counts) == 0 or counts.max() <= self.leaf_size:
+                break
+        self.depth = len(levels) - 1
+
+        # Düğüm dizileri düzeyler sırasıyla birleştirilir; kök düğüm 0'dır.
+        # Özetle hesaplanan düğümlerde birlikte okunan değerler tek satırdadır:
+        # monopoles = [+q, +q merkezi(3), -q, -q merkezi(3)]
+        # ranges = [başlangıç, sayı, ilk çocuk, çocuk sayısı]
+        offsets = np.cumsum([0] + [len(prefixes) for _, prefixes, _, _ in levels])
+        opening, centers, monopoles, ranges, prefix, shift, leaves, collapsed = (
+            [] for _ in range(8)
+        )
+        # Düğüm, uzaklığın karesi genişlik² / theta²'yi aşınca özetlenir;
+        # theta = 0 hiçbir düğümü özetlemez
+        ratio = 1 / self.theta**2 if self.theta > 0 else np.inf
+        for level, prefixes, starts, counts in levels:
+            size = len(counts)
+            if level == self.depth:
+                leaf = np.ones(size, dtype=bool)
+                child = children = np.zeros(size, dtype=np.int64)
+            else:
+                leaf = counts <= self.leaf_size
+                following = levels[level + 1][1]
+                child = np.searchsorted(following, prefixes << np.uint64(3))
+                children = (
+                    np.searchsorted(
+                        following, (prefixes + np.uint64(1)) << np.uint64(3)
+                    )
+                    - child
+                )
+                child = child + offsets[level + 1]
+                children = np.where(leaf, 0, children)
+            q_positive = np.add.reduceat(positive, starts)
+            q_negative = np.add.reduceat(negative, starts)
+            w_positive = np.add.reduceat(positive[:, None] * self.points, starts)
+            w_negative = np.add.reduceat(negative[:, None] * self.points, starts)
+            mean = np.add.reduceat(self.points, starts) / counts[:, None]
+            total = (q_positive + q_negative)[:, None]
+            with np.errstate(all="ignore"):
+                # Yüksüz düğümün merkezi parçacıkların ortalamasıdır
+                center = np.where(total > 0, (w_positive + w_negative) / total, mean)
+                c_positive = np.nan_to_num(w_positive / q_positive[:, None])
+                c_negative = np.nan_to_num(w_negative / q_negative[:, None])
+            opening.append(np.full(size, (side / 2**level) ** 2 * ratio))
+            centers.append(center)
+            monopoles.append(
+                np.column_stack((q_positive, c_positive, -q_negative, c_negative))
+            )
+            ranges.append(np.column_stack((starts, counts, child, children)))
+            prefix.append(prefixes)
+            shift.append(np.full(size, 3 * (BITS - level), dtype=np.uint64))
+            leaves.append(leaf)
+            collapsed.append((level == BITS) & (counts > self.leaf_size))
+        self.opening = np.concatenate(opening)
+        self.centers = np.concatenate(centers)
+        self.monopoles = np.concatenate(monopoles)
+        self.ranges = np.concatenate(ranges)
+        self.prefix = np.concatenate(prefix)
+        self.shift = np.concatenate(shift)
+        self.leaf = np.concatenate(leaves)
+        # Bölünemeyen, çakışık parçacıklardan oluşan yapraklar
+        self.collapsed = np.concatenate(collapsed)
+        self.nodes = int(offsets[-1])
+        self.builds += 1
+        self.build_seconds = time.perf_counter() - started
+        return self
+
+    def _forces_chunk(self, base: int, size: int) -> np.ndarray:
+        points, charges, keys = self.points, self.charges, self.keys
+        forces = np.zeros((size, 3))
+        targets = np.arange(base, base + size)
+        nodes = np.zeros(size, dtype=np.int64)
+        while len(targets):
+            target_points = points[targets]
+            delta = target_points - self.centers[nodes]
+            distance = np.einsum("ij,ij->i", delta, delta)
+            # Hedefi içeren düğüm hiçbir zaman özetle hesaplanmaz
+            inside = (keys[targets] >> self.shift[nodes]) == self.prefix[nodes]
+            # Çakışık yapraklar dışarıdan her zaman özetle hesaplanır; içerideki
+            # hedefe kuvvet uygulamaz
+            collapsed = self.collapsed[nodes]
+            accept = ~inside & ((distance > self.opening[nodes]) | collapsed)
+            leaf = ~accept & ~collapsed & self.leaf[nodes]
+            opened = ~accept & ~collapsed & ~leaf
+            ranges = self.ranges[nodes[leaf | opened]]
+            is_leaf = leaf[leaf | opened]
+            # Özetle hesaplanan düğümler: pozitif ve negatif tek kutuplar
+            accepted = np.flatnonzero(accept)
+            monopoles = self.monopoles[nodes[accepted]]
+            accepted_points = target_points[accepted]
+            accepted_charges = charges[targets[accepted]]
+            contributions = [
+                _coulomb(
+                    accepted_points - monopoles[:, 1:4],
+                    accepted_charges,
+                    monopoles[:, 0],
+                    self.coulomb,
+                    self.softening,
+                )
+                + _coulomb(
+                    accepted_points - monopoles[:, 5:8],
+                    accepted_charges,
+                    monopoles[:, 4],
+                    self.coulomb,
+                    self.softening,
+                )
+            ]
+            receivers = [targets[accepted]]
+            self.interactions += len(accepted)
+            # Yapraklar doğrudan toplanır
+            pair_targets, sources = _expand(
+                targets[leaf], ranges[is_leaf, 0], ranges[is_leaf, 1]
+            )
+            # Parçacık kendisine kuvvet uygulamaz
+            other = sources != pair_targets
+            pair_targets, sources = pair_targets[other], sources[other]
+            self.direct += len(sources)
+            contributions.append(
+                _coulomb(
+                    points[pair_targets] - points[sources],
+                    charges[pair_targets],
+                    charges[sources],
+                    self.coulomb,
+                    self.softening,
+                )
+            )
+            receivers.append(pair_targets)
+            receivers = np.concatenate(receivers) - base
+            contributions = np.concatenate(contributions)
+            for axis in range(3):
+                forces[:, axis] += np.bincount(
+                    receivers, contributions[:, axis], minlength=size
+                )
+            # Diğer düğümler çocuklarıyla değiştirilir
+            targets, nodes = _expand(
+                targets[opened], ranges[~is_leaf, 2], ranges[~is_leaf, 3]
+            )
+        return forces
+
+    def forces(self, positions=None, charges=None) -> np.ndarray:
+        """
+        Tüm parçacıklara etkiyen Coulomb kuvvetlerini hesaplar.
+
+        :param positions: Konumlar (N x 3); verilirse ağaç yeniden kurulur.
+        :param charges: Yükler (N).
+        :return: Kuvvetler (N x 3); sonlu olmayan konumlar için sıfır.
+        """
+        if positions is not None:
+            self.build(positions, charges)
+        started = time.perf_counter()
+        self.interactions = 0
+        self.direct = 0
+        ordered = np.zeros((len(self.points), 3))
+        for base in range(0, len(self.points), self.chunk):
+            stop = min(base + self.chunk, len(self.points))
+            ordered[base:stop] = self._forces_chunk(base, stop - base)
+        forces = np.zeros((self.size, 3))
+        forces[self.order] = ordered
+        self.force_seconds = time.perf_counter() - started
+        return forces
+
+    def metrics(self) -> dict:
+        """
+        Çözücünün ölçümlerini döndürür.
+        """
+        return {
+            "theta": self.theta,
+            "nodes": self.nodes,
+            "depth": self.depth,
+            "collapsed": int(np.count_nonzero(self.collapsed)),
+            "builds": self.builds,
+            "interactions": self.interactions,
+            "direct": self.direct,
+            "build_seconds": self.build_seconds,
+            "force_seconds": self.force_seconds,
+        }
+
+
+def benchmark(
+    sizes: tuple = (1000, 2000, 4000), theta: float = 0.5, seed: int = None
+) -> list:
+    """
+    Barnes-Hut çözücüsünü doğrudan toplamla süre ve doğruluk yönünden
+    karşılaştırır. Parçacıklar birim küpte rastgele konum ve ±1 yükle
+    oluşturulur.
+
+    :param sizes: Denenecek parçacık sayıları.
+    :param theta: Açılma açısı.
+    :param seed: Rastgele sayı tohumu.
+    :return: Her boyut için süre, hızlanma ve göreli hata ölçümleri.
+    """
+    generator = np.random.default_rng(seed)
+    results = []
+    for size in sizes:
+        positions = generator.uniform(0, 1, (size, 3))
+        charges = generator.choice((-1.0, 1.0), size)
+        solver = BarnesHut(theta=theta, coulomb=1.0)
+        started = time.perf_counter()
+        approximate = solver.forces(positions, charges)
+        tree_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        exact = direct_forces(positions, charges, coulomb=1.0)
+        direct_seconds = time.perf_counter() - started
+        error = np.linalg.norm(approximate - exact, axis=1) / np.linalg.norm(
+            exact, axis=1
+        )
+        results.append(
+            {
+                "size": size,
+                "theta": theta,
+                "barnes_hut_seconds": tree_seconds,
+                "direct_seconds": direct_seconds,
+                "speedup": direct_seconds / tree_seconds,
+                "mean_error": float(np.mean(error)),
+                "max_error": float(np.max(error)),
+                "interactions": solver.interactions,
+                "direct": solver.direct,
+            }
+        )
+    return results
+
+
+# Example Usage
+if __name__ == "__main__":
+    for result in benchmark(sizes=(1000, 4000, 16000), theta=0.5, seed=1):
+        print(
+            "{size:>6} particles  barnes-hut {barnes_hut_seconds:.3f}s  "
+            "direct {direct_seconds:.3f}s  speedup {speedup:.1f}x  "
+            "mean error {mean_error:.2e}".format(**result)
+        )
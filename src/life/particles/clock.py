@@ -0,0 +1,70 @@
+# src/life/particles/clock.py
+
+import threading
+import time
+
+
+class RealClock:
+    """
+    Duvar saatini kullanan saat.
+    """
+
+    def time(self) -> float:
+        """
+        Geçerli zamanı saniye cinsinden döndürür.
+        """
+        return time.time()
+
+
+class VirtualClock:
+    """
+    Yalnızca ilerletildiğinde ilerleyen sanal saat.
+
+    Ayrık olay motoru bir sonraki adımın zamanına atlar; böylece adımlar
+    arasında gerçekten beklenmez ve simülasyon gerçek zamandan hızlı çalışır.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        """
+        :param start: Başlangıç zamanı saniye cinsinden.
+        """
+        self._now = start
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        """
+        Geçerli sanal zamanı saniye cinsinden döndürür.
+        """
+        return self._now
+
+    def advance_to(self, moment: float) -> float:
+        """
+        Saati verilen zamana ilerletir; saat geri alınmaz.
+
+        :param moment: Hedef zaman saniye cinsinden.
+        :return: Geçerli sanal zaman.
+        """
+        with self._lock:
+            if moment > self._now:
+                self._now = moment
+            return self._now
+
+    def advance(self, seconds: float) -> float:
+        """
+        Saati verilen süre kadar ilerletir.
+
+        :param seconds: İlerletilecek süre saniye cinsinden.
+        :return: Geçerli sanal zaman.
+        """
+        return self.advance_to(self._now + seconds)
+
+
+# Varsayılan olarak kullanılan duvar saati
+REAL_CLOCK = RealClock()
+
+
+# Example Usage
+if __name__ == "__main__":
+    clock = VirtualClock()
+    clock.advance(600)
+    print("Virtual time:", clock.time(), "Real time:", REAL_CLOCK.time())
@@ -0,0 +1,141 @@
+# src/life/particles/command_queue.py
+
+import itertools
+import threading
+from collections import deque
+
+# Örneklere gönderilebilen komutlar
+ACTIONS = ("formula",)
+
+
+class CommandQueue:
+    """
+    Örneklere yönelik bekleyen komutları örnek kimliğine göre tutar.
+
+    Her örnek adım başında yalnızca kendi komutlarını alır; komutlar
+    birbirinin üzerine yazılmaz ve gönderim sırasıyla uygulanır. Uygulanan
+    her komut için onay işlevi çağrılır.
+    """
+
+    def __init__(self) -> None:
+        self._pending = {}  # örnek kimliği -> komutlar
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self.event_function = None  # onay işlevi, event_function(ack)
+        # metrics
+        self.submitted = 0
+        self.acknowledged = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(commands) for commands in self._pending.values())
+
+    def trigger_event(self, event_function):
+        """
+        Komut onaylarını alacak işlevi atar.
+
+        :param event_function: Onay sözlüğünü alan işlev.
+        """
+        self.event_function = event_function
+        return self
+
+    def push(self, id: int, action: str, **arguments) -> dict:
+        """
+        Örnek için yeni bir komut ekler.
+
+        :param id: Örnek kimliği.
+        :param action: Komut adı (ör. "formula").
+        :param arguments: Komut bilgileri (ör. formula="5.5 * self.generation").
+        :return: Komut sözlüğü; "command_id" onayları eşleştirmek için kullanılır.
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown command: {action}")
+        command = {
+            "command_id": next(self._sequence),
+            "id": id,
+            "action": action,
+            **arguments,
+        }
+        with self._lock:
+            self._pending.setdefault(id, deque()).append(command)
+            self.submitted += 1
+        return command
+
+    def pending(self, id: int) -> int:
+        """
+        Örneğin bekleyen komut sayısını döndürür.
+        """
+        with self._lock:
+            return len(self._pending.get(id, ()))
+
+    def drain(self, id: int) -> list:
+        """
+        Örneğin bekleyen tüm komutlarını sırasıyla alır.
+
+        :param id: Örnek kimliği.
+        :return: Komutlar; bekleyen komut yoksa boş liste.
+        """
+        # Komutu olmayan örnekler kilit almadan döner
+        if id not in self._pending:
+            return []
+        with self._lock:
+            commands = self._pending.pop(id, None)
+        return list(commands) if commands else []
+
+    def acknowledge(self, command: dict, result=None, error: str = None) -> dict:
+        """
+        Komutun sonucunu onay işlevine bildirir.
+
+        :param command: Uygulanan komut.
+        :param result: Komutun sonucu.
+        :param error: Komut uygulanamadıysa hata mesajı.
+        :return: Onay sözlüğü.
+        """
+        ack = {
+            **command,
+            "status": "failed" if error is not None else "applied",
+            "result": result,
+            "error": error,
+        }
+        self.acknowledged += 1
+        if self.event_function:
+            self.event_function(ack)
+        return ack
+
+    def clear(self, error: str = "Simulation restarted") -> int:
+        """
+        Bekleyen tüm komutları siler ve başarısız olarak onaylar.
+
+        :return: Silinen komut sayısı.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+        dropped = 0
+        for commands in pending.values():
+            for command in commands:
+                self.acknowledge(command, error=error)
+                dropped += 1
+        return dropped
+
+    def metrics(self) -> dict:
+        """
+        Kuyruğun ölçümlerini döndürür.
+        """
+        return {
+            "pending": len(self),
+            "submitted": self.submitted,
+            "acknowledged": self.acknowledged,
+        }
+
+
+# Example Usage
+if __name__ == "__main__":
+    queue = CommandQueue().trigger_event(print)
+    for value in range(3):
+        queue.push(1, "formula", formula=f"{value} + self.generation")
+    queue.push(2, "formula", formula="self.fitness")
+    print("Pending:", queue.metrics())
+    for command in queue.drain(1):
+        queue.acknowledge(command, result=1.0)
+    print("Remaining:", queue.pending(1), queue.pending(2))
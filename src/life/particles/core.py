@@ -1,10 +1,14 @@
 # src/life/particles/core.py
-import random
 import threading
-import time
 import uuid
 
 from src.package import Logger
+from src.life.particles.clock import REAL_CLOCK
+from src.life.particles.formula import evaluate_formula
+from src.life.particles.gate import Gate
+from src.life.particles.opcodes import count_valid_opcodes
+from src.life.particles.population import StoreField, bind_store
+from src.life.particles.random_buffer import RandomBuffer
 
 
 class Core(threading.Thread):
@@ -14,6 +18,17 @@ class Core(threading.Thread):
 
     core_count = 0  # Toplam çekirdek sayısı
     generation_map = {}  # Çekirdek ID'sini generation değeriyle eşleştiren sözlük
+    lineage_map = {}  # Çekirdek ID'sini soy kökünün kimliğiyle eşleştiren sözlük
+
+    # Popülasyon deposuna bağlandığında sütunlarda tutulan durum bilgileri
+    lifetime_seconds = StoreField()
+    elapsed_lifespan = StoreField()
+    fitness = StoreField()
+    generation = StoreField()
+    match_count = StoreField()
+    number_of_copies = StoreField()
+    _paused = StoreField("paused")
+    stopped = StoreField()
 
     def __init__(
         self,
@@ -47,6 +62,11 @@ class Core(threading.Thread):
             Core.generation_map[parent_id] + 1 if parent_id else 1
         )  # Generation değeri
         Core.generation_map[self.id] = self.generation  # Generation değerini eşleştir
+        # Soy kökü; ilk kuşak çekirdekler kendi soylarının köküdür
+        self.lineage_id = (
+            Core.lineage_map.get(parent_id, parent_id) if parent_id else self.id
+        )
+        Core.lineage_map[self.id] = self.lineage_id
         self.match_count = 0  # eşleşme toplamı
         #
         self.replicas = []  # kopyaları tutulacağı alan
@@ -64,8 +84,10 @@ class Core(threading.Thread):
         self.name = name
         # yeni version
         self.version = f"v_{self.parent_id}_{self.generation}_{self.id}"
+        # Zaman ölçümlerinin yapıldığı saat (simülasyon sanal saat atayabilir)
+        self.clock = REAL_CLOCK
         # created information
-        self.life_created_time = time.time()  # Just information
+        self.life_created_time = self.clock.time()  # Just information
         self.life_start_time = None  # Henüz başlamadı
         # cycle information
         self.elapsed_lifespan = 0
@@ -75,22 +97,43 @@ class Core(threading.Thread):
         # self.event_trigger = threading.Event()
         self._paused = False
         self._stop_event = threading.Event()
+        self.stopped = False  # _stop_event'in sütun karşılığı
         self._resumed = False
+        # Duraklatılan örneklerin beklediği kapı (simülasyon tarafından paylaşılır)
+        self._gate = Gate()
+        self._gate_offset = 0.0  # Başlangıçta kapının kapalı kaldığı süre
+        self._paused_at = None  # Örneğin kendisinin duraklatıldığı zaman
+        self._paused_gate_mark = 0.0  # Duraklatma anında kapının kapalı süresi
+        self._paused_seconds = 0.0  # Örneğin duraklatılmış kaldığı toplam süre
         # Log ayarlarını yapılandırma
         self.logger = Logger(name=f"/{self.name}/{self.version}").get_logger()
         # Created durumunu tetikle
         self.trigger_event(self)
 
         self.formula = None  # Kullanıcı tarafından girilecek formül
+        # Test işlemi simülasyon tarafından toplu yapılıyorsa True olur
+        self.batch_scoring = False
+        # Örnekleri ortak thread havuzunda çalıştıran zamanlayıcı
+        self.scheduler = None
+        # Örneğe yönelik komutların alındığı kuyruk (simülasyon tarafından paylaşılır)
+        self.commands = None
+        # Durum bilgilerinin tutulduğu popülasyon deposu
+        self._store = None
+        self._slot = None
+        self._handle = None  # slota bakan StoreHandle
+        # Örneğe ait rastgele sayı tamponu (simülasyon tohumlu tampon atayabilir)
+        self.random = RandomBuffer()
 
     def apply_formula(self, formula: str) -> float:
         """
         Kullanıcının girdiği formülü güvenli bir şekilde değerlendirir ve yaşam süresini günceller.
+        Formül bir kez derlenip önbellekte tutulur; yalnızca aritmetik ve izinli
+        örnek bilgileri kullanılabilir.
         """
         # Güvenli bir şekilde formülü değerlendirme
         try:
-            # Kullanıcı tarafından girilen formülü belirli bir kapsamda değerlendirir
-            evaluated_formula = eval(formula, {"self": self})
+            # Derlenmiş formül yalnızca bu örneğin bilgileriyle değerlendirilir
+            evaluated_formula = evaluate_formula(formula, self)
         except Exception as e:
             print("Hata:", e)
             return
@@ -99,10 +142,38 @@ class Core(threading.Thread):
         self.lifetime_seconds = evaluated_formula
         return evaluated_formula
 
-    def to_json(self):
+    def run_commands(self):
+        """
+        Kuyrukta bu örnek için bekleyen komutları sırasıyla uygular ve onaylar.
+        """
+        if self.commands is None:
+            return
+        for command in self.commands.drain(self.id):
+            try:
+                result = self.run_command(command)
+            except Exception as e:
+                self.commands.acknowledge(command, error=str(e))
+            else:
+                self.commands.acknowledge(command, result=result)
+
+    def run_command(self, command: dict):
+        """
+        Tek bir komutu uygular.
+
+        :param command: CommandQueue komutu.
+        :return: Komutun sonucu.
+        """
+        if command["action"] == "formula":
+            evaluated_formula = evaluate_formula(command["formula"], self)
+            self.lifetime_seconds = evaluated_formula
+            return evaluated_formula
+        raise ValueError(f"Unknown command: {command['action']}")
+
+    def to_json(self, codes: bool = True):
         """
         Nesneyi JSON formatına dönüştürür.
 
+        :param codes: Kodlar eklenir; değişiklik gönderiminde kodlar ayrıca gönderilir.
         :return: JSON formatında nesne.
         """
         lifetime_seconds = (
@@ -110,10 +181,11 @@ class Core(threading.Thread):
             if self.lifetime_seconds == float("inf")
             else self.lifetime_seconds
         )
-        return {
+        data = {
             "name": self.name,
             "id": self.id,
             "parent_id": self.parent_id,
+            "lineage_id": self.lineage_id,
             "lifetime_seconds": lifetime_seconds,
             # created information
             "life_created_time": self.life_created_time,
@@ -123,12 +195,14 @@ class Core(threading.Thread):
             "lifecycle": self.lifecycle,
             # status information
             "life_status": self.status(),
-            "codes": list(self.codes),
             "number_of_copies": self.number_of_copies,
             "generation": self.generation,
             "match_count": self.match_count,
             "fitness": self.fitness,
         }
+        if codes:
+            data["codes"] = list(self.codes)
+        return data
 
     def trigger_event(self, event_function):
         """
@@ -143,10 +217,47 @@ class Core(threading.Thread):
         """
         Her seferinde 1 byte'lık rasgele bir ASCII karakter ekler.
         """
-        self.code = bytes([random.randint(0, 255)])  # Rasgele bir byte oluştur
+        self.code = bytes([self.random.byte()])  # Rasgele bir byte oluştur
         # sys.maxsize
         self.codes.extend(self.code)  # Oluşturulan byte'ı self.code bytearray'ına ekler
 
+    @property
+    def codes(self) -> bytearray:
+        """
+        Çekirdeğin evrimsel kodları.
+        """
+        return self._codes
+
+    @codes.setter
+    def codes(self, value):
+        # Kodlar tamamen değiştirildiğinde test sayaçları baştan hesaplanır
+        self._codes = value
+        self._scored_length = 0
+        self._valid_opcode_count = 0
+        self._byte_sum = 0
+
+    def _update_test_counters(self):
+        """
+        Geçerli opcode sayısını ve byte toplamını yalnızca yeni eklenen
+        byte'lar için günceller.
+        """
+        code_length = len(self._codes)
+        if code_length < self._scored_length:
+            # Kodlar yerinde kısaltıldıysa sayaçları sıfırla
+            self.codes = self._codes
+        if code_length == self._scored_length:
+            return
+
+        scored_length = self._scored_length
+        new_codes = self._codes[scored_length:]
+        self._valid_opcode_count += count_valid_opcodes(new_codes)
+        # Toplama sırası korunur; sonuç sum(byte / 1000 ...) ile birebir aynıdır
+        byte_sum = self._byte_sum
+        for byte in new_codes:
+            byte_sum += byte / 1000
+        self._byte_sum = byte_sum
+        self._scored_length = code_length
+
     def test(self):
         """
         Oluşturulan kodların belirli bir formata uyup uymadığını kontrol eder.
@@ -155,82 +266,28 @@ class Core(threading.Thread):
         if not self.codes:
             return  # Eğer kod yoksa işlem yapma
 
-        # Başlangıçta başarılı test sayısını ve kod uzunluğunu sıfıra ayarlayın
-        successful_tests = 0
-        code_length = len(self.codes)
-
-        # Kodun formata uygunluğunu
-        for byte in self.codes:
-            if 0xB8 <= byte <= 0xBF:
-                # MOV: 0xB8 ile 0xBF arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xE9 <= byte <= 0xEB:
-                # JMP: 0xE9 ile 0xEB arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x00 <= byte <= 0x03:
-                # ADD: 0x00 ile 0x03 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x28 <= byte <= 0x2F:
-                # SUB: 0x28 ile 0x2F arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x90 <= byte <= 0x97:
-                # NOP: 0x90 ile 0x97 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xC3 <= byte <= 0xC5:
-                # RET: 0xC3 ile 0xC5 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xE8 <= byte <= 0xEB:
-                # CALL: 0xE8 ile 0xEB arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xC7 <= byte <= 0xCF:
-                # CMP: 0xC7 ile 0xCF arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xD0 <= byte <= 0xD7:
-                # ROL: 0xD0 ile 0xD7 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xD8 <= byte <= 0xDF:
-                # RCX: 0xD8 ile 0xDF arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x50 <= byte <= 0x57:
-                # PUSH: 0x50 ile 0x57 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x58 <= byte <= 0x5F:
-                # POP: 0x58 ile 0x5F arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x83 <= byte <= 0x87:
-                # ADD: 0x83 ile 0x87 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x81 <= byte <= 0x82:
-                # CMP: 0x81 ile 0x82 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x8B <= byte <= 0x8F:
-                # MOV: 0x8B ile 0x8F arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xE0 <= byte <= 0xE3:
-                # LOOP: 0xE0 ile 0xE3 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xE4 <= byte <= 0xE7:
-                # IN: 0xE4 ile 0xE7 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0xEE <= byte <= 0xEF:
-                # OUT: 0xEE ile 0xEF arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x74 <= byte <= 0x75:
-                # JZ/JNZ: 0x74 ile 0x75 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x72 <= byte <= 0x73:
-                # JC/JNC: 0x72 ile 0x73 arasındaki opcode'lar
-                successful_tests += 1
-            elif 0x7E <= byte <= 0x7F:
-                # JLE/JG: 0x7E ile 0x7F arasındaki opcode'lar
-                successful_tests += 1
+        # Yalnızca son testten sonra eklenen byte'lar sayaçlara işlenir
+        self._update_test_counters()
+        self.apply_score(
+            successful_tests=self._valid_opcode_count,
+            code_length=self._scored_length,
+            byte_sum=self._byte_sum,
+        )
+
+    def apply_score(self, successful_tests: int, code_length: int, byte_sum: float):
+        """
+        Test sonucunu yaşam süresine uygular.
 
+        :param successful_tests: Geçerli opcode sayısı.
+        :param code_length: Kod uzunluğu.
+        :param byte_sum: Kodların byte değerlerinin toplamı (1000'e bölünmüş).
+        """
         # Başarılı testlerin oranını hesapla
         success_ratio = successful_tests / code_length
 
         # Yaşam süresini tek seferde artırma veya azaltma
         if success_ratio >= 0.5:
-            increase_amount = sum(byte / 1000 for byte in self.codes)
+            increase_amount = byte_sum
             self.increase_lifespan(
                 seconds=increase_amount
             )  # Başarılı test durumunda yaşam süresini artır
@@ -244,7 +301,7 @@ class Core(threading.Thread):
                 success_ratio,
             )
         else:
-            decrease_amount = sum(byte / 1000 for byte in self.codes)
+            decrease_amount = byte_sum
             self.decrease_lifespan(
                 seconds=decrease_amount
             )  # Başarısız test durumunda yaşam süresini azalt
@@ -289,34 +346,105 @@ class Core(threading.Thread):
         """
         Parçacığın yaşam döngüsünü işler.
         """
-        self.life_start_time = time.time()
-        while (
+        self.begin()
+        while self.is_living():
+            # eğer paused konumunda ise CPU harcamadan kapıda beklenir
+            if self.is_blocked():
+                self._gate.wait_for(
+                    lambda: not self.is_blocked() or self._stop_event.is_set()
+                )
+                continue
+            # zaman yönetimi için duraklatma önce yapılmalı.
+            # durdurma sinyali gelirse bekleme hemen sona erer
+            if self._stop_event.wait(self.lifecycle):
+                break
+            if not self.is_blocked():
+                self.tick()
+
+        # Yaşam döngüsü sona erdi
+        self.finish()
+
+    def begin(self):
+        """
+        Yaşam döngüsünün başlangıç zamanını ayarlar.
+        """
+        self.life_start_time = self.clock.time()
+        self._gate_offset = self._gate.closed_seconds()
+        if self._paused_at is not None:
+            # Başlamadan önce duraklatılan süre hesaba katılmaz
+            self._paused_at = self.life_start_time
+            self._paused_gate_mark = self._gate_offset
+
+    def is_blocked(self) -> bool:
+        """
+        Örneğin kendisinin veya simülasyonun duraklatılıp duraklatılmadığını döndürür.
+        """
+        return self._paused or not self._gate.is_open()
+
+    def paused_seconds(self) -> float:
+        """
+        Başlangıçtan bu yana duraklatılmış geçen toplam süreyi döndürür.
+        """
+        # Simülasyonun duraklatıldığı süre
+        gate_seconds = self._gate.closed_seconds()
+        seconds = gate_seconds - self._gate_offset + self._paused_seconds
+        paused_at = self._paused_at
+        if paused_at is not None:
+            # Devam eden duraklatmanın kapı ile çakışmayan kısmı
+            seconds += (
+                self.clock.time() - paused_at - (gate_seconds - self._paused_gate_mark)
+            )
+        return seconds
+
+    def lived_seconds(self) -> float:
+        """
+        Duraklatılan süreler hariç geçen yaşam süresini döndürür.
+        """
+        return self.clock.time() - self.life_start_time - self.paused_seconds()
+
+    def is_living(self) -> bool:
+        """
+        Yaşam süresinin dolup dolmadığını ve durdurulup durdurulmadığını kontrol eder.
+        """
+        return (
             # süre sonunda  otomatik durdurmayı tetikler
-            time.time() - self.life_start_time < self.lifetime_seconds
+            self.lived_seconds() < self.lifetime_seconds
             and not self._stop_event.is_set()
-        ):
-            # eğer paused konumunda ise işlem devam ettirilmez
-            if not self._paused:
-                # zaman yönetimi için duraklatma önce yapılmalı.
-                time.sleep(self.lifecycle)
-                # geçen süreyi hesaplar
-                self.elapsed_lifespan = time.time() - self.life_start_time
-                # Çekirdeğin evrimsel kodlarını işletir
-                self.evolve()
-                # Kendini Kodlarını test
-                self.test()
-                # Yaşam süresi ve evrim hızı
-                self.calculate_fitness()
-                # Durum bilgisini güncelle
-                self.update_state()
-                # Bilgilerini sinyal olarak gönderir
-                if self.event_function:
-                    self.event_function(self)
-                # Yeni  kopyalar oluştur
-                # self.replicate()
+        )
 
-        # Yaşam döngüsü sona erdi
+    def tick(self):
+        """
+        Yaşam döngüsünün tek bir adımını işler.
+        """
+        # Adım başında bu örneğe gönderilen komutlar uygulanır
+        self.run_commands()
+        # geçen süreyi hesaplar
+        self.elapsed_lifespan = self.lived_seconds()
+        # Çekirdeğin evrimsel kodlarını işletir
+        self.evolve()
+        # Kendini Kodlarını test
+        if not self.batch_scoring:
+            self.test()
+        # Yaşam süresi ve evrim hızı
+        self.calculate_fitness()
+        # Durum bilgisini güncelle
+        self.update_state()
+        # Bilgilerini sinyal olarak gönderir
+        if self.event_function:
+            self.event_function(self)
+        # Yeni  kopyalar oluştur
+        # self.replicate()
+
+    def finish(self):
+        """
+        Yaşam döngüsünü sonlandırır ve durumu bildirir.
+        """
         self._stop_event.set()  # stopped
+        self.stopped = True
+        if self.commands is not None:
+            # Uygulanamayan komutlar başarısız olarak onaylanır
+            for command in self.commands.drain(self.id):
+                self.commands.acknowledge(command, error="Instance stopped")
         if self.event_function:
             self.event_function(self)
 
@@ -324,6 +452,9 @@ class Core(threading.Thread):
         """
         Örneği duraklatır ve durumu günceller.
         """
+        if not self._paused:
+            self._paused_gate_mark = self._gate.closed_seconds()
+            self._paused_at = self.clock.time()
         self._paused = True
         if self.event_function:
             self.event_function(self)  # Durumu güncelle
@@ -332,21 +463,46 @@ class Core(threading.Thread):
         """
         Duraklatılan örneği devam ettirir ve durumu günceller.
         """
+        if self._paused_at is not None:
+            # Duraklatılan süre yaşam süresinden sayılmaz
+            self._paused_seconds = self.paused_seconds() - (
+                self._gate.closed_seconds() - self._gate_offset
+            )
+            self._paused_at = None
         self._paused = False
+        # Bekleyen thread'i uyandır
+        self._gate.notify()
+        if self.scheduler is not None:
+            # Zamanlayıcıda bekletilen örnek yeniden planlanır
+            self.scheduler.resume(self)
         if self.event_function:
             self.event_function(self)  # Durumu güncelle
         self._resumed = True  # Resumed bayrağını ayarla
 
-    def stop(self):
+    def stop(self, notify: bool = True):
         """
         Örneği durdurur ve durumu günceller.
+
+        :param notify: Kapıda bekleyen thread uyandırılır. Toplu durdurmada
+            kapı tüm örnekler için bir kez uyandırılır.
         """
         self._stop_event.set()
+        self.stopped = True
+        # Kapıda bekleyen thread'i uyandır
+        if notify:
+            self._gate.notify()
+        if self.scheduler is not None:
+            # Zamanlayıcıda bekletilen örnek sonlandırılmak üzere planlanır
+            self.scheduler.resume(self)
         if self.event_function:
             self.event_function(self)  # Durumu güncelle
 
     def start(self):
-        super().start()
+        # Zamanlayıcı atanmışsa örnek kendi thread'i yerine zamanlayıcıda çalışır
+        if self.scheduler is not None:
+            self.scheduler.submit(self)
+        else:
+            super().start()
         return self
 
     def status(self):
@@ -360,7 +516,7 @@ class Core(threading.Thread):
         else:
             if self._stop_event.is_set():
                 state = "Stopped"
-            elif self._paused:
+            elif self.is_blocked():
                 state = "Paused"
             elif self._resumed:
                 self._resumed = False
@@ -416,6 +572,8 @@ class Core(threading.Thread):
             max_generation=self.max_generation,
             max_replicas=self.max_replicas,
         ).trigger_event(self.event_function)
+        # Çalışma zamanı ayarlarını kopyaya aktar
+        self._inherit_runtime(new_item)
         # Yeni nesnenin kodlarını kopyala
         new_item.codes = self.codes[:]
         # Yeni programcığın nesnesini başlat
@@ -438,6 +596,33 @@ class Core(threading.Thread):
 
         return self
 
+    def bind_store(self, store):
+        """
+        Örneğin durum bilgilerini popülasyon deposunun sütunlarına taşır.
+        Durum öznitelikleri bundan sonra slotun StoreHandle tutamacı üzerinden
+        okunur ve yazılır.
+
+        :param store: PopulationStore örneği.
+        :return: Ayrılan slot numarası.
+        """
+        return bind_store(self, store)
+
+    def _inherit_runtime(self, new_item):
+        """
+        Simülasyon tarafından atanan çalışma zamanı ayarlarını kopyaya aktarır.
+
+        :param new_item: Yeni oluşturulan kopya.
+        """
+        new_item.batch_scoring = self.batch_scoring
+        new_item.scheduler = self.scheduler
+        new_item.commands = self.commands
+        new_item._gate = self._gate
+        new_item.clock = self.clock
+        # Kopyanın üreteci üst örneğin üretecinden kopya sırasına göre türetilir
+        new_item.random = self.random.spawn(self.number_of_copies)
+        if self._store is not None:
+            new_item.bind_store(self._store)
+
     def decrease_lifespan(self, seconds):
         """
         Yaşam süresini azalt
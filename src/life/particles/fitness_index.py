@@ -0,0 +1,159 @@
+# src/life/particles/fitness_index.py
+
+import heapq
+import itertools
+import threading
+
+
+class FitnessIndex:
+    """
+    Örnekleri fitness değerine göre sıralı tutan artımlı dizin.
+
+    Fitness değeri değiştiğinde yığına yeni bir kayıt eklenir; eski kayıtlar
+    sürüm numarasıyla tanınır ve okunurken atlanır (tembel silme). En iyi k
+    örnek O(k log n) sürede alınır; okuma yalnızca gereken kayıtları yığından
+    alıp geri ekler. Eşit fitness değerlerinde dizine ilk eklenen örnek önce
+    gelir.
+    """
+
+    def __init__(self) -> None:
+        self._heap = []  # (-fitness, sıra, sürüm, kimlik)
+        self._entries = {}  # kimlik -> (fitness, sıra, sürüm)
+        self._members = {}  # kimlik -> örnek
+        self._order = itertools.count()
+        self._version = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._entries
+
+    def get(self, id: int):
+        """
+        Kimliği verilen örneği döndürür; dizinde yoksa None.
+        """
+        return self._members.get(id)
+
+    def fitness(self, id: int) -> float:
+        """
+        Örneğin dizindeki fitness değerini döndürür.
+        """
+        return self._entries[id][0]
+
+    def update(self, instance, fitness: float):
+        """
+        Örneği ekler veya fitness değerini günceller.
+
+        :param instance: Core veya Particle örneği.
+        :param fitness: Güncel fitness değeri.
+        """
+        with self._lock:
+            entry = self._entries.get(instance.id)
+            if entry is not None and entry[0] == fitness:
+                return
+            order = entry[1] if entry is not None else next(self._order)
+            version = next(self._version)
+            self._entries[instance.id] = (fitness, order, version)
+            self._members[instance.id] = instance
+            heapq.heappush(self._heap, (-fitness, order, version, instance.id))
+            self._compact()
+
+    def remove(self, id: int):
+        """
+        Örneği dizinden çıkarır; yığındaki kayıtları okunurken atlanır.
+        """
+        with self._lock:
+            self._entries.pop(id, None)
+            self._members.pop(id, None)
+            self._compact()
+
+    def _compact(self):
+        # Eski kayıtlar geçerli kayıtların iki katını aşarsa yığın yeniden kurulur
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (-fitness, order, version, id)
+                for id, (fitness, order, version) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def _is_current(self, item) -> bool:
+        entry = self._entries.get(item[3])
+        return entry is not None and entry[2] == item[2]
+
+    def _scan(self, visit):
+        # Geçerli kayıtlar fitness sırasıyla visit işlevine verilir; visit False
+        # döndürünce durulur. Okunan geçerli kayıtlar yığına geri eklenir, eski
+        # kayıtlar kalıcı olarak atılır.
+        with self._lock:
+            heap = self._heap
+            taken = []
+            try:
+                while heap:
+                    item = heapq.heappop(heap)
+                    if not self._is_current(item):
+                        continue
+                    taken.append(item)
+                    if visit(self._members[item[3]]) is False:
+                        break
+            finally:
+                for item in taken:
+                    heapq.heappush(heap, item)
+
+    def top(self, k: int) -> list:
+        """
+        Fitness değeri en yüksek k örneği O(k log n) sürede döndürür.
+        """
+        result = []
+        if k > 0:
+            self._scan(lambda instance: result.append(instance) or len(result) < k)
+        return result
+
+    def pairs(self, can_pair=None, limit: int = None) -> list:
+        """
+        Fitness sırasına göre ardışık örnekleri ikişer ikişer eşleştirir.
+        Örnekler yığından gerektikçe alınır; k çift O(k log n) sürede oluşur.
+
+        :param can_pair: Örneğin eşleşebilir olup olmadığını döndüren işlev;
+            örneklerden biri eşleşemiyorsa çift bütünüyle atlanır.
+        :param limit: Okunan en fazla çift sayısı (varsayılan olarak tümü).
+        :return: (female, male) çiftleri.
+        """
+        pairs = []
+        waiting = []
+        read = 0
+        if limit is not None and limit <= 0:
+            return pairs
+
+        def visit(instance):
+            nonlocal read
+            # Her örneğin dizinde tek geçerli kaydı vardır
+            if not waiting:
+                waiting.append(instance)
+                return True
+            female = waiting.pop()
+            read += 1
+            if can_pair is None or (can_pair(female) and can_pair(instance)):
+                pairs.append((female, instance))
+            return limit is None or read < limit
+
+        self._scan(visit)
+        return pairs
+
+
+# Example Usage
+if __name__ == "__main__":
+
+    class Instance:
+        def __init__(self, id):
+            self.id = id
+
+    index = FitnessIndex()
+    instances = [Instance(id) for id in range(6)]
+    for instance in instances:
+        index.update(instance, instance.id * 1.5)
+    index.update(instances[0], 100.0)
+    index.remove(5)
+    print("Top:", [instance.id for instance in index.top(3)])
+    print("Pairs:", [(a.id, b.id) for a, b in index.pairs()])
@@ -0,0 +1,268 @@
+# src/life/particles/formula.py
+
+import ast
+import math
+from functools import lru_cache, reduce
+
+import numpy as np
+
+# Formüllerde okunabilen örnek bilgileri
+ATTRIBUTES = frozenset(
+    (
+        "id",
+        "parent_id",
+        "lineage_id",
+        "lifetime_seconds",
+        "elapsed_lifespan",
+        "lifecycle",
+        "fitness",
+        "generation",
+        "match_count",
+        "number_of_copies",
+        "max_replicas",
+        "max_generation",
+        # Particle
+        "charge",
+        "mass",
+        "spin",
+        "energy",
+        "position",
+        "velocity",
+        "momentum",
+        "wave_function",
+    )
+)
+# Vektör bilgilerinin okunabilen bileşenleri (ör. self.position.x)
+VECTOR_ATTRIBUTES = frozenset(("position", "velocity", "momentum", "wave_function"))
+COMPONENTS = frozenset(("x", "y", "z"))
+
+# Formüllerde çağrılabilen işlevler
+FUNCTIONS = {
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "round": round,
+    "sqrt": math.sqrt,
+    "exp": math.exp,
+    "log": math.log,
+    "sin": math.sin,
+    "cos": math.cos,
+}
+CONSTANTS = {"pi": math.pi, "e": math.e, "inf": math.inf}
+
+# Üs alma ondalık sayılarla yapılır: tamsayı üsleri (ör. 9**9**9**9) sınırsız
+# büyüyen sayılar oluşturup thread'i kilitleyemez, taşma hata olarak döner
+POWER = "_power"
+
+# Sütunlar üzerinde değerlendirmede işlevlerin NumPy karşılıkları
+COLUMN_FUNCTIONS = {
+    "abs": np.abs,
+    "min": lambda *values: reduce(np.minimum, values),
+    "max": lambda *values: reduce(np.maximum, values),
+    "round": np.round,
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "log": np.log,
+    "sin": np.sin,
+    "cos": np.cos,
+}
+
+OPERATORS = (
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+# Formülü değerlendiren ortam; yerleşik işlevlere erişim yoktur
+GLOBALS = {"__builtins__": {}, **FUNCTIONS, **CONSTANTS, POWER: math.pow}
+COLUMN_GLOBALS = {
+    "__builtins__": {},
+    **COLUMN_FUNCTIONS,
+    **CONSTANTS,
+    POWER: lambda base, exponent: np.power(np.asarray(base, np.float64), exponent),
+}
+
+# Derlenmiş formüllerin önbellekte tutulacak en fazla sayısı
+CACHE_SIZE = 256
+
+
+class FormulaError(ValueError):
+    """
+    Formül izin verilen ifadelerin dışına çıktığında oluşturulur.
+    """
+
+
+def _check(node: ast.AST):
+    # Yalnızca aritmetik, sayılar, izinli işlevler ve self bilgileri kabul edilir
+    if isinstance(node, ast.Expression):
+        return _check(node.body)
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise FormulaError(f"Unsupported constant: {node.value!r}")
+        return
+    if isinstance(node, ast.BinOp):
+        if not isinstance(node.op, OPERATORS):
+            raise FormulaError(f"Unsupported operator: {type(node.op).__name__}")
+        _check(node.left)
+        _check(node.right)
+        return
+    if isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, OPERATORS):
+            raise FormulaError(f"Unsupported operator: {type(node.op).__name__}")
+        _check(node.operand)
+        return
+    if isinstance(node, ast.Name):
+        if node.id not in CONSTANTS:
+            raise FormulaError(f"Unknown name: {node.id}")
+        return
+    if isinstance(node, ast.Attribute):
+        value = node.value
+        if isinstance(value, ast.Name) and value.id == "self":
+            if node.attr not in ATTRIBUTES or node.attr in VECTOR_ATTRIBUTES:
+                raise FormulaError(f"Unknown attribute: {node.attr}")
+            return
+        if (
+            isinstance(value, ast.Attribute)
+            and isinstance(value.value, ast.Name)
+            and value.value.id == "self"
+            and value.attr in VECTOR_ATTRIBUTES
+            and node.attr in COMPONENTS
+        ):
+            return
+        raise FormulaError(f"Unknown attribute: {node.attr}")
+    if isinstance(node, ast.Call):
+        if (
+            not isinstance(node.func, ast.Name)
+            or node.func.id not in FUNCTIONS
+            or node.keywords
+        ):
+            raise FormulaError("Unsupported function call.")
+        for argument in node.args:
+            _check(argument)
+        return
+    raise FormulaError(f"Unsupported expression: {type(node).__name__}")
+
+
+class _Power(ast.NodeTransformer):
+    # a ** b ifadelerini ondalık üs alma çağrısına çevirir
+    def visit_BinOp(self, node: ast.BinOp):
+        self.generic_visit(node)
+        if not isinstance(node.op, ast.Pow):
+            return node
+        call = ast.Call(
+            func=ast.Name(id=POWER, ctx=ast.Load()),
+            args=[node.left, node.right],
+            keywords=[],
+        )
+        return ast.copy_location(call, node)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_formula(formula: str):
+    """
+    Formülü bir kez ayrıştırıp denetler ve derlenmiş kod nesnesini döndürür.
+    Aynı formül metni için önbellekteki kod nesnesi kullanılır.
+
+    :param formula: Kullanıcı formülü (ör. "5.5 * self.generation").
+    :return: Derlenmiş kod nesnesi.
+    :raises FormulaError: Formül geçersizse veya izin verilmeyen ifade içeriyorsa.
+    """
+    try:
+        tree = ast.parse(formula, mode="eval")
+    except SyntaxError as e:
+        raise FormulaError(f"Invalid formula: {e.msg}") from e
+    _check(tree)
+    # Denetimden sonra çevrilir; formüller _power adını doğrudan kullanamaz
+    tree = ast.fix_missing_locations(_Power().visit(tree))
+    return compile(tree, "<formula>", "eval")
+
+
+def evaluate_formula(formula: str, instance) -> float:
+    """
+    Formülü örnek üzerinde değerlendirir.
+
+    :param formula: Kullanıcı formülü.
+    :param instance: Core veya Particle örneği.
+    :return: Hesaplanan değer.
+    """
+    return eval(compile_formula(formula), GLOBALS, {"self": instance})
+
+
+class _Columns:
+    # self.<ad> erişimlerini sütunlara yönlendirir; sütunlar ilk erişimde alınır
+    def __init__(self, column) -> None:
+        self._column = column
+
+    def __getattr__(self, name: str):
+        values = self._column(name)
+        if name in VECTOR_ATTRIBUTES:
+            return _Vector(values)
+        return values
+
+
+class _Vector:
+    # N x 3 vektör sütununun bileşenleri
+    def __init__(self, values: np.ndarray) -> None:
+        self.x = values[:, 0]
+        self.y = values[:, 1]
+        self.z = values[:, 2]
+
+
+def attribute_columns(instances: list):
+    """
+    Örneklerin bilgilerini sütun olarak döndüren işlevi oluşturur
+    (evaluate_columns için; popülasyon deposu kullanılmadığında).
+
+    :param instances: Core veya Particle örnekleri.
+    """
+
+    def column(name: str) -> np.ndarray:
+        values = [getattr(instance, name) for instance in instances]
+        if name in VECTOR_ATTRIBUTES:
+            values = [(value.x, value.y, value.z) for value in values]
+            return np.array(values, dtype=np.float64).reshape(-1, 3)
+        return np.array(values, dtype=np.float64)
+
+    return column
+
+
+def evaluate_columns(formula: str, column, size: int) -> np.ndarray:
+    """
+    Formülü tüm popülasyon için bir kez, sütunlar üzerinde dizi işlemi olarak
+    değerlendirir.
+
+    :param formula: Kullanıcı formülü.
+    :param column: Bilgi adını alıp N uzunluğunda (vektörler için N x 3) dizi
+        döndüren işlev.
+    :param size: Örnek sayısı (N).
+    :return: Her örnek için hesaplanan değerler (N uzunluğunda float dizi).
+    """
+    with np.errstate(all="ignore"):
+        values = eval(
+            compile_formula(formula), COLUMN_GLOBALS, {"self": _Columns(column)}
+        )
+    return np.broadcast_to(np.asarray(values, dtype=np.float64), (size,)).copy()
+
+
+# Example Usage
+if __name__ == "__main__":
+    from src.life.particles.core import Core
+
+    core = Core(name="core", lifetime_seconds=10, lifecycle=1)
+    print("Value:", evaluate_formula("5.5 * self.generation + sqrt(4)", core))
+    try:
+        compile_formula("__import__('os').system('ls')")
+    except FormulaError as e:
+        print("Rejected:", e)
+    print("Cache:", compile_formula.cache_info())
+    generations = np.array([1, 2, 3])
+    print(
+        "Columns:",
+        evaluate_columns("5.5 * self.generation", lambda name: generations, 3),
+    )
@@ -0,0 +1,78 @@
+# src/life/particles/gate.py
+
+import threading
+
+from src.life.particles.clock import REAL_CLOCK
+
+
+class Gate:
+    """
+    Örneklerin duraklatıldığında CPU harcamadan beklediği ortak kapı.
+
+    Kapı kapandığında bekleyen thread'ler bir koşul değişkeni üzerinde uyur;
+    kapı açıldığında tek seferde uyandırılır. Kapının kapalı kaldığı toplam
+    süre, duraklatılan zamanın yaşam süresinden düşülebilmesi için tutulur.
+    """
+
+    def __init__(self, clock=None) -> None:
+        """
+        :param clock: Kapalı kalma süresinin ölçüldüğü saat (varsayılan duvar saati).
+        """
+        self._clock = REAL_CLOCK if clock is None else clock
+        self._condition = threading.Condition()
+        self._opened = True
+        self._closed_at = None  # Kapının son kapandığı zaman
+        self._closed_seconds = 0.0  # Kapının kapalı kaldığı toplam süre
+
+    def is_open(self) -> bool:
+        """
+        Kapının açık olup olmadığını döndürür.
+        """
+        return self._opened
+
+    def open(self):
+        """
+        Kapıyı açar ve bekleyen tüm thread'leri uyandırır.
+        """
+        with self._condition:
+            if not self._opened:
+                self._closed_seconds += self._clock.time() - self._closed_at
+                self._closed_at = None
+                self._opened = True
+            self._condition.notify_all()
+
+    def close(self):
+        """
+        Kapıyı kapatır.
+        """
+        with self._condition:
+            if self._opened:
+                self._opened = False
+                self._closed_at = self._clock.time()
+
+    def closed_seconds(self) -> float:
+        """
+        Kapının kapalı kaldığı toplam süreyi (devam eden kapanış dahil) döndürür.
+        """
+        with self._condition:
+            if self._opened:
+                return self._closed_seconds
+            return self._closed_seconds + self._clock.time() - self._closed_at
+
+    def notify(self):
+        """
+        Bekleyen thread'leri koşullarını yeniden kontrol etmeleri için uyandırır.
+        """
+        with self._condition:
+            self._condition.notify_all()
+
+    def wait_for(self, predicate, timeout: float = None) -> bool:
+        """
+        Koşul sağlanana kadar CPU harcamadan bekler.
+
+        :param predicate: Beklemenin bitmesi için sağlanması gereken koşul.
+        :param timeout: En fazla bekleme süresi.
+        :return: Koşulun son değeri.
+        """
+        with self._condition:
+            return self._condition.wait_for(predicate, timeout)
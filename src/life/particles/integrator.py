@@ -0,0 +1,477 @@
+# src/life/particles/integrator.py
+
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class Integrator(ABC):
+    """
+    Konum ve hızı bir zaman adımı ilerleten yöntemlerin ortak arayüzü.
+
+    Yöntemler NumPy dizileri üzerinde çalışır; tek parçacık için 3, popülasyon
+    için N x 3 boyutlu diziler verilebilir. İvme, konumu alıp ivmeyi döndüren
+    bir işlevdir. Adım başına ivme hesaplama sayısı ve süresi ölçülür.
+    """
+
+    name = None
+    order = 1  # yöntemin doğruluk mertebesi
+    # adım başına (uyarlamalı yöntemde son adımdaki) ivme hesaplama sayısı
+    evaluations = 1
+
+    def __init__(self) -> None:
+        # metrics
+        self.steps = 0
+        self.evaluated = 0  # toplam ivme hesaplama sayısı
+        self.seconds = 0.0
+
+    @abstractmethod
+    def advance(self, position, velocity, acceleration, time_step) -> tuple:
+        """
+        Konum ve hızı bir adım ilerletir.
+
+        :param position: Konumlar.
+        :param velocity: Hızlar.
+        :param acceleration: İvme işlevi, acceleration(position).
+        :param time_step: Zaman adımı (skaler veya N x 1 dizi).
+        :return: (yeni konumlar, yeni hızlar)
+        """
+
+    def step(self, position, velocity, acceleration, time_step) -> tuple:
+        """
+        Adımı ilerletir ve maliyetini ölçer.
+        """
+        started = time.perf_counter()
+        result = self.advance(position, velocity, acceleration, time_step)
+        self.seconds += time.perf_counter() - started
+        self.steps += 1
+        self.evaluated += self.evaluations
+        return result
+
+    def clone(self) -> "Integrator":
+        """
+        Aynı ayarlarla ölçümleri sıfırlanmış yeni bir yöntem döndürür.
+        """
+        return type(self)()
+
+    def metrics(self) -> dict:
+        """
+        Yöntemin ölçümlerini döndürür.
+        """
+        return {
+            "integrator": self.name,
+            "steps": self.steps,
+            "evaluations": self.evaluated,
+            "cost_per_step": self.evaluated / self.steps if self.steps else 0.0,
+            "seconds_per_step": self.seconds / self.steps if self.steps else 0.0,
+        }
+
+
+class ExplicitEuler(Integrator):
+    """
+    Açık Euler: x = x0 + v0 * t, v = v0 + a(x0) * t
+    """
+
+    name = "euler"
+
+    def advance(self, position, velocity, acceleration, time_step) -> tuple:
+        return (
+            position + velocity * time_step,
+            velocity + acceleration(position) * time_step,
+        )
+
+
+class SemiImplicitEuler(Integrator):
+    """
+    Yarı örtük Euler: v = v0 + a(x0) * t, x = x0 + v * t
+    (Particle.update'in varsayılan yöntemi).
+    """
+
+    name = "semi_implicit_euler"
+
+    def advance(self, position, velocity, acceleration, time_step) -> tuple:
+        velocity = velocity + acceleration(position) * time_step
+        return position + velocity * time_step, velocity
+
+
+class VelocityVerlet(Integrator):
+    """
+    Hız Verlet: x = x0 + v0 * t + a0 * t² / 2, v = v0 + (a0 + a1) * t / 2
+    """
+
+    name = "verlet"
+    order = 2
+    evaluations = 2
+
+    def advance(self, position, velocity, acceleration, time_step) -> tuple:
+        start = acceleration(position)
+        position = position + (velocity + 0.5 * start * time_step) * time_step
+        end = acceleration(position)
+        return position, velocity + 0.5 * (start + end) * time_step
+
+
+class AdaptiveIntegrator(Integrator):
+    """
+    Adım ikileme (step doubling) ile uyarlamalı zaman adımı.
+
+    İstenen zaman aralığı alt adımlarla ilerletilir. Her alt adım bir kez tam,
+    bir kez iki yarım adımla hesaplanır; farkları hata tahminidir. Hata
+    toleransı aşarsa alt adım küçültülür ve tekrar denenir, altında kalırsa
+    sonraki alt adım büyütülür. Alt adım aralığın oranı olarak tutulur; böylece
+    parçacık başına farklı zaman adımları tek dizide ilerletilebilir.
+    """
+
+    name = "adaptive"
+
+    def __init__(
+        self,
+        method: Integrator = None,
+        tolerance: float = 1e-6,
+        min_fraction: float = 1e-6,
+        max_substeps: int = 1000,
+    ) -> None:
+        """
+        :param method: Alt adımlarda kullanılan yöntem (varsayılan olarak hız Verlet).
+        :param tolerance: Alt adım başına kabul edilen en büyük hata; değerin
+            büyüklüğüne göre ölçeklenir (|x| > 1 için göreli, aksi halde mutlak).
+        :param min_fraction: Aralığın oranı olarak en küçük alt adım.
+        :param max_substeps: Aralık başına en fazla alt adım denemesi.
+        """
+        super().__init__()
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be a positive value.")
+        self.method = method or VelocityVerlet()
+        self.tolerance = tolerance
+        self.min_fraction = min_fraction
+        self.max_substeps = max_substeps
+        self.order = self.method.order
+        self.fraction = 1.0  # son kabul edilen alt adım oranı
+        # metrics
+        self.substeps = 0
+        self.rejected = 0
+
+    def clone(self) -> "AdaptiveIntegrator":
+        return type(self)(
+            method=self.method.clone(),
+            tolerance=self.tolerance,
+            min_fraction=self.min_fraction,
+            max_substeps=self.max_substeps,
+        )
+
+    def _error(self, coarse: tuple, fine: tuple) -> float:
+        error = 0.0
+        for a, b in zip(coarse, fine):
+            with np.errstate(all="ignore"):
+                scale = np.maximum(1.0, np.abs(b))
+                difference = np.max(np.abs(a - b) / scale)
+            error = max(error, float(difference))
+        return error
+
+    def _scale(self, error: float, shrink: float = 0.1) -> float:
+        # Bir sonraki alt adım için büyütme/küçültme katsayısı
+        if error == 0 or not np.isfinite(error):
+            return 2.0 if error == 0 else shrink
+        factor = 0.9 * (self.tolerance / error) ** (1 / (self.order + 1))
+        return min(2.0, max(shrink, factor))
+
+    def advance(self, position, velocity, acceleration, time_step) -> tuple:
+        method = self.method
+        evaluations = 0
+        done = 0.0  # aralığın ilerletilen oranı
+        proposed = self.fraction
+        for _ in range(self.max_substeps):
+            remaining = 1.0 - done
+            if remaining <= 1e-12:
+                break
+            fraction = min(proposed, remaining)
+            h = time_step * fraction
+            coarse = method.advance(position, velocity, acceleration, h)
+            half = method.advance(position, velocity, acceleration, h / 2)
+            fine = method.advance(*half, acceleration, h / 2)
+            evaluations += 3 * method.evaluations
+            error = self._error(coarse, fine)
+            if error > self.tolerance and fraction > self.min_fraction:
+                # hata büyükse alt adım küçültülüp tekrar denenir
+                self.rejected += 1
+                proposed = max(self.min_fraction, fraction * self._scale(error))
+                continue
+            position, velocity = fine
+            done += fraction
+            self.substeps += 1
+            # Aralığın sonuna göre kısaltılan adım önerilen adımı küçültmez
+            if fraction == proposed:
+                proposed = min(1.0, fraction * self._scale(error))
+        else:
+            # Deneme sınırına ulaşılırsa kalan aralık tek adımda tamamlanır
+            if 1.0 - done > 1e-12:
+                h = time_step * (1.0 - done)
+                position, velocity = method.advance(position, velocity, acceleration, h)
+                evaluations += method.evaluations
+        self.fraction = proposed
+        # Bu adımdaki ivme hesaplama sayısı step tarafından toplanır
+        self.evaluations = evaluations
+        return position, velocity
+
+    def metrics(self) -> dict:
+        metrics = super().metrics()
+        metrics["method"] = self.method.name
+        metrics["tolerance"] = self.tolerance
+        metrics["substeps"] = self.substeps
+        metrics["rejected"] = self.rejected
+        return metrics
+
+
+# Seçilebilir yöntemler
+INTEGRATORS = {
+    ExplicitEuler.name: ExplicitEuler,
+    SemiImplicitEuler.name: SemiImplicitEuler,
+    VelocityVerlet.name: VelocityVerlet,
+}
+
+
+def create_integrator(name: str = None, tolerance: float = None) -> Integrator:
+    """
+    Adı verilen yöntemi oluşturur.
+
+    :param name: euler, semi_implicit_euler veya verlet; None ise yöntem
+        oluşturulmaz (tolerans da verilmediyse).
+    :param tolerance: Verilirse yöntem uyarlamalı adımla sarılır.
+    :return: Integrator örneği veya None.
+    """
+    if name is None and tolerance is None:
+        return None
+    if name is not None and name not in INTEGRATORS:
+        raise ValueError(f"Unknown integrator: {name}")
+    method = INTEGRATORS[name]() if name is not None else None
+    if tolerance is not None:
+        return AdaptiveIntegrator(method=method, tolerance=tolerance)
+    return method
+
+
+class ParticleIntegrator:
+    """
+    Tüm parçacıkların kinematiğini popülasyon deposunun N x 3 sütunlarında
+    tek bir vektörel adımda ilerletir.
+
+    Particle.update işleminin dizi karşılığıdır: rastgele kuvvet, F / m ivmesi,
+    hız, momentum, konum ve Schrödinger dalga terimi parçacık başına Python
+    döngüsü olmadan hesaplanır. Parçacıkların Vector değerleri sütunlardan
+    yalnızca okunduklarında (ör. to_json) oluşturulur. Yöntem verilmezse
+    yarı örtük Euler ara dizi oluşturmadan yerinde uygulanır. Konuma bağlı
+    kuvvet (field) verilirse yöntemin her ivme hesaplamasında ara konumlarda
+    yeniden hesaplanır.
+    """
+
+    def __init__(
+        self,
+        random=None,
+        force_range: tuple = (-1, 1),
+        time_step_range: tuple = (0.0001, 0.001),
+        method: Integrator = None,
+        time_step: float = None,
+        field=None,
+    ) -> None:
+        """
+        :param random: RandomBuffer; kuvvetler ve zaman adımları üretecinden çekilir.
+        :param force_range: Rastgele kuvvet bileşenlerinin aralığı.
+        :param time_step_range: Rastgele zaman adımlarının aralığı.
+        :param method: Konum ve hızı ilerleten yöntem (ör. VelocityVerlet).
+        :param time_step: Sabit zaman adımı; verilmezse adımlar rastgele seçilir.
+        :param field: Konuma bağlı kuvvet işlevi, field(konumlar N x 3) -> N x 3.
+        """
+        self.generator = (
+            random.generator if random is not None else np.random.default_rng()
+        )
+        self.force_range = force_range
+        self.time_step_range = time_step_range
+        self.method = method
+        self.time_step = time_step
+        self.field = field
+        # metrics
+        self.steps = 0
+        self.integrated = 0  # toplam ilerletilen parçacık adımı
+
+    def forces(self, size: int) -> np.ndarray:
+        """
+        Parçacık başına rastgele kuvvet vektörlerini (N x 3) üretir.
+        """
+        low, high = self.force_range
+        return self.generator.uniform(low, high, (size, 3))
+
+    def time_steps(self, size: int) -> np.ndarray:
+        """
+        Parçacık başına rastgele zaman adımlarını üretir.
+        """
+        if self.time_step is not None:
+            return np.full(size, self.time_step, dtype=np.float64)
+        low, high = self.time_step_range
+        return self.generator.uniform(low, high, size)
+
+    def advance(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        momentum: np.ndarray,
+        wave_function: np.ndarray,
+        mass: np.ndarray,
+        forces: np.ndarray,
+        time_steps: np.ndarray,
+        field=None,
+    ):
+        """
+        Dizileri yerinde bir adım ilerletir (Particle.update ile aynı sırada).
+
+        :param position: Konumlar (N x 3).
+        :param velocity: Hızlar (N x 3).
+        :param momentum: Momentumlar (N x 3); sonuç bu diziye yazılır.
+        :param wave_function: Dalga fonksiyonları (N x 3).
+        :param mass: Kütleler (N).
+        :param forces: Kuvvetler (N x 3); ara sonuç olarak üzerine yazılır.
+        :param time_steps: Zaman adımları (N).
+        :param field: Konuma bağlı kuvvet işlevi (varsayılan olarak self.field).
+        """
+        time_steps = time_steps[:, None]
+        mass = mass[:, None]
+        field = self.field if field is None else field
+        if self.method is not None:
+            self._advance_method(
+                position,
+                velocity,
+                momentum,
+                wave_function,
+                mass,
+                forces,
+                time_steps,
+                field,
+            )
+            return
+        if field is not None:
+            # Yöntem yoksa konuma bağlı kuvvet adım başındaki konumda hesaplanır
+            forces += field(position)
+        scratch = np.empty_like(position)
+        # Skaler Vector işlemleri gibi taşmalar inf olarak kalır
+        with np.errstate(all="ignore"):
+            # ψ = ψ0 + (x * v) * t
+            np.multiply(position, velocity, out=scratch)
+            scratch *= time_steps
+            wave_function += scratch
+            # v = v0 + (F / m) * t
+            forces *= time_steps / mass
+            velocity += forces
+            # p = m * v
+            np.multiply(velocity, mass, out=momentum)
+            # x = x0 + v * t
+            np.multiply(velocity, time_steps, out=scratch)
+            position += scratch
+
+    def _advance_method(
+        self,
+        position,
+        velocity,
+        momentum,
+        wave_function,
+        mass,
+        forces,
+        time_steps,
+        field,
+    ):
+        if field is None:
+            # Kuvvet adım boyunca sabittir: a = F / m
+            constant = forces / mass
+
+            def acceleration(position):
+                return constant
+
+        else:
+            # a = (F + field(x)) / m; ara konumlarda yeniden hesaplanır
+            def acceleration(position):
+                return (forces + field(position)) / mass
+
+        with np.errstate(all="ignore"):
+            # ψ = ψ0 + (x * v) * t
+            wave_function += time_steps * position * velocity
+            position[...], velocity[...] = self.method.step(
+                position, velocity, acceleration, time_steps
+            )
+            # p = m * v
+            np.multiply(velocity, mass, out=momentum)
+
+    def step(self, store, slots=None, forces=None, time_steps=None, field=None) -> int:
+        """
+        Depodaki parçacıkları bir adım ilerletir ve sonuçları sütunlara yazar.
+
+        :param store: Parçacık sütunlarını içeren PopulationStore.
+        :param slots: İlerletilecek slotlar (varsayılan olarak çalışan slotlar).
+        :param forces: Kuvvetler (N x 3); verilmezse rastgele üretilir.
+        :param time_steps: Zaman adımları (N); verilmezse rastgele üretilir.
+        :param field: Slotların konumlarından kuvvetleri hesaplayan işlev
+            (varsayılan olarak self.field).
+        :return: İlerletilen parçacık sayısı.
+        """
+        slots = store.live_slots() if slots is None else np.asarray(slots, dtype=int)
+        size = len(slots)
+        if size == 0:
+            return 0
+        if forces is None:
+            forces = self.forces(size)
+        else:
+            forces = np.array(forces, dtype=np.float64).reshape(size, 3)
+        if time_steps is None:
+            time_steps = self.time_steps(size)
+        time_steps = np.broadcast_to(np.asarray(time_steps, dtype=np.float64), size)
+        columns = store.columns
+        names = ("position", "velocity", "momentum", "wave_function")
+        if size == 1 or np.all(np.diff(slots) == 1):
+            # Ardışık slotlar sütun görünümleri üzerinde yerinde güncellenir
+            window = slice(slots[0], slots[-1] + 1)
+            with store._lock:
+                self.advance(
+                    *(columns[name][window] for name in names),
+                    columns["mass"][window],
+                    forces,
+                    time_steps,
+                    field,
+                )
+        else:
+            # Dağınık slotların kopyaları güncellenir ve tek yazmada aktarılır
+            arrays = [columns[name][slots] for name in names]
+            self.advance(*arrays, columns["mass"][slots], forces, time_steps, field)
+            with store._lock:
+                for name, values in zip(names, arrays):
+                    columns[name][slots] = values
+        self.steps += 1
+        self.integrated += size
+        return size
+
+    def metrics(self) -> dict:
+        """
+        Toplu ilerletme ölçümlerini döndürür; yöntem verildiyse ölçümleri de eklenir.
+        """
+        metrics = {"steps": self.steps, "integrated": self.integrated}
+        if self.method is not None:
+            metrics.update(self.method.metrics())
+        return metrics
+
+
+# Example Usage
+if __name__ == "__main__":
+    from src.life.particles.population import (
+        PARTICLE_COLUMNS,
+        PARTICLE_VECTOR_COLUMNS,
+        PopulationStore,
+    )
+
+    size = 100_000
+    store = PopulationStore(
+        columns=PARTICLE_COLUMNS,
+        vector_columns=PARTICLE_VECTOR_COLUMNS,
+        capacity=size,
+    )
+    for _ in range(size):
+        store.allocate()
+    store.columns["mass"][:] = 9.1e-31
+    integrator = ParticleIntegrator()
+    started = time.perf_counter()
+    integrator.step(store)
+    print(f"Step: {size} particles in {(time.perf_counter() - started) * 1000:.2f} ms")
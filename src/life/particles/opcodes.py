@@ -0,0 +1,55 @@
+# src/life/particles/opcodes.py
+
+# Geçerli kabul edilen opcode aralıkları (başlangıç, bitiş, komut)
+OPCODE_RANGES = (
+    (0xB8, 0xBF, "MOV"),
+    (0xE9, 0xEB, "JMP"),
+    (0x00, 0x03, "ADD"),
+    (0x28, 0x2F, "SUB"),
+    (0x90, 0x97, "NOP"),
+    (0xC3, 0xC5, "RET"),
+    (0xE8, 0xEB, "CALL"),
+    (0xC7, 0xCF, "CMP"),
+    (0xD0, 0xD7, "ROL"),
+    (0xD8, 0xDF, "RCX"),
+    (0x50, 0x57, "PUSH"),
+    (0x58, 0x5F, "POP"),
+    (0x83, 0x87, "ADD"),
+    (0x81, 0x82, "CMP"),
+    (0x8B, 0x8F, "MOV"),
+    (0xE0, 0xE3, "LOOP"),
+    (0xE4, 0xE7, "IN"),
+    (0xEE, 0xEF, "OUT"),
+    (0x74, 0x75, "JZ/JNZ"),
+    (0x72, 0x73, "JC/JNC"),
+    (0x7E, 0x7F, "JLE/JG"),
+)
+
+
+def build_opcode_table() -> bytes:
+    """
+    Her byte değeri için geçerli (1) veya geçersiz (0) bilgisini tutan
+    256 elemanlı sınıflandırma tablosunu oluşturur.
+
+    :return: 256 byte uzunluğunda tablo.
+    """
+    table = bytearray(256)
+    for start, end, _ in OPCODE_RANGES:
+        for byte in range(start, end + 1):
+            table[byte] = 1
+    return bytes(table)
+
+
+# Önceden hesaplanmış sınıflandırma tablosu
+OPCODE_TABLE = build_opcode_table()
+
+
+def count_valid_opcodes(codes) -> int:
+    """
+    Verilen byte dizisindeki geçerli opcode sayısını döndürür.
+
+    :param codes: bytes veya bytearray.
+    :return: Geçerli opcode sayısı.
+    """
+    # translate C seviyesinde çalışır; her byte 0 veya 1'e dönüşür
+    return codes.translate(OPCODE_TABLE).count(1)
@@ -1,8 +1,10 @@
 # src/life/particles/particle.py
 
-import random
+import numpy as np
+
 from src.life.particles.vector import Vector
 from src.life.particles.core import Core
+from src.life.particles.population import StoreField
 
 
 class Particle(Core):
@@ -10,6 +12,16 @@ class Particle(Core):
     Parçacık sınıfı, LifeCycleManager sınıfından türetilir ve parçacıkların özelliklerini ve davranışlarını tanımlar.
     """
 
+    # Popülasyon deposuna bağlandığında sütunlarda tutulan parçacık bilgileri
+    charge = StoreField()
+    mass = StoreField()
+    spin = StoreField()
+    energy = StoreField()
+    position = StoreField()
+    velocity = StoreField()
+    momentum = StoreField()
+    wave_function = StoreField()
+
     def __init__(
         self,
         name: str,
@@ -58,17 +70,33 @@ class Particle(Core):
         self.mass = mass  # Parçacığın kütlesi
         self.spin = spin  # Parçacığın spin'i
         self.energy = energy  # Parçacığın enerjisi
-        self.position = position  # Parçacığın pozisyonu
-        self.velocity = velocity  # Parçacığın hızı
-        self.momentum = momentum  # Parçacığın momentumu
-        self.wave_function = wave_function or Vector(
-            0, 0, 0
+        # Vektörler yerinde güncellendiği için verilen vektörler kopyalanır;
+        # varsayılan değerler ve üst parçacığın vektörleri paylaşılmaz
+        self.position = position.copy()  # Parçacığın pozisyonu
+        self.velocity = velocity.copy()  # Parçacığın hızı
+        self.momentum = momentum.copy()  # Parçacığın momentumu
+        self.wave_function = (
+            wave_function.copy() if wave_function is not None else Vector(0, 0, 0)
         )  # Parçacığın dalga fonksiyonu
-
-    def to_json(self) -> dict:
+        # Kinematik simülasyon tarafından toplu ilerletiliyorsa True olur
+        self.batch_physics = False
+        # Konum ve hızı ilerleten yöntem (integrator.Integrator); None ise yarı
+        # örtük Euler Vector işlemleriyle uygulanır
+        self.integrator = None
+        # Sabit zaman adımı; None ise her adımda rastgele seçilir
+        self.time_step = None
+        # Simülasyonun hesapladığı dış kuvvet (ör. Barnes-Hut); None ise her
+        # adımda rastgele kuvvet uygulanır
+        self.force = None
+        # Konuma bağlı kuvvet işlevi, field(konum) -> kuvvet (NumPy dizileri);
+        # yöntemin her ivme hesaplamasında ara konumda yeniden hesaplanır
+        self.field = None
+
+    def to_json(self, codes: bool = True) -> dict:
         """
         Parçacığı JSON formatına dönüştürür.
 
+        :param codes: Kodlar eklenir; değişiklik gönderiminde kodlar ayrıca gönderilir.
         :return: JSON formatında parçacık verisi.
         :rtype: dict
         """
@@ -77,10 +105,11 @@ class Particle(Core):
             if self.lifetime_seconds == float("inf")
             else self.lifetime_seconds
         )
-        return {
+        data = {
             "name": self.name,
             "id": self.id,
             "parent_id": self.parent_id,
+            "lineage_id": self.lineage_id,
             "lifetime_seconds": lifetime_seconds,
             # created information
             "life_created_time": self.life_created_time,
@@ -90,7 +119,6 @@ class Particle(Core):
             "lifecycle": self.lifecycle,
             # status information
             "life_status": self.status(),
-            "codes": list(self.codes),
             "number_of_copies": self.number_of_copies,
             "generation": self.generation,
             "match_count": self.match_count,
@@ -106,35 +134,44 @@ class Particle(Core):
             "momentum": self.momentum.to_json(),
             "wave_function": self.wave_function.to_json(),
         }
+        if codes:
+            data["codes"] = list(self.codes)
+        return data
 
     # Parçacığın spin özelliklerini güncelleme
     def calculate_new_spin(self, current_spin):
         # Spin'i rastgele bir miktar değiştirerek güncelle
-        return current_spin + random.uniform(-0.1, 0.1)
+        return current_spin + self.random.uniform(-0.1, 0.1)
 
     # Parçacığın kütle özelliklerini güncelleme
     def calculate_new_mass(self, current_mass):
         # Kütle değişimini rastgele bir miktar artırarak güncelle
-        return current_mass * random.uniform(0.9, 1.1)
+        return current_mass * self.random.uniform(0.9, 1.1)
 
     # Parçacığın yükünü güncelleme
     def calculate_new_charge(self, current_charge):
         # Yük değişimini rastgele bir miktar artırarak güncelle
-        return current_charge * random.uniform(0.9, 1.1)
+        return current_charge * self.random.uniform(0.9, 1.1)
 
     # Parçacığın enerjisini güncelleme
     def calculate_new_energy(self, current_energy):
         # Enerjiyi rastgele bir miktar artırarak güncelle
-        return current_energy + random.uniform(0, 1)
+        return current_energy + self.random.uniform(0, 1)
 
     # Parçacığın enerjisini güncelleme
     def calculate_new_position(self):
         # Parçacığın yeni hızını ve konumunu belirlemek için güncellenmiş bir kuvvet fonksiyonu.
-        random_force = Vector(
-            random.uniform(-1, 1), random.uniform(-1, 1), random.uniform(-1, 1)
-        )
-        time_step = random.uniform(0.0001, 0.001)
-        self.update(force=random_force, time_step=time_step)
+        force = self.force
+        if force is None:
+            force = Vector(
+                self.random.uniform(-1, 1),
+                self.random.uniform(-1, 1),
+                self.random.uniform(-1, 1),
+            )
+        time_step = self.time_step
+        if time_step is None:
+            time_step = self.random.uniform(0.0001, 0.001)
+        self.update(force=force, time_step=time_step)
 
     # Parçacığın özelliklerini güncelleme
     def update_properties(self):
@@ -142,7 +179,9 @@ class Particle(Core):
         self.charge = self.calculate_new_charge(self.charge)
         self.mass = self.calculate_new_mass(self.mass)
         self.spin = self.calculate_new_spin(self.spin)
-        self.calculate_new_position()
+        # Toplu modda konum, hız, momentum ve dalga fonksiyonu sütunlarda ilerletilir
+        if not self.batch_physics:
+            self.calculate_new_position()
 
     def evolve(self):
         super().evolve()
@@ -164,27 +203,68 @@ class Particle(Core):
         :param time_step: Zaman adımı.
         :type time_step: float
         """
+        # Vektörler yerinde güncellenir; adım başına geçici vektör oluşturulmaz.
+        # Depoya bağlı parçacıkta okunan değerler atamayla sütunlara yazılır.
+        position = self.position
+        velocity = self.velocity
+        mass = self.mass
+
         # Schrödinger denklemini kullanarak dalga fonksiyonunu güncelle
-        self.wave_function += self.__schrodinger_eq() * time_step
+        # ψ = ψ0 + (x * v) * t
+        self.wave_function = self.wave_function.axpy(time_step, position, velocity)
 
-        # Newton'un ikinci yasası: F = m * a
-        acceleration = force * (1 / self.mass)
+        if self.integrator is not None:
+            self._integrate(position, velocity, force, time_step)
+            return
+        if self.field is not None:
+            # Yöntem yoksa konuma bağlı kuvvet adım başındaki konumda hesaplanır
+            x, y, z = self.field(np.array((position.x, position.y, position.z)))
+            force = Vector(force.x + x, force.y + y, force.z + z)
 
-        # Hızı güncelleme: v = v0 + a * t
-        self.velocity += acceleration * time_step
+        # Newton'un ikinci yasası: F = m * a
+        # Hızı güncelleme: v = v0 + (F / m) * t
+        self.velocity = velocity.axpy(time_step / mass, force)
 
         # Momentumu güncelleme: p = m * v
-        self.momentum = self.velocity * self.mass  # Çarpımı tersine çevirdik
+        self.momentum = self.momentum.assign(velocity, mass)
 
         # Konumu güncelleme: x = x0 + v * t
-        self.position += self.velocity * time_step
+        self.position = position.axpy(time_step, velocity)
 
-    def __schrodinger_eq(self):
+    def _integrate(
+        self, position: Vector, velocity: Vector, force: Vector, time_step: float
+    ):
         """
-        Schrödinger denklemi ile dalga fonksiyonunu hesaplar.
+        Konum ve hızı seçilen yöntemle ilerletir. Verilen kuvvet adım boyunca
+        sabittir; konuma bağlı kuvvet (field) her ivme hesaplamasında yeniden
+        hesaplanır.
         """
-        # Burada kompleks bir işlem gerçekleştirilir, bu sadece bir örnektir.
-        return self.position * self.velocity
+        mass = self.mass
+        drive = np.array((force.x, force.y, force.z))
+        field = self.field
+        if field is None:
+            constant = drive / mass
+
+            def acceleration(position):
+                return constant
+
+        else:
+
+            def acceleration(position):
+                return (drive + field(position)) / mass
+
+        new_position, new_velocity = self.integrator.step(
+            np.array((position.x, position.y, position.z)),
+            np.array((velocity.x, velocity.y, velocity.z)),
+            acceleration,
+            time_step,
+        )
+        position.x, position.y, position.z = new_position.tolist()
+        velocity.x, velocity.y, velocity.z = new_velocity.tolist()
+        self.velocity = velocity
+        # p = m * v
+        self.momentum = self.momentum.assign(velocity, mass)
+        self.position = position
 
     def pauli_exclusion_principle(self, other_particle: "Particle") -> bool:
         """
@@ -206,7 +286,8 @@ class Particle(Core):
         :return: Momentum.
         :rtype: Vector
         """
-        return self.__schrodinger_eq() * electric_field
+        # Schrödinger terimi update ile aynıdır: x * v
+        return self.position * self.velocity * electric_field
 
     def electromagnetic_interaction(
         self, electric_field: Vector, magnetic_field: Vector
@@ -223,6 +304,15 @@ class Particle(Core):
         """
         return electric_field * self.charge + magnetic_field * self.charge
 
+    def _inherit_runtime(self, new_item):
+        super()._inherit_runtime(new_item)
+        new_item.batch_physics = self.batch_physics
+        new_item.time_step = self.time_step
+        new_item.field = self.field
+        # Uyarlamalı yöntemin adım durumu kopyalar arasında paylaşılmaz
+        if self.integrator is not None:
+            new_item.integrator = self.integrator.clone()
+
     def replicate(self):
         """
         Eşlenme işlemi gerçekleştiğinde çağrılır ve yeni nesneyi oluşturulmasını sağlar.
@@ -254,6 +344,8 @@ class Particle(Core):
             momentum=self.momentum,
             wave_function=self.wave_function,
         ).trigger_event(self.event_function)
+        # Çalışma zamanı ayarlarını kopyaya aktar
+        self._inherit_runtime(new_item)
         # Yeni nesnenin kodlarını kopyala
         new_item.codes = self.codes[:]
         # Yeni programcığın nesnesini başlat
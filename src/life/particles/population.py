@@ -0,0 +1,523 @@
+# src/life/particles/population.py
+
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.life.particles.formula import attribute_columns, evaluate_columns
+from src.life.particles.vector import Vector
+
+# Çekirdek durum sütunları: sütun adı -> veri tipi
+CORE_COLUMNS = {
+    "id": np.int64,
+    "lifetime_seconds": np.float64,
+    "elapsed_lifespan": np.float64,
+    "fitness": np.float64,
+    "generation": np.int64,
+    "match_count": np.int64,
+    "number_of_copies": np.int64,
+    "paused": np.bool_,
+    "stopped": np.bool_,
+}
+
+# Parçacık durum sütunları
+PARTICLE_COLUMNS = {
+    **CORE_COLUMNS,
+    "charge": np.float64,
+    "mass": np.float64,
+    "spin": np.float64,
+    "energy": np.float64,
+}
+
+# Parçacık vektör sütunları (N x 3)
+PARTICLE_VECTOR_COLUMNS = ("position", "velocity", "momentum", "wave_function")
+
+# Core.to_json alanları; sütunu olmayanlar slota bağlı örnekten okunur
+CORE_JSON_FIELDS = (
+    "name",
+    "id",
+    "parent_id",
+    "lineage_id",
+    "lifetime_seconds",
+    "life_created_time",
+    "life_start_time",
+    "elapsed_lifespan",
+    "lifecycle",
+    "life_status",
+    "number_of_copies",
+    "generation",
+    "match_count",
+    "fitness",
+)
+
+# Particle.to_json ek alanları (vektör sütunlarından önce)
+PARTICLE_JSON_FIELDS = ("charge", "mass", "spin", "energy")
+
+# Bağlı olmayan örneğin sözlüğünde bulunmayan değer
+MISSING = object()
+
+# Şema (skaler ve vektör sütun adları) -> tutamaç sınıfı
+_HANDLE_CLASSES = {}
+
+
+class StoreHandle:
+    """
+    Depodaki bir slota bakan hafif tutamaç.
+
+    Yalnızca depo ve slot numarasını tutar; sütunlar Core/Particle öznitelik
+    adlarıyla okunur ve yazılır. Sütun erişimcileri her depo şeması için bir
+    kez oluşturulur, okumada sütun adı veya türü yeniden çözülmez.
+    """
+
+    __slots__ = ("store", "slot")
+    columns = frozenset()  # tutamaçta erişimcisi olan sütunlar
+
+    def __init__(self, store, slot: int) -> None:
+        """
+        :param store: PopulationStore örneği.
+        :param slot: Slot numarası.
+        """
+        self.store = store
+        self.slot = slot
+
+
+def _column_property(name: str, vector: bool) -> property:
+    # Sütun erişimcisi; sütun dizisi depo büyüyebileceği için okunurken alınır
+    if vector:
+
+        def getter(handle):
+            x, y, z = handle.store.columns[name][handle.slot].tolist()
+            return Vector(x, y, z)
+
+        def setter(handle, value):
+            store = handle.store
+            with store._lock:
+                store.columns[name][handle.slot] = (value.x, value.y, value.z)
+
+    else:
+
+        def getter(handle):
+            return handle.store.columns[name][handle.slot].item()
+
+        def setter(handle, value):
+            store = handle.store
+            with store._lock:
+                store.columns[name][handle.slot] = value
+
+    return property(getter, setter)
+
+
+def handle_class(columns, vector_columns=()) -> type:
+    """
+    Şemanın sütunlarına erişimcisi olan StoreHandle alt sınıfını oluşturur.
+
+    :param columns: Skaler sütun adları.
+    :param vector_columns: Vektör sütunlarının adları.
+    :return: StoreHandle alt sınıfı.
+    """
+    key = (tuple(columns), tuple(vector_columns))
+    cls = _HANDLE_CLASSES.get(key)
+    if cls is None:
+        namespace = {"__slots__": (), "columns": frozenset(key[0] + key[1])}
+        for name in key[0]:
+            namespace[name] = _column_property(name, vector=False)
+        for name in key[1]:
+            namespace[name] = _column_property(name, vector=True)
+        cls = _HANDLE_CLASSES[key] = type("StoreHandle", (StoreHandle,), namespace)
+    return cls
+
+
+class StoreField:
+    """
+    Örneğin bir özelliğini PopulationStore sütununa bağlayan tanımlayıcı.
+
+    Örnek bir depoya bağlı değilse değer örneğin kendi sözlüğünde tutulur;
+    bağlandığında değer sözlükten çıkarılır ve örneğin StoreHandle tutamacı
+    üzerinden deponun sütununda okunur ve yazılır. Böylece Core/Particle
+    öznitelik arayüzü değişmeden kalır.
+    """
+
+    def __init__(self, column: str = None) -> None:
+        """
+        :param column: Sütun adı (varsayılan olarak öznitelik adı).
+        """
+        self.column = column
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        if self.column is None:
+            self.column = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        values = instance.__dict__
+        value = values.get(self.name, MISSING)
+        if value is not MISSING:
+            return value
+        # Sözlükte olmayan değer bağlanırken sütuna taşınmıştır
+        handle = values.get("_handle")
+        if handle is None:
+            raise AttributeError(self.name)
+        return getattr(handle, self.column)
+
+    def __set__(self, instance, value):
+        values = instance.__dict__
+        handle = values.get("_handle")
+        if handle is not None and self.column in handle.columns:
+            setattr(handle, self.column, value)
+        else:
+            values[self.name] = value
+
+
+def store_fields(cls) -> dict:
+    """
+    Sınıf hiyerarşisindeki StoreField tanımlayıcılarını döndürür.
+
+    :param cls: Core veya Particle sınıfı.
+    :return: öznitelik adı -> StoreField
+    """
+    fields = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, StoreField):
+                fields[name] = value
+    return fields
+
+
+class PopulationStore:
+    """
+    Popülasyonun durumunu slot numarasıyla indekslenen bitişik NumPy sütunlarında tutar.
+
+    Her slotun hafif bir StoreHandle tutamacı vardır; slota bağlanan örnek
+    (Core/Particle) varsa ayrıca tutulur. Fitness hesaplama, yaşam süresi
+    güncellemeleri, sıralama ve JSON anlık görüntüleri tüm popülasyon üzerinde
+    sütun işlemleri olarak yapılabilir.
+    """
+
+    def __init__(
+        self,
+        columns: dict = None,
+        vector_columns: tuple = (),
+        capacity: int = 64,
+    ) -> None:
+        """
+        :param columns: Skaler sütunlar (ad -> veri tipi).
+        :param vector_columns: 3 bileşenli vektör sütunlarının adları.
+        :param capacity: Başlangıç kapasitesi; dolduğunda iki katına çıkar.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be a positive value.")
+        self.capacity = capacity
+        self.dtypes = dict(CORE_COLUMNS if columns is None else columns)
+        self.vector_columns = tuple(vector_columns)
+        self.columns = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in self.dtypes.items()
+        }
+        for name in self.vector_columns:
+            self.columns[name] = np.zeros((capacity, 3), dtype=np.float64)
+        self.handle_class = handle_class(self.dtypes, self.vector_columns)
+        self.handles = []  # slot -> StoreHandle
+        self.instances = []  # slot -> bağlı örnek (yoksa None)
+        self._lock = threading.RLock()
+        # Sütunlar süreçler arası paylaşılan bellekte tutuluyorsa bellek bloğu
+        self.shared_memory = None
+        self._owner = False
+
+    @classmethod
+    def shared(
+        cls,
+        columns: dict = None,
+        vector_columns: tuple = (),
+        capacity: int = 64,
+        name: str = None,
+    ):
+        """
+        Sütunları multiprocessing.shared_memory bloğunda tutan depo oluşturur.
+
+        Paylaşılan depo büyütülemez; kapasite en baştan ayrılır. Aynı şema ve
+        blok adıyla başka bir süreçten aynı sütunlara bağlanılabilir.
+
+        :param columns: Skaler sütunlar (ad -> veri tipi).
+        :param vector_columns: 3 bileşenli vektör sütunlarının adları.
+        :param capacity: Slot kapasitesi.
+        :param name: Bağlanılacak bellek bloğunun adı; None ise yeni blok oluşturulur.
+        :return: PopulationStore örneği.
+        """
+        store = cls(columns=columns, vector_columns=vector_columns, capacity=capacity)
+        layout = []
+        size = 0
+        for column_name, column in store.columns.items():
+            # Her sütun 8 byte hizalı başlar
+            size = (size + 7) // 8 * 8
+            layout.append((column_name, column, size))
+            size += column.nbytes
+
+        create = name is None
+        memory = shared_memory.SharedMemory(name=name, create=create, size=size)
+        for column_name, column, offset in layout:
+            view = np.ndarray(
+                column.shape, dtype=column.dtype, buffer=memory.buf, offset=offset
+            )
+            if create:
+                view[...] = 0
+            store.columns[column_name] = view
+        store.shared_memory = memory
+        store._owner = create
+        return store
+
+    @property
+    def name(self) -> str:
+        """
+        Paylaşılan bellek bloğunun adı.
+        """
+        return self.shared_memory.name if self.shared_memory is not None else None
+
+    def detach(self):
+        """
+        Sütunların son değerlerini sürece özel belleğe kopyalar ve paylaşılan
+        bellek bloğunu kapatır. Bloğu oluşturan süreç bloğu sistemden de siler.
+        """
+        memory = self.shared_memory
+        if memory is None:
+            return self
+        with self._lock:
+            self.columns = {
+                name: np.array(column) for name, column in self.columns.items()
+            }
+            self.shared_memory = None
+        memory.close()
+        if self._owner:
+            memory.unlink()
+        return self
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def has_column(self, name: str) -> bool:
+        return name in self.columns
+
+    def allocate(self, instance=None) -> int:
+        """
+        Yeni bir slot ve tutamacını ayırır.
+
+        :param instance: Slota bağlanacak örnek; None ise slot yalnızca
+            tutamaçla kullanılır.
+        :return: Slot numarası.
+        """
+        with self._lock:
+            slot = len(self.handles)
+            if slot >= self.capacity:
+                if self.shared_memory is not None:
+                    raise RuntimeError("Shared population store is full.")
+                self._grow(self.capacity * 2)
+            self.handles.append(self.handle_class(self, slot))
+            self.instances.append(instance)
+            return slot
+
+    def _grow(self, capacity: int):
+        for name, column in self.columns.items():
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[: self.capacity] = column
+            self.columns[name] = grown
+        self.capacity = capacity
+
+    def get(self, name: str, slot: int):
+        """
+        Bir slotun sütun değerini Python nesnesi olarak döndürür.
+        """
+        if name in self.vector_columns:
+            x, y, z = self.columns[name][slot].tolist()
+            return Vector(x, y, z)
+        return self.columns[name][slot].item()
+
+    def set(self, name: str, slot: int, value):
+        """
+        Bir slotun sütun değerini yazar.
+        """
+        if name in self.vector_columns:
+            value = (value.x, value.y, value.z)
+        with self._lock:
+            self.columns[name][slot] = value
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Kullanılan slotlara ait sütun görünümünü döndürür.
+        """
+        return self.columns[name][: len(self.handles)]
+
+    def live_slots(self) -> np.ndarray:
+        """
+        Durdurulmamış örneklerin slot numaralarını döndürür.
+        """
+        return np.flatnonzero(~self.column("stopped"))
+
+    def add(self, name: str, slots: np.ndarray, amounts):
+        """
+        Verilen slotların sütun değerlerine tek geçişte ekleme yapar.
+
+        :param name: Sütun adı (ör. lifetime_seconds).
+        :param slots: Slot numaraları.
+        :param amounts: Eklenecek değer veya değerler.
+        """
+        with self._lock:
+            np.add.at(self.columns[name], slots, amounts)
+
+    def calculate_fitness(self, code_lengths: np.ndarray, slots=None) -> np.ndarray:
+        """
+        Core.calculate_fitness hesabını tüm slotlar için sütun işlemiyle yapar.
+
+        :param code_lengths: Her slotun kod uzunluğu.
+        :param slots: Hesaplanacak slotlar (varsayılan olarak tüm slotlar).
+        :return: Hesaplanan fitness değerleri.
+        """
+        if slots is None:
+            slots = np.arange(len(self.handles))
+        lifetime_seconds = self.columns["lifetime_seconds"][slots]
+        elapsed_lifespan = self.columns["elapsed_lifespan"][slots]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mutation_rate = np.asarray(code_lengths) / elapsed_lifespan
+            lifetime_fitness = lifetime_seconds / elapsed_lifespan
+        fitness = np.where(
+            np.isinf(lifetime_seconds),
+            mutation_rate,
+            (lifetime_fitness + mutation_rate) / 2,
+        )
+        # Henüz süre geçmemiş slotların fitness değeri değişmez
+        fitness = np.where(
+            elapsed_lifespan > 0, fitness, self.columns["fitness"][slots]
+        )
+        with self._lock:
+            self.columns["fitness"][slots] = fitness
+        return fitness
+
+    def evaluate_formula(self, formula: str, slots=None, instances=None) -> np.ndarray:
+        """
+        Formülü slotlar için sütunlar üzerinde bir kez değerlendirir; sütunlara
+        yazmaz.
+
+        :param formula: Kullanıcı formülü (ör. "5.5 * self.generation").
+        :param slots: Değerlendirilecek slotlar (varsayılan olarak çalışan slotlar).
+        :param instances: Slotların örnekleri (varsayılan olarak depodaki örnekler).
+        :return: Hesaplanan değerler.
+        """
+        slots = self.live_slots() if slots is None else np.asarray(slots, dtype=int)
+        if instances is None:
+            instances = [self.instances[slot] for slot in slots.tolist()]
+        # Depoda sütunu olmayan bilgiler (ör. lifecycle) örneklerden okunur
+        attributes = attribute_columns(instances)
+
+        def column(name: str) -> np.ndarray:
+            if name in self.columns:
+                return self.columns[name][slots].astype(np.float64)
+            return attributes(name)
+
+        return evaluate_columns(formula, column, len(slots))
+
+    def apply_formula(self, formula: str, slots=None, instances=None) -> np.ndarray:
+        """
+        Formülü slotlar için sütunlar üzerinde bir kez değerlendirir ve
+        lifetime_seconds sütununa tek geçişte yazar.
+
+        :param formula: Kullanıcı formülü (ör. "5.5 * self.generation").
+        :param slots: Uygulanacak slotlar (varsayılan olarak çalışan slotlar).
+        :param instances: Slotların örnekleri (varsayılan olarak depodaki örnekler).
+        :return: Hesaplanan değerler.
+        """
+        slots = self.live_slots() if slots is None else np.asarray(slots, dtype=int)
+        values = self.evaluate_formula(formula, slots, instances)
+        with self._lock:
+            self.columns["lifetime_seconds"][slots] = values
+        return values
+
+    def rank(self, slots=None) -> np.ndarray:
+        """
+        Slotları fitness değerine göre büyükten küçüğe sıralar.
+
+        :param slots: Sıralanacak slotlar (varsayılan olarak tüm slotlar).
+        :return: Sıralı slot numaraları.
+        """
+        if slots is None:
+            slots = np.arange(len(self.handles))
+        slots = np.asarray(slots)
+        fitness = self.columns["fitness"][slots]
+        # Eşit değerlerde slot sırası korunur
+        return slots[np.argsort(-fitness, kind="stable")]
+
+    def snapshot(self, slots=None, codes: bool = True) -> list:
+        """
+        Slotların durum bilgilerini Core/Particle.to_json ile aynı şemada döndürür.
+        Sütunlar tek geçişte okunur; sütunu olmayan alanlar (ad, kodlar vb.)
+        slota bağlı örnekten alınır, yalnızca tutamacı olan slotlarda None olur.
+        Durum bilgisi paused/stopped sütunlarından hesaplanır.
+
+        :param slots: Görüntüsü alınacak slotlar (varsayılan olarak tüm slotlar).
+        :param codes: Kodlar eklenir.
+        """
+        if slots is None:
+            slots = np.arange(len(self.handles))
+        slots = np.asarray(slots).tolist()
+        fields = [
+            *CORE_JSON_FIELDS,
+            *(name for name in PARTICLE_JSON_FIELDS if name in self.columns),
+            *self.vector_columns,
+        ]
+        with self._lock:
+            values = {
+                name: self.columns[name][slots].tolist()
+                for name in fields
+                if name in self.columns
+            }
+            paused = self.columns["paused"][slots].tolist()
+            stopped = self.columns["stopped"][slots].tolist()
+        values["lifetime_seconds"] = [
+            "infinity" if value == float("inf") else value
+            for value in values["lifetime_seconds"]
+        ]
+        values["life_status"] = [
+            "Stopped" if is_stopped else "Paused" if is_paused else "Running"
+            for is_paused, is_stopped in zip(paused, stopped)
+        ]
+        for name in self.vector_columns:
+            values[name] = [{"x": x, "y": y, "z": z} for x, y, z in values[name]]
+
+        snapshot = []
+        for index, slot in enumerate(slots):
+            instance = self.instances[slot]
+            data = {}
+            for name in fields:
+                if name in values:
+                    data[name] = values[name][index]
+                elif instance is not None:
+                    data[name] = getattr(instance, name)
+                else:
+                    data[name] = None
+            if codes:
+                data["codes"] = list(instance.codes) if instance is not None else []
+            snapshot.append(data)
+        return snapshot
+
+
+def bind_store(instance, store: PopulationStore) -> int:
+    """
+    Örneğin StoreField özniteliklerini depoya taşır.
+
+    :param instance: Core veya Particle örneği.
+    :param store: Popülasyon deposu.
+    :return: Ayrılan slot numarası.
+    """
+    values = instance.__dict__
+    moved = {}
+    for name, field in store_fields(type(instance)).items():
+        if store.has_column(field.column) and name in values:
+            moved[name] = values.pop(name)
+    slot = store.allocate(instance)
+    if store.has_column("id"):
+        store.set("id", slot, instance.id)
+    values["_slot"] = slot
+    values["_store"] = store
+    values["_handle"] = store.handles[slot]
+    for name, value in moved.items():
+        setattr(instance, name, value)
+    return slot
@@ -0,0 +1,89 @@
+# src/life/particles/random_buffer.py
+
+import numpy as np
+
+
+class RandomBuffer:
+    """
+    Bir örneğe ait, blok halinde doldurulan rastgele sayı tamponu.
+
+    Değerler NumPy Generator ile blok blok üretilir ve tampondan tek tek
+    verilir. Her örnek kendi üretecini kullandığı için thread'ler ortak
+    random durumunu paylaşmaz; aynı tohumla aynı değerler üretilir.
+    """
+
+    def __init__(self, seed=None, block_size: int = 4096) -> None:
+        """
+        :param seed: Tohum (int, int dizisi veya np.random.SeedSequence); None ise
+            işletim sisteminden alınır.
+        :param block_size: Her doldurmada üretilecek blok boyutu (byte).
+        """
+        if block_size < 8:
+            raise ValueError("Block size must be at least 8 bytes.")
+        self.seed = seed
+        self.block_size = block_size
+        self.generator = np.random.Generator(np.random.PCG64(seed))
+        self._bytes = b""
+        self._byte_index = 0
+        self._floats = np.empty(0)
+        self._float_index = 0
+
+    def byte(self) -> int:
+        """
+        0-255 aralığında rastgele bir byte döndürür.
+        """
+        if self._byte_index >= len(self._bytes):
+            self._bytes = self.generator.bytes(self.block_size)
+            self._byte_index = 0
+        value = self._bytes[self._byte_index]
+        self._byte_index += 1
+        return value
+
+    def random(self) -> float:
+        """
+        [0, 1) aralığında rastgele bir sayı döndürür.
+        """
+        if self._float_index >= len(self._floats):
+            self._floats = self.generator.random(self.block_size // 8)
+            self._float_index = 0
+        value = self._floats[self._float_index].item()
+        self._float_index += 1
+        return value
+
+    def uniform(self, low: float, high: float) -> float:
+        """
+        [low, high) aralığında rastgele bir sayı döndürür (random.uniform karşılığı).
+        """
+        return low + (high - low) * self.random()
+
+    def spawn(self, key: int):
+        """
+        Bu tampondan türetilen yeni bir tampon döndürür.
+        Tohumlu tamponlardan türetilen tamponlar da tohumludur.
+
+        Türetme np.random.SeedSequence.spawn ile aynıdır: anahtar tohumun
+        spawn_key dizisine eklenir. Böylece türetilen tampon üst tamponun ve
+        başka anahtarlarla türetilen tamponların dizilerini tekrarlamaz.
+
+        :param key: Türetme anahtarı (ör. örnek sırası veya kopya sırası).
+        :return: RandomBuffer örneği.
+        """
+        if self.seed is None:
+            return RandomBuffer(block_size=self.block_size)
+        sequence = self.seed
+        if not isinstance(sequence, np.random.SeedSequence):
+            sequence = np.random.SeedSequence(sequence)
+        child = np.random.SeedSequence(
+            sequence.entropy,
+            spawn_key=sequence.spawn_key + (key,),
+            pool_size=sequence.pool_size,
+        )
+        return RandomBuffer(seed=child, block_size=self.block_size)
+
+
+# Example Usage
+if __name__ == "__main__":
+    buffer = RandomBuffer(seed=42)
+    print("Bytes:", [buffer.byte() for _ in range(8)])
+    print("Uniform:", buffer.uniform(-1, 1))
+    print("Child:", buffer.spawn(1).byte())
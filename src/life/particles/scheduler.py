@@ -0,0 +1,288 @@
+# src/life/particles/scheduler.py
+
+import heapq
+import itertools
+import threading
+import time
+
+from src.package import Logger
+from src.life.particles.clock import REAL_CLOCK, VirtualClock
+
+
+class TickScheduler:
+    """
+    Çekirdekleri her biri için ayrı bir thread açmadan çalıştıran zamanlayıcı.
+
+    Örnekler bir sonraki adım zamanına göre sıralanan bir heap'te tutulur.
+    Sabit sayıdaki çalışan thread, zamanı gelen örneği heap'ten alır ve
+    yaşam döngüsünün bir adımını (evolve/test/calculate_fitness/update_state/event)
+    işletir. Duraklatılan örnekler heap'ten çıkarılıp bekletilir; resume ile
+    yeniden planlanana kadar işlenmez.
+    """
+
+    def __init__(
+        self, number_of_workers: int = 4, name: str = "scheduler", clock=None
+    ) -> None:
+        """
+        Zamanlayıcıyı oluşturur.
+
+        :param number_of_workers: Çalışan thread sayısı.
+        :param name: Zamanlayıcı adı.
+        :param clock: Adım zamanlarının ölçüldüğü saat (varsayılan duvar saati).
+        """
+        if number_of_workers <= 0:
+            raise ValueError("Number of workers must be a positive value.")
+        self.name = name
+        self.clock = REAL_CLOCK if clock is None else clock
+        self.number_of_workers = number_of_workers
+        self._heap = []  # (adım zamanı, sıra, örnek)
+        self._sequence = itertools.count()  # aynı zamanlı adımlar için sıra
+        self._parked = set()  # duraklatıldığı için bekletilen örnekler
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._workers = []
+        # Log ayarlarını yapılandırma
+        self.logger = Logger(name=f"/scheduler/{name}").get_logger()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def parked(self) -> int:
+        """
+        Duraklatıldığı için bekletilen örnek sayısı.
+        """
+        return len(self._parked)
+
+    def start(self):
+        """
+        Çalışan thread'leri başlatır.
+        """
+        if self._workers:
+            return self
+        for index in range(self.number_of_workers):
+            worker = threading.Thread(
+                target=self._run_worker, name=f"{self.name}_{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        return self
+
+    def stop(self, timeout: float = None):
+        """
+        Zamanlayıcıyı durdurur ve çalışan thread'lerin bitmesini bekler.
+        Sırada bekleyen ve bekletilen örneklerin yaşam döngüsü sonlandırılır.
+
+        :param timeout: Her thread için en fazla bekleme süresi.
+        """
+        with self._condition:
+            self._stop_event.set()
+            cores = [core for _, _, core in self._heap]
+            cores.extend(self._parked)
+            self._heap.clear()
+            self._parked.clear()
+            self._condition.notify_all()
+        # Olay işlevleri kilit dışında çağrılır
+        for core in cores:
+            core.finish()
+        for worker in self._workers:
+            if worker is not threading.current_thread():
+                worker.join(timeout)
+        return self
+
+    def submit(self, core):
+        """
+        Örneğin yaşam döngüsünü başlatır ve ilk adımını planlar.
+
+        :param core: Çekirdek örneği.
+        """
+        core.begin()
+        if not self.schedule(core, core.lifecycle):
+            core.finish()
+        return core
+
+    def schedule(self, core, delay: float) -> bool:
+        """
+        Örneğin bir sonraki adımını planlar.
+
+        :param core: Çekirdek örneği.
+        :param delay: Adıma kalan süre saniye cinsinden.
+        :return: Zamanlayıcı durdurulduysa False.
+        """
+        with self._condition:
+            if self._stop_event.is_set():
+                return False
+            self._push(core, delay)
+            return True
+
+    def _push(self, core, delay: float):
+        # Kilit altında çağrılır
+        heapq.heappush(
+            self._heap, (self.clock.time() + delay, next(self._sequence), core)
+        )
+        self._condition.notify()
+
+    def park(self, core) -> bool:
+        """
+        Duraklatılan örneği resume çağrılana kadar heap dışında bekletir.
+
+        :param core: Çekirdek örneği.
+        :return: Zamanlayıcı durdurulduysa False.
+        """
+        with self._condition:
+            if self._stop_event.is_set():
+                return False
+            if core.is_blocked() and core.is_living():
+                self._parked.add(core)
+            else:
+                # Bekletilmeden önce devam ettirildi veya durduruldu
+                self._push(core, core.lifecycle)
+            return True
+
+    def resume(self, core=None):
+        """
+        Artık duraklatılmamış veya durdurulmuş bekletilen örnekleri yeniden
+        planlar.
+
+        :param core: Yalnızca bu örnek kontrol edilir; None ise tümü.
+        """
+        with self._condition:
+            if core is None:
+                cores = list(self._parked)
+            elif core in self._parked:
+                cores = [core]
+            else:
+                return
+            for core in cores:
+                if not core.is_blocked() or not core.is_living():
+                    self._parked.discard(core)
+                    self._push(core, core.lifecycle)
+
+    def _next_due(self):
+        """
+        Zamanı gelen örneği döndürür; zamanlayıcı durdurulduysa None döner.
+        """
+        with self._condition:
+            while not self._stop_event.is_set():
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                remaining = self._heap[0][0] - self.clock.time()
+                if remaining <= 0:
+                    return heapq.heappop(self._heap)[2]
+                self._condition.wait(remaining)
+            return None
+
+    def _run_worker(self):
+        while True:
+            core = self._next_due()
+            if core is None:
+                return
+            try:
+                self._run_tick(core)
+            except Exception as e:
+                self.logger.error(f"Scheduler Tick Error : {e}")
+
+    def _run_tick(self, core):
+        """
+        Örneğin tek bir adımını işler ve sıradaki adımını planlar.
+
+        :param core: Çekirdek örneği.
+        """
+        if not core.is_living():
+            # Yaşam döngüsü sona erdi
+            core.finish()
+            return
+
+        # eğer paused konumunda ise devam ettirilene kadar bekletilir
+        if core.is_blocked():
+            if not self.park(core):
+                core.finish()
+            return
+
+        core.tick()
+
+        if not (core.is_living() and self.schedule(core, core.lifecycle)):
+            core.finish()
+
+
+class DiscreteEventScheduler(TickScheduler):
+    """
+    Sanal zamanda çalışan ayrık olay motoru.
+
+    Tek bir çalışan thread, zamanı en erken olan adımı heap'ten alır, sanal
+    saati o ana ilerletir ve adımı hemen işler. Adımlar arasında gerçekten
+    beklenmediği için simülasyon gerçek zamandan çok daha hızlı ilerler;
+    elapsed_lifespan, calculate_fitness ve yaşam süresi kontrolleri sanal
+    saate göre yapılır. Duraklatılan örnekler sıradan çıkarılıp bekletilir;
+    yalnızca onlar kalırsa sanal zaman devam ettirilene kadar ilerlemez.
+    """
+
+    def __init__(self, name: str = "scheduler", clock=None, gate=None) -> None:
+        """
+        Motoru oluşturur.
+
+        :param name: Motor adı.
+        :param clock: İlerletilecek sanal saat (varsayılan olarak yeni bir saat).
+        :param gate: Simülasyonun ortak kapısı; kapı kapalıyken sanal zaman durur.
+        """
+        super().__init__(
+            number_of_workers=1,
+            name=name,
+            clock=VirtualClock() if clock is None else clock,
+        )
+        self.gate = gate
+
+    def stop(self, timeout: float = None):
+        # Kapıda bekleyen motoru uyandır
+        self._stop_event.set()
+        if self.gate is not None:
+            self.gate.notify()
+        return super().stop(timeout=timeout)
+
+    def _next_due(self):
+        """
+        Zamanı en erken olan örneği döndürür ve sanal saati o ana ilerletir;
+        motor durdurulduysa None döner.
+        """
+        gate = self.gate
+        if gate is not None:
+            # Simülasyon duraklatıldıysa sanal zaman ilerlemez
+            gate.wait_for(lambda: gate.is_open() or self._stop_event.is_set())
+        with self._condition:
+            while not self._stop_event.is_set():
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                due, _, core = heapq.heappop(self._heap)
+                self.clock.advance_to(due)
+                return core
+            return None
+
+
+# Example Usage
+if __name__ == "__main__":
+    from src.life.particles.core import Core
+
+    scheduler = TickScheduler(number_of_workers=2).start()
+    for _ in range(10):
+        core = Core(name="core", lifetime_seconds=1, lifecycle=0.1)
+        core.trigger_event(None)
+        core.scheduler = scheduler
+        core.start()
+
+    time.sleep(1.5)
+    scheduler.stop()
+
+    # 10 dakikalık yaşam süresi sanal zamanda beklemeden tamamlanır
+    engine = DiscreteEventScheduler().start()
+    core = Core(name="core", lifetime_seconds=600, lifecycle=1)
+    core.trigger_event(None)
+    core.batch_scoring = True
+    core.clock = engine.clock
+    core.scheduler = engine
+    core.start()
+    while core.is_living():
+        time.sleep(0.01)
+    print("Virtual time:", engine.clock.time())
+    engine.stop()
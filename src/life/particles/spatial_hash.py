@@ -0,0 +1,349 @@
+# src/life/particles/spatial_hash.py
+
+import numpy as np
+
+# Coulomb sabiti (N m² / C²)
+COULOMB_CONSTANT = 8.9875517923e9
+
+# Komşu hücre ofsetlerinin yarısı (dz, dy, dx); her hücre çifti bir kez ziyaret edilir
+HALF_SHELL = tuple(
+    (dz, dy, dx)
+    for dz in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    for dx in (-1, 0, 1)
+    if (dz, dy, dx) > (0, 0, 0)
+)
+
+
+def _expand(sources: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> tuple:
+    # Her kaynak için [start, start + count) aralığındaki indeksleri açar
+    total = int(counts.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(sources, counts), np.repeat(starts, counts) + offsets
+
+
+class SpatialHash:
+    """
+    Parçacık konumları üzerinde düzgün ızgaralı hücre listesi (cell list).
+
+    Noktalar hücre anahtarlarına göre sıralanır; her dolu hücre sıralı dizide
+    bir aralıktır. Yarıçap ve en yakın k komşu sorguları yalnızca çevre
+    hücrelere bakar; yarıçapı hücre boyutunu aşmayan tüm yakın çiftler
+    vektörel olarak O(n) sürede bulunur. Sonlu olmayan (inf, nan) konumlar
+    dizine alınmaz. İndeksler build işlevine verilen konum dizisinin
+    satırlarıdır.
+    """
+
+    def __init__(self, cell_size: float, max_cells: int = 2**20) -> None:
+        """
+        :param cell_size: Hücre kenar uzunluğu; çift sorgularının en büyük yarıçapı.
+        :param max_cells: Eksen başına en fazla hücre sayısı; konumlar çok
+            dağınıksa hücreler bu sayıya sığacak kadar büyütülür.
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be a positive value.")
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self.positions = np.empty((0, 3))
+        self.size = np.full(3, float(cell_size))  # eksen başına hücre boyutu
+        self.origin = np.zeros(3)
+        self.shape = np.full(3, 2, dtype=np.int64)
+        self.order = np.empty(0, dtype=np.int64)  # sıralı dizi -> nokta indeksi
+        self.cells = np.empty(0, dtype=np.int64)  # dolu hücre anahtarları (sıralı)
+        self.starts = np.empty(0, dtype=np.int64)
+        self.counts = np.empty(0, dtype=np.int64)
+        # nokta -> hücre anahtarı (-1: sonlu olmayan konum)
+        self._keys = np.empty(0, dtype=np.int64)
+        # metrics
+        self.builds = 0  # ızgaranın yeniden kurulma sayısı
+        self.updates = 0  # artımlı güncelleme sayısı
+        self.resorts = 0  # hücre değiştiren nokta nedeniyle yeniden sıralama sayısı
+        self.moved = 0  # son güncellemede hücre değiştiren nokta sayısı
+        self.last_pairs = 0
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def _coordinates(self, positions: np.ndarray) -> np.ndarray:
+        with np.errstate(all="ignore"):
+            return np.floor((positions - self.origin) / self.size).astype(np.int64)
+
+    def _linear(self, coordinates: np.ndarray) -> np.ndarray:
+        shape = self.shape
+        return coordinates[..., 0] + shape[0] * (
+            coordinates[..., 1] + shape[1] * coordinates[..., 2]
+        )
+
+    def _index(self, order: np.ndarray):
+        self.order = order
+        self.cells, self.starts, self.counts = np.unique(
+            self._keys[order], return_index=True, return_counts=True
+        )
+
+    def build(self, positions) -> "SpatialHash":
+        """
+        Izgarayı konumlara göre baştan kurar.
+
+        :param positions: Konumlar (N x 3).
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        valid = np.all(np.isfinite(positions), axis=1)
+        points = positions[valid]
+        low = points.min(axis=0) if len(points) else np.zeros(3)
+        high = points.max(axis=0) if len(points) else np.zeros(3)
+        # Hücreler hiçbir zaman cell_size'dan küçük olmaz; böylece komşu
+        # hücreler çift yarıçapını her zaman kapsar
+        self.size = np.maximum(self.cell_size, (high - low) / (self.max_cells - 5))
+        # Kenarlarda iki hücre boşluk bırakılır: dıştaki hücre komşu ofsetlerini
+        # ızgarada tutar, içteki küçük hareketlerde yeniden kurmayı önler
+        self.origin = low - 2 * self.size
+        self.shape = self._coordinates(high) + 3
+        self.positions = positions
+        self._keys = np.full(len(positions), -1, dtype=np.int64)
+        self._keys[valid] = self._linear(self._coordinates(points))
+        indices = np.flatnonzero(valid)
+        self._index(indices[np.argsort(self._keys[indices], kind="stable")])
+        self.builds += 1
+        self.moved = len(indices)
+        return self
+
+    def update(self, positions) -> "SpatialHash":
+        """
+        Konumları günceller. Hücre değiştiren nokta yoksa sıralama korunur;
+        varsa önceki sıra üzerinden (neredeyse sıralı dizi) yeniden sıralanır.
+        Nokta sayısı değişirse veya noktalar ızgaradan çıkarsa ızgara baştan
+        kurulur.
+
+        :param positions: Konumlar (N x 3); satırlar önceki çağrıyla aynı noktalardır.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        if len(positions) != len(self._keys):
+            return self.build(positions)
+        valid = np.all(np.isfinite(positions), axis=1)
+        if not np.array_equal(valid, self._keys >= 0):
+            return self.build(positions)
+        coordinates = self._coordinates(positions[valid])
+        if len(coordinates) and (
+            np.any(coordinates < 1) or np.any(coordinates > self.shape - 2)
+        ):
+            return self.build(positions)
+        keys = self._linear(coordinates)
+        moved = int(np.count_nonzero(keys != self._keys[valid]))
+        self.positions = positions
+        self.updates += 1
+        self.moved = moved
+        if moved:
+            self._keys[valid] = keys
+            order = self.order
+            self._index(order[np.argsort(self._keys[order], kind="stable")])
+            self.resorts += 1
+        return self
+
+    def _candidates(self, point: np.ndarray, radius: float) -> np.ndarray:
+        # Yarıçaplı küreyi kapsayan hücrelerdeki noktalar
+        if not np.all(np.isfinite(point)):
+            return np.empty(0, dtype=np.int64)
+        reach = np.ceil(radius / self.size).astype(np.int64)
+        center = self._coordinates(point)
+        low = np.maximum(center - reach, 0)
+        high = np.minimum(center + reach, self.shape - 1)
+        if np.any(low > high):
+            return np.empty(0, dtype=np.int64)
+        extent = high - low + 1
+        if np.prod(extent.astype(np.float64)) >= len(self.cells):
+            # Kutu dolu hücrelerden büyükse tüm noktalara bakmak daha ucuzdur
+            return self.order
+        grid = np.stack(
+            np.meshgrid(*(np.arange(a, b + 1) for a, b in zip(low, high))), axis=-1
+        ).reshape(-1, 3)
+        keys = self._linear(grid)
+        found = np.searchsorted(self.cells, keys)
+        found[found == len(self.cells)] = 0
+        found = found[self.cells[found] == keys]
+        _, sorted_indices = _expand(found, self.starts[found], self.counts[found])
+        return self.order[sorted_indices]
+
+    def _distances(self, point: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        delta = self.positions[indices] - point
+        return np.einsum("ij,ij->i", delta, delta)
+
+    def query_radius(self, point, radius: float) -> np.ndarray:
+        """
+        Noktaya radius uzaklıktaki noktaları uzaklık sırasıyla döndürür.
+
+        :param point: Sorgu noktası (3).
+        :param radius: Arama yarıçapı.
+        :return: Nokta indeksleri.
+        """
+        point = np.asarray(point, dtype=np.float64).reshape(3)
+        candidates = self._candidates(point, radius)
+        distances = self._distances(point, candidates)
+        inside = distances <= radius * radius
+        candidates, distances = candidates[inside], distances[inside]
+        return candidates[np.argsort(distances, kind="stable")]
+
+    def query_knn(self, point, k: int) -> np.ndarray:
+        """
+        Noktaya en yakın k noktayı uzaklık sırasıyla döndürür.
+
+        :param point: Sorgu noktası (3).
+        :param k: Komşu sayısı.
+        :return: Nokta indeksleri (en fazla k).
+        """
+        point = np.asarray(point, dtype=np.float64).reshape(3)
+        k = min(k, len(self.order))
+        if k <= 0 or not np.all(np.isfinite(point)):
+            return np.empty(0, dtype=np.int64)
+        radius = self.cell_size
+        while True:
+            candidates = self._candidates(point, radius)
+            if len(candidates) >= k:
+                distances = self._distances(point, candidates)
+                kth = np.sqrt(np.partition(distances, k - 1)[k - 1])
+                if kth > radius:
+                    # k. komşunun uzaklığını kapsayan kutu daha yakın tüm
+                    # noktaları içerir
+                    candidates = self._candidates(point, kth)
+                    distances = self._distances(point, candidates)
+                break
+            radius *= 2
+        nearest = np.argsort(distances, kind="stable")[:k]
+        return candidates[nearest]
+
+    def pairs(self, radius: float = None) -> tuple:
+        """
+        Aralarındaki uzaklık radius'tan küçük veya eşit tüm nokta çiftlerini
+        döndürür; her çift bir kez bulunur.
+
+        :param radius: Çift yarıçapı (varsayılan ve en fazla cell_size).
+        :return: (first, second) nokta indeksleri.
+        """
+        radius = self.cell_size if radius is None else radius
+        if radius > self.cell_size:
+            raise ValueError("Pair radius cannot exceed the cell size.")
+        size = len(self.order)
+        cells, starts, counts = self.cells, self.starts, self.counts
+        ends = starts + counts
+        # Aynı hücre: sıralı dizide her noktanın kendisinden sonraki noktaları
+        positions = np.arange(size)
+        cell_of = np.repeat(np.arange(len(cells)), counts)
+        first, second = [], []
+        a, b = _expand(positions, positions + 1, ends[cell_of] - positions - 1)
+        first.append(a)
+        second.append(b)
+        # Komşu hücreler: yarım kabuktaki ofsetler
+        for offset in HALF_SHELL:
+            linear = self._linear(np.array(offset[::-1]))
+            neighbor = np.searchsorted(cells, cells + linear)
+            neighbor[neighbor == len(cells)] = 0
+            matched = np.flatnonzero(cells[neighbor] == cells + linear)
+            if not len(matched):
+                continue
+            # Hücredeki her nokta komşu hücrenin tüm noktalarıyla eşleşir
+            cell_index, points = _expand(
+                neighbor[matched], starts[matched], counts[matched]
+            )
+            a, b = _expand(points, starts[cell_index], counts[cell_index])
+            first.append(a)
+            second.append(b)
+        # Uzaklıklar sıralı dizide hesaplanır; aynı hücredeki noktalar bellekte
+        # yan yanadır ve yalnızca yakın çiftlerin indeksleri dönüştürülür
+        first, second = np.concatenate(first), np.concatenate(second)
+        ordered = self.positions[self.order]
+        delta = ordered[first]
+        delta -= ordered[second]
+        inside = np.flatnonzero(np.einsum("ij,ij->i", delta, delta) <= radius * radius)
+        self.last_pairs = len(inside)
+        return self.order[first[inside]], self.order[second[inside]]
+
+    def metrics(self) -> dict:
+        """
+        Dizinin ölçümlerini döndürür.
+        """
+        return {
+            "points": len(self.order),
+            "cells": len(self.cells),
+            "mean_occupancy": (
+                len(self.order) / len(self.cells) if len(self.cells) else 0.0
+            ),
+            "builds": self.builds,
+            "updates": self.updates,
+            "resorts": self.resorts,
+            "moved": self.moved,
+            "pairs": self.last_pairs,
+        }
+
+
+def pair_forces(
+    positions: np.ndarray,
+    charges: np.ndarray,
+    spins: np.ndarray,
+    first: np.ndarray,
+    second: np.ndarray,
+    radius: float,
+    exclusion: float = 1.0,
+    coulomb: float = COULOMB_CONSTANT,
+) -> np.ndarray:
+    """
+    Yakın çiftlerin kısa menzilli kuvvetlerini parçacık başına toplar.
+
+    Aynı spinli çiftler (Particle.pauli_exclusion_principle) yarıçapta sıfıra
+    inen yumuşak bir itmeyle birbirinden uzaklaşır. Yüklü çiftler yarıçapla
+    kesilmiş Coulomb kuvveti uygular; sıfır uzaklık tekilliği yarıçapın
+    binde biriyle yumuşatılır. Çakışan noktalar kuvvet almaz.
+
+    :param positions: Konumlar (N x 3).
+    :param charges: Yükler (N).
+    :param spins: Spinler (N).
+    :param first: Çiftlerin ilk noktaları.
+    :param second: Çiftlerin ikinci noktaları.
+    :param radius: Etkileşim yarıçapı.
+    :param exclusion: Dışlama itmesinin büyüklüğü.
+    :param coulomb: Coulomb sabiti.
+    :return: Kuvvetler (N x 3).
+    """
+    size = len(positions)
+    forces = np.zeros((size, 3))
+    if not len(first):
+        return forces
+    delta = positions[first] - positions[second]
+    squared = np.einsum("ij,ij->i", delta, delta)
+    distance = np.sqrt(squared)
+    with np.errstate(all="ignore"):
+        unit = np.where(distance[:, None] > 0, delta / distance[:, None], 0.0)
+        magnitude = np.where(
+            spins[first] == spins[second], exclusion * (1 - distance / radius), 0.0
+        )
+        magnitude += (
+            coulomb
+            * charges[first]
+            * charges[second]
+            / (squared + (radius * 1e-3) ** 2)
+        )
+    pair = unit * magnitude[:, None]
+    # İtme ilk noktayı ikinciden uzaklaştırır; ikinci nokta ters kuvveti alır
+    for axis in range(3):
+        forces[:, axis] = np.bincount(
+            first, pair[:, axis], minlength=size
+        ) - np.bincount(second, pair[:, axis], minlength=size)
+    return forces
+
+
+# Example Usage
+if __name__ == "__main__":
+    import time
+
+    size = 100_000
+    generator = np.random.default_rng(1)
+    positions = generator.uniform(0, 100, (size, 3))
+    index = SpatialHash(cell_size=2.0)
+    started = time.perf_counter()
+    index.build(positions)
+    first, second = index.pairs()
+    print(f"Pairs: {len(first)} in {(time.perf_counter() - started) * 1000:.2f} ms")
+    positions += generator.uniform(-0.05, 0.05, (size, 3))
+    started = time.perf_counter()
+    index.update(positions)
+    print(f"Update: {(time.perf_counter() - started) * 1000:.2f} ms")
+    print("Nearest:", index.query_knn(positions[0], 5))
+    print("Metrics:", index.metrics())
@@ -3,6 +3,9 @@ import math
 
 
 class Vector:
+    # Bileşenler örnek sözlüğü yerine sabit yuvalarda tutulur
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float = 0, y: float = 0, z: float = 0):
         """
         Vector sınıfını başlatır.
@@ -45,6 +48,21 @@ class Vector:
         else:
             raise TypeError("Operand must be a Vector.")
 
+    def __iadd__(self, other: "Vector") -> "Vector":
+        """
+        Diğer vektörü yeni nesne oluşturmadan bu vektöre ekler.
+
+        :param other: Diğer vektör.
+        :return: Güncellenen vektör.
+        """
+        if isinstance(other, Vector):
+            self.x += other.x
+            self.y += other.y
+            self.z += other.z
+            return self
+        else:
+            raise TypeError("Operand must be a Vector.")
+
     def __mul__(self, scalar: float) -> "Vector":
         """
         Vektörü bir skalerle çarpar.
@@ -59,6 +77,67 @@ class Vector:
         else:
             raise TypeError("Scalar must be an integer, a float, or a Vector.")
 
+    def __imul__(self, scalar: float) -> "Vector":
+        """
+        Vektörü yeni nesne oluşturmadan bir skalerle veya bileşen bazında
+        bir vektörle çarpar.
+
+        :param scalar: Skaler değer veya vektör.
+        :return: Güncellenen vektör.
+        """
+        if isinstance(scalar, (int, float)):
+            self.x *= scalar
+            self.y *= scalar
+            self.z *= scalar
+        elif isinstance(scalar, Vector):
+            self.x *= scalar.x
+            self.y *= scalar.y
+            self.z *= scalar.z
+        else:
+            raise TypeError("Scalar must be an integer, a float, or a Vector.")
+        return self
+
+    def axpy(self, a: float, x: "Vector", y: "Vector" = None) -> "Vector":
+        """
+        Geçici vektör oluşturmadan v += a * x işlemini yapar. y verilirse
+        v += a * (x * y) bileşen bazında hesaplanır.
+
+        :param a: Skaler katsayı.
+        :param x: Eklenecek vektör.
+        :param y: x ile bileşen bazında çarpılacak vektör.
+        :return: Güncellenen vektör.
+        """
+        if y is None:
+            self.x += a * x.x
+            self.y += a * x.y
+            self.z += a * x.z
+        else:
+            self.x += a * x.x * y.x
+            self.y += a * x.y * y.y
+            self.z += a * x.z * y.z
+        return self
+
+    def assign(self, other: "Vector", scalar: float = 1) -> "Vector":
+        """
+        Bileşenleri diğer vektörün skalerle çarpımına eşitler (v = scalar * other).
+
+        :param other: Kaynak vektör.
+        :param scalar: Skaler değer.
+        :return: Güncellenen vektör.
+        """
+        self.x = other.x * scalar
+        self.y = other.y * scalar
+        self.z = other.z * scalar
+        return self
+
+    def copy(self) -> "Vector":
+        """
+        Vektörün bağımsız bir kopyasını döndürür.
+
+        :return: Kopya vektör.
+        """
+        return Vector(self.x, self.y, self.z)
+
     def __eq__(self, other: "Vector") -> bool:
         """
         Vektörlerin eşitliğini kontrol eder.
@@ -117,6 +196,11 @@ if __name__ == "__main__":
     v5 = v4 * 2
     print("Multiplication result:", v5)
 
+    # Yeni nesne oluşturmadan güncelleme: v5 += 0.5 * v2
+    v5.axpy(0.5, v2)
+    v5 *= 2
+    print("In-place result:", v5)
+
     # Vektörün uzunluğu
     length = v5.length()
     print("Length of the vector:", length)
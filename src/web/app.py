@@ -1,21 +1,29 @@
 # src/web/app.py
 from flask import Flask, jsonify, request
 from flask_cors import CORS
+from flask_socketio import emit, join_room, leave_room
 
 
 from src.web.api import blueprint as api_blueprint
 from src.web.socket import initialize
-
-from src.web.config import APP_ENV, APP_NAME, HOST_IP, httpPortNumber, DEBUG
+from src.web.socket.delta import DeltaEncoder
+from src.web.socket.emitter import PopulationEmitter
+from src.web.socket.subscription import Subscription, Subscriptions
+from src.web.socket.wire import (
+    BINARY,
+    ClientFormats,
+    binary_frame,
+    binary_snapshot,
+    json_frame,
+)
+
+from src.web.config import APP_ENV, APP_NAME, HOST_IP, httpPortNumber, DEBUG, EMIT_RATE
 from src.web.controller.simulation_status import SimulationStatus
 from src.web.controller.simulation_type import SimulationType
 from src.web.controller.simulation import simulation, io_event
 
 from src.package.logger import logger, logger_event
 
-queue = None  # tekil güncelleme işlemleri.
-queues = None  # toplu güncelleme işlemleri.
-
 
 def create_app():
     # Create Flask app instance
@@ -39,6 +47,86 @@ def create_app():
 
     io = initialize(app, paths)  # Call initialize and assign the SocketIO instance
 
+    # Örnek durumları birleştirilerek sabit hızda population_frame olarak gönderilir
+    # Mesajlar yalnızca değişen bilgileri ve kodlara eklenen byte'ları taşır
+    # İstemciler bağlanırken "format" ile json veya binary mesaj biçimini seçer
+    encoder = DeltaEncoder()
+    formats = ClientFormats()
+
+    def population():
+        return simulation.sampler.population() if simulation.sampler else []
+
+    # İstemciler "subscribe" ile süzgeç seçer; örnekler yalnızca uyan odalara gider
+    subscriptions = Subscriptions(population=population)
+
+    def publish_frame(event, payload, room):
+        # Mesaj odanın biçimine çevrilir ve yalnızca o odaya gönderilir
+        if subscriptions.format(room) == BINARY:
+            io.emit(event, binary_frame(payload, encoder), to=room)
+        else:
+            io.emit(event, json_frame(payload), to=room)
+
+    emitter = PopulationEmitter(
+        publish_frame,
+        rate=EMIT_RATE,
+        encoder=encoder,
+        raw_codes=True,
+        router=subscriptions,
+    ).start()
+    app.extensions["population_emitter"] = emitter
+
+    def emit_snapshot():
+        # İstemciye aboneliğine uyan örneklerin tam durumu gönderilir
+        instances = subscriptions.select(request.sid, population())
+        snapshot = encoder.snapshot(instances)
+        if formats.format(request.sid) == BINARY:
+            emit("population_snapshot", binary_snapshot(snapshot))
+        else:
+            emit("population_snapshot", {"instances": snapshot})
+
+    def subscribe(subscription):
+        room, previous = subscriptions.subscribe(
+            request.sid, subscription, formats.format(request.sid)
+        )
+        if previous is not None:
+            leave_room(previous)
+        join_room(room)
+        return room
+
+    @io.on("connect")
+    def handle_connect(auth=None):
+        format = (auth or {}).get("format") or request.args.get("format")
+        formats.connect(request.sid, format)
+        # Varsayılan abonelik tüm popülasyonu izler
+        subscribe(Subscription())
+
+    @io.on("disconnect")
+    def handle_disconnect():
+        subscriptions.unsubscribe(request.sid)
+        formats.disconnect(request.sid)
+
+    @io.on("subscribe")
+    def handle_subscribe(filter=None):
+        try:
+            subscription = Subscription.from_json(filter)
+        except (TypeError, ValueError) as e:
+            return {"error": str(e)}
+        room = subscribe(subscription)
+        emit_snapshot()
+        return {"room": room}
+
+    @io.on("unsubscribe")
+    def handle_unsubscribe():
+        room = subscriptions.unsubscribe(request.sid)
+        if room is not None:
+            leave_room(room)
+        return {"room": room}
+
+    @io.on("resync")
+    def handle_resync():
+        # Çalışma sırasında katılan istemciye tam durum gönderilir
+        emit_snapshot()
+
     def io_simulation_status(simulation):
         # send simulation_status signal
         args = simulation.to_json()
@@ -50,67 +138,16 @@ def create_app():
         io.emit("simulation_sampler_status", args)
 
     def io_simulation_instance_status(instance):
-        # send simulation_instance_status signal
-        args = instance.to_json()
-        io.emit("simulation_instance_status", args)
-
-        state = instance.status()
-        # update process
-        global queue
-        global queues
-
-        if queue is not None:
-            # Tekil güncelleme
-            if (
-                state == "Running"
-                and queue.get("id") is not None
-                and instance.id == queue["id"]
-            ):
-                try:
-                    # örneğe formulu uygula
-                    user_formula = queues["formula"]
-                    evaluated_formula = instance.apply_formula(user_formula)
-                    message = "{}\t{}\t{}\t{}".format(
-                        "formula",
-                        instance.id,
-                        user_formula,
-                        evaluated_formula,
-                    )
-                    logger.info(message)
-                except Exception as e:
-                    print("Formul uygulanamadı:", e)
-                    return
-                queue = None  # İşlem tamamlandığında queue'yu temizle
-
-        if queues is not None:  # ?
-            # Çoğul güncelleme
-            if state == "Running" and queues.get("formula") is not None:
-                try:
-                    user_formula = queues["formula"]
-                    # örneğe formulu uygula
-                    evaluated_formula = instance.apply_formula(user_formula)
-                    message = "{}\t{}\t{}\t{}".format(
-                        "formula",
-                        instance.id,
-                        user_formula,
-                        evaluated_formula,
-                    )
-                    logger.info(message)
-                    # Tüm kopyalara formülü uygula
-                    for replica in instance.replicas:
-                        evaluated_formula = replica.apply_formula(user_formula)
-                        message = "{}\t{}\t{}\t{}".format(
-                            "formula",
-                            replica.id,
-                            user_formula,
-                            evaluated_formula,
-                        )
-                        logger.info(message)
-                except Exception as e:
-                    print("Formul uygulanamadı:", e)
-                    return
-
-                queues = None  # İşlem tamamlandığında queues'yu temizle
+        # örnek bir sonraki population_frame mesajında gönderilir
+        emitter.mark(instance)
+
+    def io_simulation_start_progress(job):
+        # arka planda başlatılan simülasyonun ilerlemesi
+        io.emit("simulation_start_progress", job.to_json())
+
+    def io_simulation_command_ack(ack):
+        # komut onayı komutu gönderen istemciye, HTTP ile gönderildiyse herkese
+        io.emit("simulation_command_ack", ack, to=ack.get("sid"))
 
     # Simulation Event Handler
     io_event(
@@ -118,6 +155,26 @@ def create_app():
         io_simulation_sampler_status,
         io_simulation_instance_status,
     )
+    simulation.trigger_command(io_simulation_command_ack)
+    simulation.trigger_job(io_simulation_start_progress)
+
+    def submit_formula(data, sid=None):
+        # Formül komutu örneğin bir sonraki adımında uygulanır
+        arguments = {"sid": sid} if sid else {}
+        formula = data.get("formula", data.get("codes"))
+        return simulation.submit(
+            data.get("id"), "formula", formula=formula, **arguments
+        )
+
+    @io.on("update")
+    def handle_update(data):
+        # Onay simulation_command_ack olayıyla bu istemciye gönderilir
+        if data.get("id") is None:
+            return {"error": "id "}
+        try:
+            return submit_formula(data, sid=request.sid)
+        except ValueError as e:
+            return {"error": str(e)}
 
     def application_log_function(type, message):
         # uygulama log sinyalini gönder
@@ -146,6 +203,11 @@ def create_app():
 
         return response
 
+    @app.route("/socket/v1/simulation/emitter", methods=["GET"])
+    def get_emitter():
+        # kuyruk derinliği ve birleştirilen güncelleme sayısı
+        return jsonify(emitter.metrics())
+
     @app.route("/socket/v1/simulation/status", methods=["GET"])
     def get_status():
         try:
@@ -167,11 +229,10 @@ def create_app():
 
     @app.route("/socket/v1/simulation/update/all", methods=["POST"])
     def post_update_all():
-        global queues
         # get request
-        queues = request.json
+        data = request.json
         # request
-        formula = queues.get("formula")
+        formula = data.get("formula")
 
         # logger
         message = "{}\t{}\t{}\t{}".format(
@@ -183,24 +244,26 @@ def create_app():
             return jsonify({"error": "formula "}), 400
 
         # proccess
-
-        # default response
-        response = queues
+        # Formül popülasyonun sütunları üzerinde bir kez değerlendirilir
+        try:
+            response = simulation.apply_formula(formula)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            return jsonify({"error": f"formula {e}"}), 400
+        logger.info("{}\t{}\t{}".format("formula", formula, response.get("count")))
 
         return jsonify(response)
 
     @app.route("/socket/v1/simulation/update", methods=["POST"])
     def post_update():
-        global queue
         # get request
-        queue = request.json
+        data = request.json
         # request
-        id = queue.get("id")
-        codes = queue.get("codes")
+        id = data.get("id")
+        codes = data.get("formula", data.get("codes"))
 
         # logger
         message = "{}\t{}\t{}\t{}".format(
-            "update", request.origin, request.remote_addr, queue
+            "update", request.origin, request.remote_addr, data
         )
         logger.info(message)
 
@@ -211,9 +274,11 @@ def create_app():
             return jsonify({"error": "id "}), 400
 
         # proccess
-
-        # default response
-        response = queue
+        # Komutlar örnek kimliğine göre kuyruğa alınır; birbirinin üzerine yazılmaz
+        try:
+            response = submit_formula(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         return jsonify(response)
 
@@ -231,6 +296,18 @@ def create_app():
         number_of_replicas = data.get("number_of_replicas", 2)
         number_of_generation = data.get("number_of_generation", 2)
         max_match_limit = data.get("max_match_limit", 2)
+        workers = data.get("workers", 1)
+        crossover_epoch = data.get("crossover_epoch")
+        crossover_deaths = data.get("crossover_deaths")
+        ramp_rate = data.get("ramp_rate")
+        max_starting = data.get("max_starting")
+        batch_physics = data.get("batch_physics", False)
+        integrator = data.get("integrator")
+        tolerance = data.get("tolerance")
+        time_step = data.get("time_step")
+        interaction_radius = data.get("interaction_radius")
+        exclusion_strength = data.get("exclusion_strength", 1.0)
+        opening_angle = data.get("opening_angle")
 
         # Check if lifetime_seconds is None and assign float('inf') instead
         if lifetime_seconds is None:
@@ -245,28 +322,51 @@ def create_app():
         )
         logger.info(message)
         # proccess
-        simulation.start(
-            # number_of_instances olarak değiştirilmeli
-            number_of_instance=number_of_instances,
-            lifetime_seconds=lifetime_seconds,
-            lifecycle=lifecycle,
-            simulation_type=simulation_type,
-            #
-            max_replicas=number_of_replicas,
-            max_generation=number_of_generation,
-            max_match_limit=max_match_limit,
-        )
+        # Yeni simülasyonun örnekleri ilk mesajda tam olarak gönderilir
+        encoder.reset()
+        # Örnekler arka planda oluşturulur; istek iş kimliğiyle hemen döner
+        try:
+            job = simulation.start_async(
+                # number_of_instances olarak değiştirilmeli
+                number_of_instance=number_of_instances,
+                lifetime_seconds=lifetime_seconds,
+                lifecycle=lifecycle,
+                simulation_type=simulation_type,
+                #
+                max_replicas=number_of_replicas,
+                max_generation=number_of_generation,
+                max_match_limit=max_match_limit,
+                workers=workers,
+                crossover_epoch=crossover_epoch,
+                crossover_deaths=crossover_deaths,
+                ramp_rate=ramp_rate,
+                max_starting=max_starting,
+                batch_physics=batch_physics,
+                integrator=integrator,
+                tolerance=tolerance,
+                time_step=time_step,
+                interaction_radius=interaction_radius,
+                exclusion_strength=exclusion_strength,
+                opening_angle=opening_angle,
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         # default response
         response = {
             "simulation_type": simulation_type.value,
-            "simulation_status": SimulationStatus.Stopped.value,
+            "simulation_status": SimulationStatus.Running.value,
+            **job.to_json(),
         }
 
-        if simulation.sampler:
-            response = simulation.to_json()
+        return jsonify(response), 202
 
-        return jsonify(response)
+    @app.route("/socket/v1/simulation/start/<job_id>", methods=["GET"])
+    def get_start_job(job_id):
+        job = simulation.jobs.get(job_id)
+        if job is None:
+            return jsonify({"error": f"Unknown job: {job_id}"}), 404
+        return jsonify(job.to_json())
 
     @app.route("/socket/v1/simulation/pause", methods=["GET"])
     def get_pause():
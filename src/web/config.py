@@ -13,6 +13,8 @@ HTTPS_PORT = os.environ.get("HTTPS_PORT")
 TCP_PORT = os.environ.get("TCP_PORT")
 SOCKET_PORT = os.environ.get("SOCKET_PORT")
 DEBUG = os.environ.get("SWICH_TRACKING_DEBUG")
+# Örnek durumlarının Socket.IO üzerinden saniyede kaç kez toplu gönderileceği
+EMIT_RATE = float(os.environ.get("EMIT_RATE", 10))
 
 httpPortNumber = int(HTTP_PORT)
 httpsPortNumber = int(HTTPS_PORT)
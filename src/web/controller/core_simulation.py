@@ -1,8 +1,27 @@
 # src/web/controller/core_simulation.py
 
 import threading
+import time
+
+import numpy as np
+
 from src.package import Logger
+from src.life.particles.clock import REAL_CLOCK, VirtualClock
+from src.life.particles.command_queue import CommandQueue
 from src.life.particles.core import Core
+from src.life.particles.fitness_index import FitnessIndex
+from src.life.particles.formula import (
+    FormulaError,
+    attribute_columns,
+    compile_formula,
+    evaluate_columns,
+)
+from src.life.particles.gate import Gate
+from src.life.particles.population import PopulationStore
+from src.life.particles.random_buffer import RandomBuffer
+from src.life.particles.scorer import BatchScorer
+from src.life.particles.scheduler import DiscreteEventScheduler, TickScheduler
+from src.web.controller.crossover_scheduler import CrossoverScheduler
 
 
 class CoreSimulation:
@@ -24,6 +43,16 @@ class CoreSimulation:
         max_replicas: int = 2,
         max_generation: int = 2,
         max_match_limit: int = 2,
+        batch_scoring: bool = False,
+        use_scheduler: bool = False,
+        scheduler_workers: int = 4,
+        use_store: bool = False,
+        virtual_time: bool = False,
+        seed: int = None,
+        crossover_epoch: float = None,
+        crossover_deaths: int = None,
+        ramp_rate: float = None,
+        max_starting: int = None,
     ) -> None:
         """
         Çekirdek simulasyonunu oluştur.
@@ -32,6 +61,20 @@ class CoreSimulation:
         :param number_of_instance: Oluşturulacak örnek sayısı
         :param lifetime_seconds: Örneklerin yaşam süresi saniye cinsinden.
         :param lifecycle: Örneklerin saniyedeki yaşam döngüsü.
+        :param batch_scoring: Kod testleri her döngüde tüm popülasyon için toplu yapılır.
+        :param use_scheduler: Örnekler kendi thread'leri yerine ortak zamanlayıcıda çalışır.
+        :param scheduler_workers: Zamanlayıcının çalışan thread sayısı.
+        :param use_store: Örneklerin durum bilgileri ortak NumPy sütunlarında tutulur.
+        :param virtual_time: Örnekler sanal saatle ayrık olay motorunda çalışır;
+            adımlar arasında beklenmez. Kod testleri örneklerin kendi adımlarında yapılır.
+        :param seed: Rastgele sayı tohumu; her örneğin üreteci bu tohumdan türetilir.
+        :param crossover_epoch: Çaprazlama her ölümde değil, ayrı bir thread'de bu
+            süreyle (saniye) dönemler halinde bir kez çalışır.
+        :param crossover_deaths: Bu sayıda ölüm biriktiğinde çaprazlama dönem
+            beklenmeden çalışır (dönem verilmezse yaşam döngüsü kullanılır).
+        :param ramp_rate: Örnekler saniyede en fazla bu sayıda oluşturulur.
+        :param max_starting: Aynı anda başlatılmakta olan (ilk adımını henüz
+            bildirmemiş) en fazla örnek sayısı.
         """
         self.name = name
         self.number_of_instance = number_of_instance
@@ -41,10 +84,61 @@ class CoreSimulation:
         self.max_replicas = max_replicas
         self.max_generation = max_generation
         self.max_match_limit = max_match_limit
+        self.virtual_time = virtual_time
+        # Toplu puanlama gerçek zamanlı döngüde çalıştığı için sanal zamanda kullanılmaz
+        self.batch_scoring = batch_scoring and not virtual_time
+        self.scorer = BatchScorer()
+        self.seed = seed
+        self.random = RandomBuffer(seed=seed)
+        self.store = self.create_store() if use_store else None
+        # Örneklerin adım başında kendi komutlarını aldığı kuyruk
+        self.commands = CommandQueue()
+        # Yaşam süresi ölçümlerinin yapıldığı saat
+        self.clock = VirtualClock() if virtual_time else REAL_CLOCK
+        # örneklerin duraklatıldığında beklediği ortak kapı
+        self._gate = Gate(clock=self.clock)
+        if virtual_time:
+            self.scheduler = DiscreteEventScheduler(
+                name=name, clock=self.clock, gate=self._gate
+            )
+        elif use_scheduler:
+            self.scheduler = TickScheduler(
+                number_of_workers=scheduler_workers, name=name
+            )
+        else:
+            self.scheduler = None
+        # Örneklerin oluşturulma hızı; sanal zamanda tüm örnekler aynı anda başlar
+        if ramp_rate is not None and ramp_rate <= 0:
+            raise ValueError("Ramp rate must be a positive value.")
+        if max_starting is not None and max_starting <= 0:
+            raise ValueError("Max starting must be a positive value.")
+        self.ramp_rate = None if virtual_time else ramp_rate
+        self.max_starting = None if virtual_time else max_starting
+        self._starting = {}  # ilk adımını bekleyen örneklerin kimlikleri
+        self._starting_slots = (
+            threading.BoundedSemaphore(self.max_starting) if self.max_starting else None
+        )
         #
         self.number_of_instance_created = 0
+        self.error = None  # örnekler oluşturulurken oluşan son hata
         self.instances = []  # örnek havuzu
         self.fitness_values = {}  # Fitness değerlerini
+        # Eşleşebilecek örneklerin fitness sırasına göre artımlı dizini
+        self.fitness_index = FitnessIndex()
+        # Dönem çaprazlamasından sonra dizinden çıkarılacak duran örnekler
+        self._stopped_ids = []
+        # Çaprazlamayı dönemler halinde çalıştıran zamanlayıcı; sanal zamanda
+        # motor tek thread'de çalıştığı için çaprazlama ölümde yapılır
+        if (crossover_epoch or crossover_deaths) and not virtual_time:
+            self.crossover = CrossoverScheduler(
+                crossover=self._run_crossover_epoch,
+                epoch=crossover_epoch or lifecycle,
+                deaths=crossover_deaths,
+                gate=self._gate,
+                name=f"{name}.crossover",
+            )
+        else:
+            self.crossover = None
         # events
         self.event_function = None
         self.event_function_instance = None
@@ -70,15 +164,22 @@ class CoreSimulation:
             "number_of_instance_created": self.number_of_instance_created,
             "number_of_instance_matched": CoreSimulation.match_count,
             "number_of_instance_replicated": CoreSimulation.number_of_copies,
+            "crossover": self.crossover.metrics() if self.crossover else None,
         }
 
     def instance_status(self, instance):
+        # İlk bildirimini yapan örnek başlatılıyor sayılmaz
+        if self._starting and self._starting.pop(instance.id, None):
+            self._starting_slots.release()
         state = instance.status()
         if state == "Created":
             self.instances.append(instance)
 
         if state == "Running":
             self.fitness_values[instance.id] = instance.fitness
+            # Eşleşme sınırına ulaşan örnekler dizine yeniden eklenmez
+            if instance.match_count < self.max_match_limit:
+                self.fitness_index.update(instance, instance.fitness)
 
         if state == "Paused":
             pass
@@ -87,9 +188,26 @@ class CoreSimulation:
             pass
 
         if state == "Stopped":
+            # Duran örnek bekleyen komutlarını artık uygulamaz
+            self.reject_commands(instance.id, f"Instance stopped: {instance.id}")
+            # Duran örnekler son çaprazlamada eşleşebilmek için dizinde kalır;
+            # dönem çaprazlamasında bir sonraki çalıştırmadan sonra çıkarılır
+            if self.crossover is not None:
+                self._stopped_ids.append(instance.id)
             # Çaprazlama işlemi daha önce yapılmadıysa ve tüm çekirdekler oluşturulduysa
-            if self.number_of_instance_created == self.number_of_instance:
-                self.perform_crossover(max_match_limit=self.max_match_limit)
+            # Simülasyon durdurulduysa yeni örnek üretilmez
+            if (
+                self.number_of_instance_created == self.number_of_instance
+                and not self._stop_event.is_set()
+            ):
+                if self.crossover is not None:
+                    self.crossover.request()
+                else:
+                    self.perform_crossover(max_match_limit=self.max_match_limit)
+
+        # Durdurulan simülasyona yalnızca durma bilgisi iletilir
+        if self._stop_event.is_set() and state != "Stopped":
+            return
 
         if self.event_function_instance:
             self.event_function_instance(instance)  # Event işlevini çağır
@@ -130,6 +248,9 @@ class CoreSimulation:
 
             # Oluşturulmaya devam edilecek mi?
             if condition:
+                # Başlatılan örnek sayısı sınırdaysa biri ilk adımını bildirene kadar beklenir
+                if not self._acquire_starting():
+                    return False
                 instance = self.create_instance(
                     name=self.name,  # name değişkenini self.name olarak güncelliyorum
                     lifetime_seconds=self.lifetime_seconds,
@@ -141,8 +262,12 @@ class CoreSimulation:
                 )
                 # olay dinleyici tetiği yapılandır
                 instance.trigger_event(self.instance_status)
+                # çalışma zamanı ayarlarını yapılandır
+                self._bind_instance(instance)
                 # nesneyi havuza ekle
                 self.instances.append(instance)
+                if self._starting_slots is not None:
+                    self._starting[instance.id] = True
                 # nesneyi başlat
                 instance.start()
                 # oluşturuldu bilgisini arttır
@@ -154,16 +279,193 @@ class CoreSimulation:
             return condition
 
         except TypeError as e:
+            self.error = str(e)
             self.logger.error(f"Sampler Simulation Error Type : {e}")
         except Exception as e:
+            self.error = str(e)
             self.logger.error(f"Sampler Simulation Error      : {e}")
 
+    def _bind_instance(self, instance):
+        """
+        Simülasyonun çalışma zamanı ayarlarını örneğe aktarır.
+        Kopyalar bu ayarları üst örnekten devralır.
+
+        :param instance: Çekirdek örneği.
+        """
+        instance.batch_scoring = self.batch_scoring
+        instance.scheduler = self.scheduler
+        instance.commands = self.commands
+        instance._gate = self._gate
+        instance.clock = self.clock
+        # Örneğin üreteci oluşturulma sırasına göre simülasyon tohumundan türetilir
+        instance.random = self.random.spawn(self.number_of_instance_created)
+        if self.store is not None:
+            instance.bind_store(self.store)
+
+    def create_store(self) -> PopulationStore:
+        """
+        Örneklerin durum bilgilerinin tutulacağı popülasyon deposunu oluşturur.
+        """
+        return PopulationStore()
+
+    def population(self) -> list:
+        """
+        Havuzdaki örnekleri ve tüm kopyalarını döndürür.
+        """
+        return self._all_instances()
+
+    def population_snapshot(self) -> list:
+        """
+        Popülasyonun durum bilgilerini sütunlardan tek geçişte JSON uyumlu olarak döndürür.
+        """
+        if self.store is None:
+            return [instance.to_json() for instance in self._all_instances()]
+        return self.store.snapshot()
+
+    def _live_instances(self) -> list:
+        """
+        Havuzdaki çalışan örnekleri tekil olarak döndürür.
+        """
+        live_instances = {}
+        for instance in self.instances:
+            if not instance._stop_event.is_set():
+                live_instances[instance.id] = instance
+        return list(live_instances.values())
+
+    def _all_instances(self) -> list:
+        """
+        Havuzdaki örnekleri ve tüm kopyalarını tekil olarak döndürür.
+        """
+        all_instances = {}
+        pending = list(self.instances)
+        while pending:
+            instance = pending.pop()
+            if instance.id in all_instances:
+                continue
+            all_instances[instance.id] = instance
+            pending.extend(instance.replicas)
+        return list(all_instances.values())
+
+    def submit(self, id: int, action: str, **arguments) -> dict:
+        """
+        Örneğe bir sonraki adımında uygulanacak bir komut gönderir.
+
+        :param id: Örnek kimliği.
+        :param action: Komut adı (ör. "formula").
+        :return: Komut sözlüğü.
+        """
+        if action == "formula":
+            # Geçersiz formüller kuyruğa alınmadan reddedilir
+            formula = arguments.get("formula")
+            if not isinstance(formula, str):
+                raise FormulaError("Formula must be a string")
+            compile_formula(formula)
+        command = self.commands.push(id, action, **arguments)
+        # Çalışmayan örneklere gönderilen komutlar beklemeden reddedilir; örnek
+        # durum kontrolünden önce durduysa komut durma bildiriminde onaylanır
+        if not any(
+            instance.id == id and not instance._stop_event.is_set()
+            for instance in self._all_instances()
+        ):
+            self.reject_commands(id, f"Unknown instance: {id}")
+        return command
+
+    def reject_commands(self, id: int, error: str) -> int:
+        """
+        Örneğin bekleyen komutlarını başarısız olarak onaylar.
+
+        :param id: Örnek kimliği.
+        :param error: Onaylarda gönderilecek hata mesajı.
+        :return: Reddedilen komut sayısı.
+        """
+        commands = self.commands.drain(id)
+        for command in commands:
+            self.commands.acknowledge(command, error=error)
+        return len(commands)
+
+    def apply_formula(self, formula: str) -> dict:
+        """
+        Formülü çalışan tüm örnekler ve kopyaları için sütunlar üzerinde bir kez
+        değerlendirir ve yaşam sürelerini tek geçişte günceller.
+
+        :param formula: Kullanıcı formülü (ör. "5.5 * self.generation").
+        :return: Güncellenen örnek sayısı ve sonuçların özeti.
+        """
+        if self.store is not None:
+            values = self.store.apply_formula(formula)
+        else:
+            instances = [
+                instance
+                for instance in self._all_instances()
+                if not instance._stop_event.is_set()
+            ]
+            values = evaluate_columns(
+                formula, attribute_columns(instances), len(instances)
+            )
+            for instance, value in zip(instances, values.tolist()):
+                instance.lifetime_seconds = value
+        return self.formula_summary(formula, values)
+
+    @staticmethod
+    def formula_summary(formula: str, values: np.ndarray) -> dict:
+        """
+        Formül sonuçlarının özetini döndürür.
+        """
+        summary = {"formula": formula, "count": len(values)}
+        if len(values):
+            finite = values[np.isfinite(values)]
+            summary["min"] = float(finite.min()) if len(finite) else None
+            summary["max"] = float(finite.max()) if len(finite) else None
+            summary["mean"] = float(finite.mean()) if len(finite) else None
+        return summary
+
+    def score_population(self) -> int:
+        """
+        Çalışan tüm örneklerin kodlarını tek geçişte test eder.
+
+        :return: Puanlanan örnek sayısı.
+        """
+        return self.scorer.score_instances(self._live_instances())
+
+    def _run_scoring_loop(self):
+        """
+        Her yaşam döngüsünde popülasyonu toplu olarak puanlar.
+        """
+        while not self._stop_event.wait(self.lifecycle):
+            if not self._paused:
+                self.score_population()
+
+    def _acquire_starting(self) -> bool:
+        """
+        Yeni örnek için başlatma izni alır; simülasyon durdurulursa False döner.
+        """
+        if self._starting_slots is None:
+            return True
+        # Durdurma sinyali kısa aralıklarla denetlenir
+        timeout = min(self.lifecycle, 0.1)
+        while not self._stop_event.is_set():
+            if self._starting_slots.acquire(timeout=timeout):
+                # Durdurulan örneklerin bıraktığı izinle yeni örnek başlatılmaz
+                if self._stop_event.is_set():
+                    self._starting_slots.release()
+                    return False
+                return True
+        return False
+
     def _run_simulation_loop(self):
         """
-        Simülasyon döngüsünü çalıştırır.
+        Simülasyon döngüsünü çalıştırır. Hız sınırı verildiyse örnekler
+        ramp_rate hızında oluşturulur.
         """
+        interval = 1 / self.ramp_rate if self.ramp_rate else 0
+        next_time = time.monotonic()
         while not self._paused and not self._exit_flag and self.run_simulation():
-            pass
+            if interval:
+                next_time += interval
+                delay = next_time - time.monotonic()
+                # durdurma sinyali gelirse bekleme hemen sona erer
+                if delay > 0 and self._stop_event.wait(delay):
+                    break
 
     def trigger_event(self, event_function):
         """
@@ -193,8 +495,8 @@ class CoreSimulation:
         if self.event_function:
             self.event_function(self)  # Event işlevini çağır
         self.status()
-        for instance in self.instances:
-            instance.pause()
+        # Tüm örnekler ortak kapıda bekler
+        self._gate.close()
 
     def resume_simulation(self):
         """
@@ -205,29 +507,83 @@ class CoreSimulation:
         if self.event_function:
             self.event_function(self)  # Event işlevini çağır
         self.status()
-        for instance in self.instances:
-            instance.resume()
+        # Ortak kapıda bekleyen tüm örnekler uyandırılır
+        self._gate.open()
+        if self.scheduler is not None:
+            # Zamanlayıcıda bekletilen örnekler yeniden planlanır
+            self.scheduler.resume()
 
-    def stop_simulation(self):
+    def stop_simulation(self, timeout: float = None) -> list:
         """
         Simülasyonu durdurur.
+
+        :param timeout: Örneklerin ve kopyaların bitmesi için beklenecek toplam süre.
+            None ise bitmeleri beklenmez.
+        :return: Süre içinde bitmeyen örneklerin kimlikleri.
         """
         self._paused = False
         self._stop_event.set()  # _stop_event'i ayarlayın
         if self.event_function:
             self.event_function(self)  # Event işlevini çağır
         self.status()
-        for instance in self.instances:
-            instance.stop()
+        instances = self._all_instances()
+        for instance in instances:
+            instance.stop(notify=False)
+        # Kapıda bekleyen tüm örnekler tek seferde uyandırılır
+        self._gate.notify()
 
         self._exit_flag = True  # Uygulamayı sonlandırmak için bayrağı ayarla
 
+        if timeout is None:
+            if self.scheduler is not None:
+                self.scheduler.stop()
+            if self.crossover is not None:
+                self.crossover.stop()
+            return []
+
+        deadline = time.time() + timeout
+        if self.scheduler is not None:
+            self.scheduler.stop(timeout=timeout)
+        if self.crossover is not None:
+            self.crossover.stop(timeout=max(0.0, deadline - time.time()))
+        stragglers = []
+        current_thread = threading.current_thread()
+        for instance in instances:
+            if not instance.is_alive() or instance is current_thread:
+                continue
+            instance.join(max(0.0, deadline - time.time()))
+            if instance.is_alive():
+                stragglers.append(instance.id)
+
+        if stragglers:
+            message = "{:.7s}\t{}/{}\t{}".format(
+                "stragglers",
+                len(stragglers),
+                len(instances),
+                stragglers,
+            )
+            self.logger.warning(message)
+        return stragglers
+
     def start_simulation(self):
         """
-        Simülasyonu başlatır.
+        Simülasyonu başlatır. Durdurulan simülasyon yeniden başlatılmaz.
         """
+        if self._stop_event.is_set():
+            return
         self._paused = False
         self.status()
+        if self.virtual_time:
+            # Tüm örnekler aynı sanal anda başlar; motor oluşturmadan sonra çalışır
+            self._run_simulation_loop()
+            self.scheduler.start()
+            return
+        if self.scheduler is not None:
+            self.scheduler.start()
+        if self.crossover is not None:
+            self.crossover.start()
+        if self.batch_scoring:
+            threading.Thread(target=self._run_scoring_loop, daemon=True).start()
         self._run_simulation_loop()
 
     def status(self):
@@ -260,48 +616,46 @@ class CoreSimulation:
 
         return state
 
-    def perform_crossover(self, max_match_limit: int = 2):
-        # Uyumlu core çiftlerini seçin
-        compatible_cores = [
-            core for core in self.instances if core.id in self.fitness_values.keys()
-        ]
+    def _run_crossover_epoch(self) -> int:
+        """
+        Dönem çaprazlamasını çalıştırır. Son çalıştırmadan bu yana duran örnekler
+        bu çaprazlamaya katılır, ardından fitness dizininden çıkarılır.
 
-        compatible_cores.sort(
-            key=lambda x: self.fitness_values[x.id], reverse=True
-        )  # Fitness değerlerine göre sırala
+        :return: Oluşturulan çift sayısı.
+        """
+        stopped, self._stopped_ids = self._stopped_ids, []
+        pairs = self.perform_crossover(self.max_match_limit)
+        for id in stopped:
+            self.fitness_index.remove(id)
+        return pairs
 
-        # Çift sayısını hesapla
-        number_of_pairs = len(compatible_cores) // 2
+    def perform_crossover(self, max_match_limit: int = 2) -> int:
+        """
+        Fitness dizininin tek taramada alınan tutarlı görüntüsünden çiftler
+        oluşturur ve her çiftten yeni örnek üretir.
 
-        # Eşleştirilmiş çekirdek kimliklerini izleyin
-        paired_core_ids = []
+        :param max_match_limit: Bir örneğin en fazla eşleşme sayısı.
+        :return: Oluşturulan çift sayısı.
+        """
+        # Uyumlu core çiftleri fitness dizininden sırasıyla seçilir; çift
+        # sayısı dizindeki örneklerin yarısıyla sınırlıdır ve yığından yalnızca
+        # okunan kayıtlar alınır. Eşleşme sınırına ulaşan çekirdeğin çifti atlanır
+        pairs = self.fitness_index.pairs(
+            can_pair=lambda core: core.match_count < max_match_limit,
+            limit=len(self.fitness_index) // 2,
+        )
 
         # Çiftlerden yeni core'lar oluşturun
-        for i in range(number_of_pairs):
-            # türler
-            female = compatible_cores[i * 2]
-            male = compatible_cores[i * 2 + 1]
-
-            # Çekirdeklerden herhangi birinin zaten eşleştirilmiş olup olmadığını
-            # ve maksimum eşleşme sınırını kontrol edin
-            if (
-                female.id in paired_core_ids
-                or male.id in paired_core_ids
-                or female.match_count >= max_match_limit
-                or male.match_count >= max_match_limit
-            ):
-                # Çekirdeklerden herhangi biri daha önce eşleştirilmişse
-                # veya maksimum sınıra ulaşıldıysa eşleştirmeyi atlayın
-                continue
-
-            # Eşleştirilmiş çekirdek kimliklerini listeye ekleyin
-            paired_core_ids.extend([female.id, male.id])
-
+        for female, male in pairs:
             # eşlenme sayaçlarını arttır
             female.match_count += 1
             male.match_count += 1
             # toplam eşleşme sayısını arttır
             CoreSimulation.match_count += 1
+            # sınıra ulaşan çekirdekler dizinden çıkarılır
+            for core in (female, male):
+                if core.match_count >= max_match_limit:
+                    self.fitness_index.remove(core.id)
 
             # cinsiyet tanımlaması yapılabilir?
             # female.sex="f"
@@ -345,6 +699,8 @@ class CoreSimulation:
             if self.event_function:
                 self.event_function(self)
 
+        return len(pairs)
+
 
 # Example Usage
 if __name__ == "__main__":
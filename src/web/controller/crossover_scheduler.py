@@ -0,0 +1,163 @@
+# src/web/controller/crossover_scheduler.py
+
+import threading
+import time
+
+from src.package import Logger
+
+
+class CrossoverScheduler:
+    """
+    Çaprazlamayı ayrı bir thread'de dönemler halinde çalıştıran zamanlayıcı.
+
+    Ölen her çekirdek yalnızca bir istek bırakır; çaprazlama her dönemde
+    (epoch) veya belirlenen sayıda ölüm biriktiğinde bir kez çalışır. Aynı
+    dönemde gelen istekler tek çalıştırmada birleştirilir; böylece birlikte
+    ölen çekirdekler çaprazlamayı eş zamanlı olarak tekrar tekrar çalıştırmaz.
+    """
+
+    def __init__(
+        self,
+        crossover,
+        epoch: float = 1.0,
+        deaths: int = None,
+        gate=None,
+        name: str = "crossover",
+    ) -> None:
+        """
+        :param crossover: Çaprazlamayı yapan işlev; oluşturulan çift sayısını döndürür.
+        :param epoch: İki çalıştırma arasındaki en uzun süre (saniye).
+        :param deaths: Bu sayıda ölüm biriktiğinde dönem beklenmeden çalıştırılır.
+        :param gate: Simülasyon kapısı; kapı kapalıyken çaprazlama yapılmaz.
+        :param name: Zamanlayıcı adı.
+        """
+        if epoch <= 0:
+            raise ValueError("Epoch must be a positive value.")
+        if deaths is not None and deaths <= 0:
+            raise ValueError("Deaths must be a positive value.")
+        self.crossover = crossover
+        self.epoch = epoch
+        self.deaths = deaths
+        self.gate = gate
+        self.name = name
+        self._pending = 0  # son çalıştırmadan bu yana ölüm sayısı
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        # metrics
+        self.requests = 0  # toplam istek (ölüm) sayısı
+        self.runs = 0  # çaprazlama çalıştırma sayısı
+        self.pairs = 0  # toplam oluşturulan çift sayısı
+        self.last_pairs = 0  # son dönemde oluşturulan çift sayısı
+        self.last_duration = 0.0  # son çaprazlamanın süresi (saniye)
+        self.total_duration = 0.0
+        # Log ayarlarını yapılandırma
+        self.logger = Logger(name=f"/sampler/{name}").get_logger()
+
+    @property
+    def pending(self) -> int:
+        """
+        Bir sonraki çalıştırmayı bekleyen ölüm sayısı.
+        """
+        return self._pending
+
+    def request(self):
+        """
+        Bir çekirdeğin öldüğünü bildirir. Çekirdeğin thread'inde çağrılır ve
+        çaprazlama yapmaz.
+        """
+        with self._lock:
+            self._pending += 1
+            self.requests += 1
+            ready = self.deaths is not None and self._pending >= self.deaths
+        if ready:
+            self._wake_event.set()
+
+    def run_once(self) -> int:
+        """
+        Bekleyen ölüm varsa çaprazlamayı bir kez çalıştırır.
+
+        :return: Oluşturulan çift sayısı; çalıştırılmadıysa None.
+        """
+        with self._lock:
+            if not self._pending:
+                return None
+            if self.gate is not None and not self.gate.is_open():
+                # Duraklatılan simülasyonda istekler bekletilir
+                return None
+            self._pending = 0
+        started = time.perf_counter()
+        pairs = self.crossover() or 0
+        duration = time.perf_counter() - started
+        self.runs += 1
+        self.pairs += pairs
+        self.last_pairs = pairs
+        self.last_duration = duration
+        self.total_duration += duration
+        return pairs
+
+    def metrics(self) -> dict:
+        """
+        Zamanlayıcının ölçümlerini döndürür.
+        """
+        return {
+            "epoch": self.epoch,
+            "deaths": self.deaths,
+            "pending": self._pending,
+            "requests": self.requests,
+            "runs": self.runs,
+            # birleştirilen (ayrıca çalıştırılmayan) istek sayısı
+            "collapsed": self.requests - self._pending - self.runs,
+            "pairs": self.pairs,
+            "last_pairs": self.last_pairs,
+            "last_duration": self.last_duration,
+            "mean_duration": self.total_duration / self.runs if self.runs else 0.0,
+        }
+
+    def _run_loop(self):
+        while not self._stop_event.is_set():
+            self._wake_event.wait(self.epoch)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.run_once()
+            except Exception as e:
+                self.logger.error(f"Crossover Error : {e}")
+
+    def start(self):
+        """
+        Çaprazlama thread'ini başlatır.
+        """
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run_loop, name=self.name, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = None):
+        """
+        Çaprazlama thread'ini durdurur; bekleyen istekler çalıştırılmaz.
+
+        :param timeout: Thread'in bitmesi için beklenecek en fazla süre.
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        return self
+
+
+# Example Usage
+if __name__ == "__main__":
+    scheduler = CrossoverScheduler(lambda: 1, epoch=0.1, deaths=5).start()
+    for _ in range(12):
+        scheduler.request()
+    time.sleep(0.3)
+    scheduler.stop(timeout=1)
+    print("Metrics:", scheduler.metrics())
@@ -1,7 +1,19 @@
 # src/web/controller/particle_simulation.py
 
+import threading
+
+import numpy as np
+
+from src.life.particles.barnes_hut import BarnesHut
+from src.life.particles.integrator import ParticleIntegrator, create_integrator
 from src.life.particles.vector import Vector
 from src.life.particles.particle import Particle
+from src.life.particles.population import (
+    PARTICLE_COLUMNS,
+    PARTICLE_VECTOR_COLUMNS,
+    PopulationStore,
+)
+from src.life.particles.spatial_hash import SpatialHash, pair_forces
 from src.web.controller.core_simulation import CoreSimulation
 
 
@@ -20,6 +32,23 @@ class ParticleSimulation(CoreSimulation):
         max_replicas: int = 2,
         max_generation: int = 2,
         max_match_limit: int = 2,
+        batch_scoring: bool = False,
+        use_scheduler: bool = False,
+        scheduler_workers: int = 4,
+        use_store: bool = False,
+        virtual_time: bool = False,
+        seed: int = None,
+        crossover_epoch: float = None,
+        crossover_deaths: int = None,
+        ramp_rate: float = None,
+        max_starting: int = None,
+        batch_physics: bool = False,
+        integrator: str = None,
+        tolerance: float = None,
+        time_step: float = None,
+        interaction_radius: float = None,
+        exclusion_strength: float = 1.0,
+        opening_angle: float = None,
     ) -> None:
         """
         Particle simulasyonunu oluştur.
@@ -28,7 +57,48 @@ class ParticleSimulation(CoreSimulation):
         :param number_of_instance: Oluşturulacak örnek sayısı
         :param lifetime_seconds: Örneklerin yaşam süresi saniye cinsinden.
         :param lifecycle: Örneklerin saniyedeki yaşam döngüsü.
+        :param batch_scoring: Kod testleri her döngüde tüm popülasyon için toplu yapılır.
+        :param use_scheduler: Örnekler kendi thread'leri yerine ortak zamanlayıcıda çalışır.
+        :param scheduler_workers: Zamanlayıcının çalışan thread sayısı.
+        :param use_store: Örneklerin durum bilgileri ortak NumPy sütunlarında tutulur.
+        :param virtual_time: Örnekler sanal saatle ayrık olay motorunda çalışır.
+        :param seed: Rastgele sayı tohumu; her örneğin üreteci bu tohumdan türetilir.
+        :param crossover_epoch: Çaprazlama ayrı bir thread'de bu süreyle dönemler
+            halinde çalışır.
+        :param crossover_deaths: Bu sayıda ölümde çaprazlama dönem beklenmeden çalışır.
+        :param ramp_rate: Örnekler saniyede en fazla bu sayıda oluşturulur.
+        :param max_starting: Aynı anda başlatılmakta olan en fazla örnek sayısı.
+        :param batch_physics: Tüm parçacıkların kinematiği her döngüde ortak N x 3
+            sütunlarda tek vektörel adımda ilerletilir (popülasyon deposu kullanılır).
+        :param integrator: Konum ve hızı ilerleten yöntem (euler,
+            semi_implicit_euler, verlet); verilmezse Particle.update'in yarı örtük
+            Euler adımı kullanılır.
+        :param tolerance: Verilirse adımlar bu hata toleransıyla uyarlamalı
+            alt adımlara bölünür.
+        :param time_step: Sabit zaman adımı; verilmezse adımlar rastgele seçilir.
+        :param interaction_radius: Verilirse bu yarıçaptaki parçacıklar her
+            döngüde hücre listesiyle bulunur ve kısa menzilli dışlama ve Coulomb
+            kuvvetleri uygulanır (popülasyon deposu kullanılır).
+        :param exclusion_strength: Aynı spinli parçacıkların dışlama itmesi.
+        :param opening_angle: Verilirse parçacıklara rastgele kuvvet yerine bu
+            açılma açısıyla Barnes-Hut sekizli ağacından hesaplanan uzun menzilli
+            Coulomb kuvvetleri uygulanır (popülasyon deposu kullanılır).
+            Parçacıklar [-1, 1] küpünde rastgele konumlarda doğar.
         """
+        # Yöntem adı ve tolerans örnekler oluşturulmadan doğrulanır
+        create_integrator(integrator, tolerance)
+        if time_step is not None and time_step <= 0:
+            raise ValueError("Time step must be a positive value.")
+        # Toplu kinematik sütunlar üzerinde çalıştığı için depo gerekir;
+        # sanal zamanda parçacıklar kendi adımlarında ilerler
+        batch_physics = batch_physics and not virtual_time
+        if interaction_radius is not None and interaction_radius <= 0:
+            raise ValueError("Interaction radius must be a positive value.")
+        if opening_angle is not None and opening_angle < 0:
+            raise ValueError("Opening angle cannot be negative.")
+        if virtual_time:
+            interaction_radius = None
+            opening_angle = None
         super().__init__(
             name=name,
             number_of_instance=number_of_instance,
@@ -38,7 +108,252 @@ class ParticleSimulation(CoreSimulation):
             max_replicas=max_replicas,
             max_generation=max_generation,
             max_match_limit=max_match_limit,
+            batch_scoring=batch_scoring,
+            use_scheduler=use_scheduler,
+            scheduler_workers=scheduler_workers,
+            use_store=use_store
+            or batch_physics
+            or interaction_radius is not None
+            or opening_angle is not None,
+            virtual_time=virtual_time,
+            seed=seed,
+            crossover_epoch=crossover_epoch,
+            crossover_deaths=crossover_deaths,
+            ramp_rate=ramp_rate,
+            max_starting=max_starting,
+        )
+        self.batch_physics = batch_physics
+        self.integrator_name = integrator
+        self.tolerance = tolerance
+        self.time_step = time_step
+        # Kuvvetler ve zaman adımları simülasyon tohumundan türetilen üreteçten
+        # çekilir; örneklerin anahtarları number_of_instance'tan küçüktür
+        self.integrator = ParticleIntegrator(
+            random=self.random.spawn(number_of_instance),
+            method=create_integrator(integrator, tolerance),
+            time_step=time_step,
+        )
+        self.interaction_radius = interaction_radius
+        self.exclusion_strength = exclusion_strength
+        # Komşu dizini her etkileşim adımında artımlı olarak güncellenir
+        self.neighbors = (
+            SpatialHash(cell_size=interaction_radius)
+            if interaction_radius is not None
+            else None
+        )
+        self._neighbor_slots = np.empty(0, dtype=np.int64)  # dizin satırı -> slot
+        self.long_range = (
+            BarnesHut(theta=opening_angle) if opening_angle is not None else None
+        )
+
+    def to_json(self) -> dict:
+        result = super().to_json()
+        result["integrator"] = self.integrator_metrics()
+        result["neighbors"] = self.neighbors.metrics() if self.neighbors else None
+        result["long_range"] = self.long_range.metrics() if self.long_range else None
+        return result
+
+    def create_store(self) -> PopulationStore:
+        """
+        Parçacık sütunlarını içeren popülasyon deposunu oluşturur.
+        """
+        return PopulationStore(
+            columns=PARTICLE_COLUMNS, vector_columns=PARTICLE_VECTOR_COLUMNS
+        )
+
+    def _bind_instance(self, instance):
+        super()._bind_instance(instance)
+        instance.batch_physics = self.batch_physics
+        # Her örnek kendi yöntemini alır; uyarlamalı adım durumu paylaşılmaz
+        instance.integrator = create_integrator(self.integrator_name, self.tolerance)
+        instance.time_step = self.time_step
+
+    def integrator_metrics(self) -> dict:
+        """
+        Yöntemin adım başına maliyet ölçümlerini döndürür.
+
+        Toplu kinematikte ortak yöntemin, aksi halde kök örneklerin
+        yöntemlerinin ölçümleri toplanır.
+        """
+        if self.batch_physics or self.integrator.method is None:
+            return self.integrator.metrics()
+        steps = evaluations = 0
+        seconds = 0.0
+        for instance in list(self.instances):
+            method = getattr(instance, "integrator", None)
+            if method is not None:
+                steps += method.steps
+                evaluations += method.evaluated
+                seconds += method.seconds
+        return {
+            "integrator": self.integrator.method.name,
+            "steps": steps,
+            "evaluations": evaluations,
+            "cost_per_step": evaluations / steps if steps else 0.0,
+            "seconds_per_step": seconds / steps if steps else 0.0,
+        }
+
+    def integrate_population(self) -> int:
+        """
+        Çalışan tüm parçacıkların kinematiğini tek vektörel adımda ilerletir.
+        Uzun menzilli kuvvetler rastgele kuvvetin yerine uygulanır ve yöntemin
+        her ivme hesaplamasında ara konumlarla yeniden hesaplanır.
+
+        :return: İlerletilen parçacık sayısı.
+        """
+        if self.long_range is not None:
+            slots = self.store.live_slots()
+            charges = self.store.columns["charge"][slots]
+
+            def field(positions):
+                return self.long_range.forces(positions, charges)
+
+            return self.integrator.step(
+                self.store, slots, forces=np.zeros((len(slots), 3)), field=field
+            )
+        return self.integrator.step(self.store)
+
+    def long_range_forces(self) -> tuple:
+        """
+        Çalışan parçacıklara etkiyen uzun menzilli Coulomb kuvvetlerini
+        Barnes-Hut sekizli ağacıyla O(n log n) sürede hesaplar.
+
+        :return: (slotlar, kuvvetler N x 3)
+        """
+        slots = self.store.live_slots()
+        columns = self.store.columns
+        forces = self.long_range.forces(
+            columns["position"][slots], columns["charge"][slots]
+        )
+        return slots, forces
+
+    def apply_long_range_forces(self) -> int:
+        """
+        Uzun menzilli kuvvetleri parçacıklara atar; parçacıklar sonraki
+        adımlarında rastgele kuvvet yerine bu kuvveti uygular.
+
+        :return: Kuvvet atanan parçacık sayısı.
+        """
+        slots, forces = self.long_range_forces()
+        instances = self.store.instances
+        for slot, force in zip(slots.tolist(), forces.tolist()):
+            instances[slot].force = Vector(*force)
+        return len(slots)
+
+    def index_neighbors(self) -> np.ndarray:
+        """
+        Çalışan parçacıkların konumlarıyla komşu dizinini günceller.
+
+        :return: Dizin satırlarına karşılık gelen slotlar.
+        """
+        slots = self.store.live_slots()
+        positions = self.store.columns["position"][slots]
+        # Aynı slotlar için dizin artımlı güncellenir, aksi halde yeniden kurulur
+        if np.array_equal(slots, self._neighbor_slots):
+            self.neighbors.update(positions)
+        else:
+            self.neighbors.build(positions)
+        self._neighbor_slots = slots
+        return slots
+
+    def apply_interactions(self) -> int:
+        """
+        Yakın parçacık çiftlerine kısa menzilli kuvvetleri uygular.
+
+        Çiftler hücre listesiyle O(n) sürede bulunur; kuvvetler bir zaman
+        adımında hız ve momentuma eklenir: v = v0 + (F / m) * t, p = m * v.
+
+        :return: Etkileşen çift sayısı.
+        """
+        slots = self.index_neighbors()
+        first, second = self.neighbors.pairs()
+        if not len(first):
+            return 0
+        columns = self.store.columns
+        forces = pair_forces(
+            self.neighbors.positions,
+            columns["charge"][slots],
+            columns["spin"][slots],
+            first,
+            second,
+            radius=self.interaction_radius,
+            exclusion=self.exclusion_strength,
+        )
+        mass = columns["mass"][slots][:, None]
+        time_steps = self.integrator.time_steps(len(slots))[:, None]
+        with np.errstate(all="ignore"):
+            change = forces / mass * time_steps
+        # Hız kilit altında okunup yazılır; örneklerin bu arada yazdığı hızlar
+        # ezilmez
+        with self.store._lock, np.errstate(all="ignore"):
+            velocity = columns["velocity"][slots] + change
+            columns["velocity"][slots] = velocity
+            columns["momentum"][slots] = velocity * mass
+        return len(first)
+
+    def _neighbor_instances(self, indices: np.ndarray, instance) -> list:
+        instances = self.store.instances
+        return [
+            instances[slot]
+            for slot in self._neighbor_slots[indices].tolist()
+            if instances[slot] is not instance
+        ]
+
+    def neighbors_of(self, instance: Particle, radius: float = None) -> list:
+        """
+        Parçacığa radius uzaklıktaki parçacıkları uzaklık sırasıyla döndürür.
+        Son güncellenen komşu dizini kullanılır.
+
+        :param instance: Depoya bağlı parçacık.
+        :param radius: Arama yarıçapı (varsayılan olarak etkileşim yarıçapı).
+        """
+        radius = self.interaction_radius if radius is None else radius
+        position = instance.position
+        indices = self.neighbors.query_radius(
+            (position.x, position.y, position.z), radius
         )
+        return self._neighbor_instances(indices, instance)
+
+    def nearest(self, instance: Particle, k: int) -> list:
+        """
+        Parçacığa en yakın k parçacığı uzaklık sırasıyla döndürür.
+
+        :param instance: Depoya bağlı parçacık.
+        :param k: Komşu sayısı.
+        """
+        position = instance.position
+        indices = self.neighbors.query_knn((position.x, position.y, position.z), k + 1)
+        return self._neighbor_instances(indices, instance)[:k]
+
+    def _run_physics_loop(self):
+        """
+        Her yaşam döngüsünde kısa menzilli etkileşimleri uygular, uzun menzilli
+        kuvvetleri hesaplar ve popülasyonun kinematiğini toplu olarak ilerletir.
+        """
+        while not self._stop_event.wait(self.lifecycle):
+            if not self._paused:
+                try:
+                    if self.neighbors is not None:
+                        self.apply_interactions()
+                    if self.batch_physics:
+                        self.integrate_population()
+                    elif self.long_range is not None:
+                        self.apply_long_range_forces()
+                except Exception as e:
+                    self.logger.error(f"Particle Simulation Error : {e}")
+
+    def start_simulation(self):
+        """
+        Simülasyonu başlatır; toplu kinematik, etkileşimler veya uzun menzilli
+        kuvvetler açıksa ilerletme thread'i de başlar.
+        """
+        if (
+            self.batch_physics
+            or self.neighbors is not None
+            or self.long_range is not None
+        ):
+            threading.Thread(target=self._run_physics_loop, daemon=True).start()
+        super().start_simulation()
 
     def force_function(self, t):
         return Vector(t**0.1, t**0.1, t**0.1)
@@ -62,6 +377,15 @@ class ParticleSimulation(CoreSimulation):
         :param parent_id: örneklenen üst id ( default 0).
         :return: Oluşturulan çekirdek örneği.
         """
+        position = Vector(0, 0, 0)
+        if self.long_range is not None:
+            # Çakışık parçacıklar birbirine kuvvet uygulamaz; rastgele kuvvet
+            # olmadığından parçacıklar aynı noktada doğmaz
+            position = Vector(
+                self.random.uniform(-1, 1),
+                self.random.uniform(-1, 1),
+                self.random.uniform(-1, 1),
+            )
         instance = Particle(
             name=name,
             lifetime_seconds=lifetime_seconds,
@@ -75,7 +399,7 @@ class ParticleSimulation(CoreSimulation):
             mass=9.1e-31,
             spin=1 / 2,
             energy=0,
-            position=Vector(0, 0, 0),
+            position=position,
             velocity=Vector(0, 0, 0),
             momentum=Vector(0, 0, 0),
             wave_function=self.force_function(0.1),
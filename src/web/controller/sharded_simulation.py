@@ -0,0 +1,733 @@
+# src/web/controller/sharded_simulation.py
+
+import multiprocessing
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.life.particles.core import Core
+from src.life.particles.formula import compile_formula
+from src.life.particles.gate import Gate
+from src.life.particles.population import (
+    CORE_COLUMNS,
+    PARTICLE_COLUMNS,
+    PARTICLE_VECTOR_COLUMNS,
+    PopulationStore,
+)
+from src.life.particles.random_buffer import RandomBuffer
+from src.life.particles.scheduler import TickScheduler
+from src.web.controller.core_simulation import CoreSimulation
+from src.web.controller.particle_simulation import ParticleSimulation
+from src.web.controller.simulation_type import SimulationType
+
+# Parçaların popülasyon sütunlarına ek olarak paylaşılan depoya yazdığı bilgiler
+SHARD_COLUMNS = {
+    "published": np.bool_,
+    "parent_id": np.int64,
+    "lineage_id": np.int64,
+    "code_length": np.int64,
+    "life_created_time": np.float64,
+    "life_start_time": np.float64,
+}
+
+# Her parçanın çekirdek kimlikleri bu aralık kadar kaydırılır; kimlikler çakışmaz
+SHARD_ID_RANGE = 10**9
+
+# Parça süreçlerinde örnekleri oluşturan simülasyon sınıfları
+SAMPLERS = {
+    SimulationType.Core.value: CoreSimulation,
+    SimulationType.Particles.value: ParticleSimulation,
+}
+
+
+def run_shard(config: dict, commands):
+    """
+    Bir parçanın örneklerini ayrı bir süreçte çalıştırır.
+
+    Örnekler parçanın kendi zamanlayıcısında çalışır ve durum bilgilerini
+    paylaşılan bellekteki popülasyon deposuna yazar. Ana süreçten gelen komutlar
+    (pause, resume, replicate, formula, lifetimes, stop) komut kuyruğundan
+    okunur. Paylaşılan sütunlara ana süreçten gelen yazmalar da bu komutlarla
+    parçanın kendi sürecinde, deponun kilidi altında yapılır.
+
+    :param config: Parça ayarları.
+    :param commands: Ana süreçten gelen komutların kuyruğu.
+    """
+    sampler = SAMPLERS[config["simulation_type"]](
+        name=config["name"],
+        number_of_instance=config["number_of_instance"],
+        lifetime_seconds=config["lifetime_seconds"],
+        lifecycle=config["lifecycle"],
+        #
+        max_replicas=config["max_replicas"],
+        max_generation=config["max_generation"],
+        **config["options"],
+    )
+    store = PopulationStore.shared(
+        columns=config["columns"],
+        vector_columns=config["vector_columns"],
+        capacity=config["capacity"],
+        name=config["store_name"],
+    )
+    genome_capacity = config["genome_capacity"]
+    genome_memory = shared_memory.SharedMemory(name=config["genome_name"])
+    buffers = {
+        "genomes": np.ndarray(
+            (config["capacity"], genome_capacity),
+            dtype=np.uint8,
+            buffer=genome_memory.buf,
+        )
+    }
+    scheduler = TickScheduler(
+        number_of_workers=config["scheduler_workers"], name=config["name"]
+    ).start()
+    gate = Gate()
+    # Kimlikler parçalar arasında çakışmaz
+    Core.core_count = config["id_offset"]
+    # Parçanın üreteci simülasyon tohumundan parça numarasına göre türetilir
+    random = RandomBuffer(seed=config["seed"]).spawn(config["index"])
+    lock = threading.Lock()
+    synced = {}  # slot -> paylaşılan belleğe yazılmış kod uzunluğu
+    truncated = set()  # kodları genome_capacity değerini aşan slotlar
+
+    def publish(instance):
+        """
+        Örneğin kimlik, zaman ve kod bilgilerini paylaşılan belleğe yazar.
+        """
+        with lock:
+            genomes = buffers.get("genomes")
+            if genomes is None:
+                return
+            slot = instance._slot
+            codes = instance.codes
+            length = len(codes)
+            start = synced.get(slot)
+            if start is None:
+                store.set("parent_id", slot, instance.parent_id)
+                store.set("lineage_id", slot, instance.lineage_id)
+                store.set("life_created_time", slot, instance.life_created_time)
+                start = 0
+            if instance.life_start_time is not None:
+                store.set("life_start_time", slot, instance.life_start_time)
+            # Kodların yalnızca yeni eklenen kısmı kopyalanır
+            end = min(length, genome_capacity)
+            if length > genome_capacity and slot not in truncated:
+                truncated.add(slot)
+                sampler.logger.warning(
+                    f"Genome Truncated : [{instance.id}] {length} > {genome_capacity}"
+                )
+            if end > start:
+                genomes[slot, start:end] = np.frombuffer(
+                    bytes(codes[start:end]), dtype=np.uint8
+                )
+                synced[slot] = end
+            else:
+                synced[slot] = start
+            store.set("code_length", slot, length)
+            # Yayın bayrağı en son yazılır; ana süreç slotu bayrak yazıldığında görür
+            store.set("published", slot, True)
+
+    for index in range(config["number_of_instance"]):
+        instance = sampler.create_instance(
+            name=config["name"],
+            lifetime_seconds=config["lifetime_seconds"],
+            lifecycle=config["lifecycle"],
+            #
+            parent_id=0,
+            max_replicas=config["max_replicas"],
+            max_generation=config["max_generation"],
+        )
+        # olay dinleyici tetiği yapılandır
+        instance.trigger_event(publish)
+        # çalışma zamanı ayarlarını yapılandır; örnek ayarları simülasyondan,
+        # zamanlayıcı, kapı, üreteç ve depo parçadan gelir
+        sampler._bind_instance(instance)
+        instance.scheduler = scheduler
+        instance._gate = gate
+        instance.random = random.spawn(index)
+        instance.bind_store(store)
+        publish(instance)
+        # nesneyi başlat
+        instance.start()
+
+    while True:
+        command = commands.get()
+        action = command[0]
+        if action == "stop":
+            break
+        try:
+            if action == "pause":
+                gate.close()
+            elif action == "resume":
+                gate.open()
+                scheduler.resume()
+            elif action == "replicate":
+                store.instances[command[1]].replicate()
+            elif action == "formula":
+                store.instances[command[1]].apply_formula(command[2])
+            elif action == "lifetimes":
+                with store._lock:
+                    store.columns["lifetime_seconds"][command[1]] = command[2]
+        except Exception as e:
+            sampler.logger.error(f"Shard Command Error : {e}")
+
+    for instance in list(store.instances):
+        instance.stop(notify=False)
+    gate.notify()
+    scheduler.stop(timeout=config["lifecycle"])
+
+    with lock:
+        buffers.clear()
+    store.detach()
+    try:
+        genome_memory.close()
+    except BufferError:
+        pass  # süreç sonlanırken bellek zaten serbest bırakılır
+
+
+class Shard:
+    """
+    Ana süreçte bir parça sürecini ve paylaşılan belleğini temsil eder.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        process,
+        commands,
+        store: PopulationStore,
+        genome_memory,
+        genome_capacity: int,
+    ) -> None:
+        """
+        :param index: Parça numarası.
+        :param process: Parça süreci.
+        :param commands: Parçaya komut gönderilen kuyruk.
+        :param store: Paylaşılan popülasyon deposu.
+        :param genome_memory: Kodların tutulduğu paylaşılan bellek bloğu.
+        :param genome_capacity: Her örnek için ayrılan kod kapasitesi (byte).
+        """
+        self.index = index
+        self.process = process
+        self.commands = commands
+        self.store = store
+        self.genome_memory = genome_memory
+        self.genomes = np.ndarray(
+            (store.capacity, genome_capacity),
+            dtype=np.uint8,
+            buffer=genome_memory.buf,
+        )
+        self.handles = {}  # slot -> ShardInstance
+
+    def send(self, *command):
+        """
+        Parçaya komut gönderir.
+        """
+        if self.process.is_alive():
+            self.commands.put(command)
+
+    def close(self):
+        """
+        Sütunların ve kodların son değerlerini ana sürece kopyalar ve paylaşılan
+        bellek bloklarını siler.
+        """
+        if self.genome_memory is None:
+            return
+        self.store.detach()
+        self.genomes = np.array(self.genomes)
+        memory = self.genome_memory
+        self.genome_memory = None
+        try:
+            memory.close()
+        except BufferError:
+            pass
+        memory.unlink()
+
+
+class ShardInstance:
+    """
+    Ana süreçte bir parçadaki örneğe bakan tutamaç.
+
+    Durum bilgileri paylaşılan bellekten okunur; kopyalama ve formül gibi
+    işlemler örneğin çalıştığı parçaya komut olarak gönderilir.
+    """
+
+    def __init__(self, simulation, shard: Shard, slot: int) -> None:
+        """
+        :param simulation: Örneğin ait olduğu ShardedSimulation.
+        :param shard: Örneğin çalıştığı parça.
+        :param slot: Örneğin paylaşılan depodaki slot numarası.
+        """
+        self.simulation = simulation
+        self.shard = shard
+        self.slot = slot
+        self.name = simulation.name
+        self.lifecycle = simulation.lifecycle
+        self.max_replicas = simulation.max_replicas
+        self.max_generation = simulation.max_generation
+        self.id = self._get("id")
+        self.parent_id = self._get("parent_id")
+        self.lineage_id = self._get("lineage_id")
+        self.replicas = []  # ana süreçte görülen kopyalar
+        self._stop_event = threading.Event()
+        self._created = False
+
+    def _get(self, name: str):
+        return self.shard.store.get(name, self.slot)
+
+    def __getattr__(self, name: str):
+        # Paylaşılan depodaki sütunlar öznitelik olarak okunur
+        shard = self.__dict__.get("shard")
+        if shard is not None and name in shard.store.columns:
+            return self._get(name)
+        raise AttributeError(name)
+
+    @property
+    def match_count(self) -> int:
+        return self._get("match_count")
+
+    @match_count.setter
+    def match_count(self, value: int):
+        # Eşleşme sayısını yalnızca ana süreç yazar
+        self.shard.store.set("match_count", self.slot, value)
+
+    @property
+    def codes(self) -> bytes:
+        """
+        Paylaşılan bellekteki kodlar (genome_capacity kadarı). Daha uzun kodlar
+        kesilir; parça kesilen örnekleri bir kez uyarı olarak loglar.
+        """
+        length = min(self._get("code_length"), self.shard.genomes.shape[1])
+        return self.shard.genomes[self.slot][:length].tobytes()
+
+    def is_alive(self) -> bool:
+        # Örneğin thread'i parça sürecindedir
+        return False
+
+    def status(self) -> str:
+        """
+        Örneğin mevcut durumunu döndürür.
+        """
+        if not self._created:
+            self._created = True
+            return "Created"
+        if self._stop_event.is_set() or self._get("stopped"):
+            return "Stopped"
+        if self.simulation._paused:
+            return "Paused"
+        return "Running"
+
+    def replicate(self):
+        """
+        Örneğin çalıştığı parçadan kopya oluşturmasını ister.
+        """
+        if (
+            self.generation >= self.max_generation
+            or self.number_of_copies >= self.max_replicas
+            or self.lifetime_seconds < 0
+        ):
+            return None
+        self.shard.send("replicate", self.slot)
+        return self
+
+    def apply_formula(self, formula: str):
+        """
+        Formülü örneğin çalıştığı parçada uygular.
+        Geçersiz formüller parçaya gönderilmeden reddedilir.
+        """
+        compile_formula(formula)
+        self.shard.send("formula", self.slot, formula)
+
+    def stop(self, notify: bool = True):
+        """
+        Örneği ana süreçte durdurulmuş olarak işaretler.
+        Parçalar simülasyon tarafından toplu olarak durdurulur.
+        """
+        self._stop_event.set()
+        self.simulation.instance_status(self)
+
+    def to_json(self, codes: bool = True) -> dict:
+        """
+        Nesneyi JSON formatına dönüştürür.
+
+        :param codes: Kodlar eklenir.
+        :return: JSON formatında nesne.
+        """
+        lifetime_seconds = self.lifetime_seconds
+        if lifetime_seconds == float("inf"):
+            lifetime_seconds = "infinity"
+        life_start_time = self._get("life_start_time")
+        data = {
+            "name": self.name,
+            "id": self.id,
+            "parent_id": self.parent_id,
+            "lineage_id": self.lineage_id,
+            "lifetime_seconds": lifetime_seconds,
+            # created information
+            "life_created_time": self._get("life_created_time"),
+            "life_start_time": life_start_time if life_start_time else None,
+            # cycle information
+            "elapsed_lifespan": self.elapsed_lifespan,
+            "lifecycle": self.lifecycle,
+            # status information
+            "life_status": self.status(),
+            "number_of_copies": self.number_of_copies,
+            "generation": self.generation,
+            "match_count": self.match_count,
+            "fitness": self.fitness,
+        }
+        store = self.shard.store
+        for name in ("charge", "mass", "spin", "energy"):
+            if store.has_column(name):
+                data[name] = self._get(name)
+        for name in store.vector_columns:
+            data[name] = self._get(name).to_json()
+        if codes:
+            data["codes"] = list(self.codes)
+        return data
+
+
+class ShardedSimulation(CoreSimulation):
+    """
+    Popülasyonu birden fazla sürece bölen simülasyon.
+
+    Her parça süreci kendi örneklerini kendi zamanlayıcısında çalıştırır; böylece
+    GIL tek bir işlemci çekirdeğiyle sınırlamaz. Popülasyon sütunları ve kodlar
+    multiprocessing.shared_memory bloklarında tutulur. Ana süreç bu bloklardan
+    fitness değerlerini toplar, çaprazlamayı yapar ve olayları iletir.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        number_of_instance: int,
+        lifetime_seconds: float,
+        lifecycle: float,
+        #
+        max_replicas: int = 2,
+        max_generation: int = 2,
+        max_match_limit: int = 2,
+        simulation_type: SimulationType = SimulationType.Core,
+        workers: int = 2,
+        scheduler_workers: int = 4,
+        genome_capacity: int = 4096,
+        shard_capacity: int = None,
+        seed: int = None,
+        crossover_epoch: float = None,
+        crossover_deaths: int = None,
+        integrator: str = None,
+        tolerance: float = None,
+        time_step: float = None,
+    ) -> None:
+        """
+        Parçalı simulasyonu oluştur.
+
+        :param name: Simulasyon adı.
+        :param number_of_instance: Oluşturulacak örnek sayısı
+        :param lifetime_seconds: Örneklerin yaşam süresi saniye cinsinden.
+        :param lifecycle: Örneklerin saniyedeki yaşam döngüsü.
+        :param simulation_type: Parçalarda çalışacak örneklerin türü (Core veya Particles).
+        :param workers: Parça süreci sayısı.
+        :param scheduler_workers: Her parçanın zamanlayıcı thread sayısı.
+        :param genome_capacity: Her örneğin kodları için paylaşılan bellekte ayrılan byte.
+        :param shard_capacity: Her parçanın slot kapasitesi; None ise kopyalar dahil
+            en fazla örnek sayısına göre hesaplanır.
+        :param seed: Rastgele sayı tohumu; parçaların üreteçleri bu tohumdan türetilir.
+        :param crossover_epoch: Çaprazlama ana süreçte bu süreyle dönemler halinde yapılır.
+        :param crossover_deaths: Bu sayıda ölümde çaprazlama dönem beklenmeden yapılır.
+        :param integrator: Parçacıkların konum ve hızını ilerleten yöntem.
+        :param tolerance: Parçacık adımlarının uyarlamalı hata toleransı.
+        :param time_step: Parçacıkların sabit zaman adımı.
+        """
+        if workers <= 0:
+            raise ValueError("Workers must be a positive value.")
+        if simulation_type.value not in SAMPLERS:
+            raise ValueError("Invalid simulation type")
+        super().__init__(
+            name=name,
+            number_of_instance=number_of_instance,
+            lifetime_seconds=lifetime_seconds,
+            lifecycle=lifecycle,
+            #
+            max_replicas=max_replicas,
+            max_generation=max_generation,
+            max_match_limit=max_match_limit,
+            seed=seed,
+            crossover_epoch=crossover_epoch,
+            crossover_deaths=crossover_deaths,
+        )
+        self.simulation_type = simulation_type
+        # Parça süreçlerindeki simülasyonlara iletilen örnek ayarları
+        if simulation_type == SimulationType.Particles:
+            self.options = {
+                "integrator": integrator,
+                "tolerance": tolerance,
+                "time_step": time_step,
+            }
+        else:
+            self.options = {}
+        self.workers = workers
+        self.scheduler_workers = scheduler_workers
+        self.genome_capacity = genome_capacity
+        self.shard_capacity = shard_capacity
+        self.shards = []
+        self._monitor = None
+        # Thread'li ana süreçten fork yapılmaz
+        self._context = multiprocessing.get_context("spawn")
+
+    def to_json(self) -> dict:
+        data = super().to_json()
+        data["workers"] = self.workers
+        return data
+
+    def shard_schema(self) -> tuple:
+        """
+        Parçaların paylaşılan depo şemasını döndürür.
+
+        :return: (skaler sütunlar, vektör sütunları)
+        """
+        if self.simulation_type == SimulationType.Particles:
+            return {**PARTICLE_COLUMNS, **SHARD_COLUMNS}, PARTICLE_VECTOR_COLUMNS
+        return {**CORE_COLUMNS, **SHARD_COLUMNS}, ()
+
+    def shard_sizes(self) -> list:
+        """
+        Örneklerin parçalara dağılımını döndürür.
+        """
+        size, remainder = divmod(self.number_of_instance, self.workers)
+        return [size + (1 if index < remainder else 0) for index in range(self.workers)]
+
+    def _launch_shards(self):
+        """
+        Paylaşılan bellek bloklarını ayırır ve parça süreçlerini başlatır.
+        """
+        columns, vector_columns = self.shard_schema()
+        # Bir kök örnek ve jenerasyon derinliği boyunca oluşabilecek kopyaları
+        lineage_size = sum(
+            self.max_replicas**generation for generation in range(self.max_generation)
+        )
+        for index, size in enumerate(self.shard_sizes()):
+            if size == 0:
+                continue
+            capacity = self.shard_capacity or size * max(lineage_size, 1)
+            store = PopulationStore.shared(
+                columns=columns, vector_columns=vector_columns, capacity=capacity
+            )
+            genome_memory = shared_memory.SharedMemory(
+                create=True, size=capacity * self.genome_capacity
+            )
+            config = {
+                "index": index,
+                "seed": self.seed,
+                "name": self.name,
+                "simulation_type": self.simulation_type.value,
+                "number_of_instance": size,
+                "lifetime_seconds": self.lifetime_seconds,
+                "lifecycle": self.lifecycle,
+                "max_replicas": self.max_replicas,
+                "max_generation": self.max_generation,
+                "options": self.options,
+                "scheduler_workers": self.scheduler_workers,
+                "columns": columns,
+                "vector_columns": vector_columns,
+                "capacity": capacity,
+                "store_name": store.name,
+                "genome_name": genome_memory.name,
+                "genome_capacity": self.genome_capacity,
+                "id_offset": index * SHARD_ID_RANGE,
+            }
+            commands = self._context.Queue()
+            process = self._context.Process(
+                target=run_shard,
+                args=(config, commands),
+                name=f"{self.name}.shard_{index}",
+                daemon=True,
+            )
+            process.start()
+            self.shards.append(
+                Shard(
+                    index=index,
+                    process=process,
+                    commands=commands,
+                    store=store,
+                    genome_memory=genome_memory,
+                    genome_capacity=self.genome_capacity,
+                )
+            )
+
+    def _broadcast(self, *command):
+        for shard in self.shards:
+            shard.send(*command)
+
+    def collect(self) -> int:
+        """
+        Parçaların paylaşılan belleğini tarar; yeni örnekleri havuza ekler,
+        fitness değerlerini toplar ve örnek olaylarını iletir.
+
+        :return: Bu taramada durduğu görülen örnek sayısı.
+        """
+        stopped = 0
+        created = self.number_of_instance_created
+        handles_by_id = {instance.id: instance for instance in self._all_instances()}
+        for shard in self.shards:
+            columns = shard.store.columns
+            if "published" not in columns:
+                continue
+            for slot in np.flatnonzero(columns["published"]).tolist():
+                instance = shard.handles.get(slot)
+                if instance is None:
+                    instance = ShardInstance(self, shard, slot)
+                    shard.handles[slot] = instance
+                    parent = handles_by_id.get(instance.parent_id)
+                    if parent is not None:
+                        parent.replicas.append(instance)
+                    elif instance.parent_id == 0:
+                        self.number_of_instance_created += 1
+                    handles_by_id[instance.id] = instance
+                if instance._stop_event.is_set():
+                    continue
+                if columns["stopped"][slot]:
+                    instance._stop_event.set()
+                    stopped += 1
+                self.instance_status(instance)
+        # Yeni kök örnekler oluşturulduysa simülasyon olayı tetiklenir
+        if self.number_of_instance_created != created and self.event_function:
+            self.event_function(self)
+        return stopped
+
+    def _run_monitor_loop(self):
+        """
+        Her yaşam döngüsünde parçaların durumunu toplar.
+        """
+        while not self._stop_event.wait(self.lifecycle):
+            try:
+                self.collect()
+            except Exception as e:
+                self.logger.error(f"Sharded Simulation Error : {e}")
+
+    def start_simulation(self):
+        """
+        Parça süreçlerini ve durum toplama thread'ini başlatır. Durdurulan
+        simülasyon yeniden başlatılmaz.
+        """
+        if self._stop_event.is_set():
+            return
+        self._paused = False
+        self.status()
+        self._launch_shards()
+        self._monitor = threading.Thread(target=self._run_monitor_loop, daemon=True)
+        self._monitor.start()
+        if self.crossover is not None:
+            self.crossover.start()
+        if self.event_function:
+            self.event_function(self)  # Event işlevini çağır
+
+    def submit(self, id: int, action: str, **arguments) -> dict:
+        """
+        Komutu örneğin çalıştığı parçaya iletir ve iletildiğinde onaylar.
+        Parçalar komutları kendi komut kuyruklarından sırasıyla uygular.
+        """
+        command = super().submit(id, action, **arguments)
+        handles = {instance.id: instance for instance in self._all_instances()}
+        instance = handles.get(id)
+        for pending in self.commands.drain(id):
+            try:
+                if instance is None:
+                    raise ValueError(f"Unknown instance: {id}")
+                instance.apply_formula(pending["formula"])
+            except Exception as e:
+                self.commands.acknowledge(pending, error=str(e))
+            else:
+                self.commands.acknowledge(pending)
+        return command
+
+    def apply_formula(self, formula: str) -> dict:
+        """
+        Formülü tüm parçaların çalışan örnekleri için sütunlar üzerinde
+        değerlendirir. Ana süreç paylaşılan sütunlara yazmaz; sonuçlar parçalara
+        komut olarak gönderilir ve her parça kendi sürecinde yazar.
+        """
+        compile_formula(formula)
+        handles = {}
+        for instance in self._all_instances():
+            if not instance._stop_event.is_set():
+                handles.setdefault(instance.shard.index, []).append(instance)
+        values = [np.empty(0)]
+        for shard in self.shards:
+            items = handles.get(shard.index)
+            if items:
+                slots = [instance.slot for instance in items]
+                result = shard.store.evaluate_formula(formula, slots, items)
+                shard.send("lifetimes", slots, result)
+                values.append(result)
+        return self.formula_summary(formula, np.concatenate(values))
+
+    def pause_simulation(self):
+        """
+        Tüm parçaları duraklatır.
+        """
+        super().pause_simulation()
+        self._broadcast("pause")
+
+    def resume_simulation(self):
+        """
+        Duraklatılan parçaları devam ettirir.
+        """
+        super().resume_simulation()
+        self._broadcast("resume")
+
+    def stop_simulation(self, timeout: float = None) -> list:
+        """
+        Parçaları durdurur ve paylaşılan belleği serbest bırakır.
+
+        :param timeout: Parça süreçlerinin bitmesi için beklenecek toplam süre.
+            None ise bitmeleri beklenmez.
+        :return: Süre içinde bitmeyen parçalardaki örneklerin kimlikleri.
+        """
+        super().stop_simulation()
+        self._broadcast("stop")
+
+        stragglers = []
+        if timeout is not None:
+            deadline = time.time() + timeout
+            for shard in self.shards:
+                shard.process.join(max(0.0, deadline - time.time()))
+                if shard.process.is_alive():
+                    stragglers.extend(
+                        instance.id for instance in shard.handles.values()
+                    )
+        if (
+            self._monitor is not None
+            and self._monitor is not threading.current_thread()
+        ):
+            self._monitor.join(timeout)
+        # Son değerler ana sürece kopyalanır; bloklar sistemden silinir
+        for shard in self.shards:
+            shard.close()
+
+        if stragglers:
+            message = "{:.7s}\t{}/{}\t{}".format(
+                "stragglers",
+                len(stragglers),
+                self.number_of_instance,
+                stragglers,
+            )
+            self.logger.warning(message)
+        return stragglers
+
+
+# Example Usage
+if __name__ == "__main__":
+    sampler = ShardedSimulation(
+        name="core",
+        number_of_instance=8,
+        lifetime_seconds=2,
+        lifecycle=0.1,
+        workers=2,
+    )
+    sampler.start_simulation()
+    time.sleep(3)
+    print("Created:", sampler.number_of_instance_created)
+    print("Stragglers:", sampler.stop_simulation(timeout=5))
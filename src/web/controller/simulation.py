@@ -1,11 +1,16 @@
 # src/web/controller/simulation.py
 
+import threading
+
 from src.package.logger import Logger, logger
 from src.web.controller.simulation_status import SimulationStatus
 from src.web.controller.simulation_type import SimulationType
 from src.web.controller.core_simulation import CoreSimulation
 from src.web.controller.particle_simulation import ParticleSimulation
+from src.web.controller.sharded_simulation import ShardedSimulation, ShardInstance
+from src.web.controller.start_job import StartJob
 
+from src.life.particles.command_queue import CommandQueue
 from src.life.particles.core import Core
 from src.life.particles.particle import Particle
 
@@ -15,6 +20,8 @@ class Simulation:
     Simülasyon işlemlerini yöneten sınıf.
     """
 
+    JOB_HISTORY = 16  # saklanan başlatma işi sayısı
+
     def __init__(self, name: str) -> None:
         """
         Particle simulasyonunu oluştur.
@@ -22,7 +29,21 @@ class Simulation:
         self.name = name
         # state
         self.simulation_status = SimulationStatus.Stopped
+        self.simulation_type = SimulationType.Core
         self.sampler = None
+        self.stop_timeout = 5.0  # örneklerin durması için beklenecek süre
+        # örneklere yönelik komutlar; simülasyonlar arasında onay işlevi korunur
+        self.commands = CommandQueue()
+        # arka planda başlatma işleri; son JOB_HISTORY iş saklanır
+        self.job = None
+        self.jobs = {}
+        self.job_event_function = None
+        self._job_lock = threading.Lock()  # başlatma işlerinin kaydı
+        self._start_lock = threading.Lock()  # örnekleyicinin değiştirilmesi
+        # events
+        self.simulation_event_function = None
+        self.sampler_event_function = None
+        self.instance_event_function = None
         # Log ayarlarını yapılandırma
         self.logger = Logger(name=f"/simulation/{name}").get_logger()
 
@@ -48,10 +69,67 @@ class Simulation:
         max_replicas,
         max_generation,
         max_match_limit,
+        batch_scoring=False,
+        use_scheduler=False,
+        use_store=False,
+        workers=1,
+        virtual_time=False,
+        seed=None,
+        crossover_epoch=None,
+        crossover_deaths=None,
+        ramp_rate=None,
+        max_starting=None,
+        batch_physics=False,
+        integrator=None,
+        tolerance=None,
+        time_step=None,
+        interaction_radius=None,
+        exclusion_strength=1.0,
+        opening_angle=None,
     ):
         """
         Belirtilen türe göre uygun simülasyon örneğini döndürür.
         """
+        if workers > 1 and simulation_type in (
+            SimulationType.Core,
+            SimulationType.Particles,
+        ):
+            # Parçalar örnekleri her zaman ortak zamanlayıcıda ve paylaşılan
+            # depoda çalıştırır; simülasyon döngüsü gerektiren ayarlar desteklenmez
+            unsupported = {
+                "batch_scoring": batch_scoring,
+                "virtual_time": virtual_time,
+                "ramp_rate": ramp_rate is not None,
+                "max_starting": max_starting is not None,
+                "batch_physics": batch_physics,
+                "interaction_radius": interaction_radius is not None,
+                "exclusion_strength": exclusion_strength != 1.0,
+                "opening_angle": opening_angle is not None,
+            }
+            names = [name for name, used in unsupported.items() if used]
+            if names:
+                raise ValueError(
+                    f"Not supported with workers > 1: {', '.join(names)}"
+                )
+            # Popülasyon birden fazla sürece bölünür
+            return ShardedSimulation(
+                name=f"{self.name}.{simulation_type.value.lower()}",
+                number_of_instance=number_of_instance,
+                lifetime_seconds=lifetime_seconds,
+                lifecycle=lifecycle,
+                #
+                max_replicas=max_replicas,
+                max_generation=max_generation,
+                max_match_limit=max_match_limit,
+                simulation_type=simulation_type,
+                workers=workers,
+                seed=seed,
+                crossover_epoch=crossover_epoch,
+                crossover_deaths=crossover_deaths,
+                integrator=integrator,
+                tolerance=tolerance,
+                time_step=time_step,
+            )
         if simulation_type == SimulationType.Core:
             return CoreSimulation(
                 name=f"{self.name}.core",
@@ -62,6 +140,15 @@ class Simulation:
                 max_replicas=max_replicas,
                 max_generation=max_generation,
                 max_match_limit=max_match_limit,
+                batch_scoring=batch_scoring,
+                use_scheduler=use_scheduler,
+                use_store=use_store,
+                virtual_time=virtual_time,
+                seed=seed,
+                crossover_epoch=crossover_epoch,
+                crossover_deaths=crossover_deaths,
+                ramp_rate=ramp_rate,
+                max_starting=max_starting,
             )
         elif simulation_type == SimulationType.Particles:
             return ParticleSimulation(
@@ -73,6 +160,22 @@ class Simulation:
                 max_replicas=max_replicas,
                 max_generation=max_generation,
                 max_match_limit=max_match_limit,
+                batch_scoring=batch_scoring,
+                use_scheduler=use_scheduler,
+                use_store=use_store,
+                virtual_time=virtual_time,
+                seed=seed,
+                crossover_epoch=crossover_epoch,
+                crossover_deaths=crossover_deaths,
+                ramp_rate=ramp_rate,
+                max_starting=max_starting,
+                batch_physics=batch_physics,
+                integrator=integrator,
+                tolerance=tolerance,
+                time_step=time_step,
+                interaction_radius=interaction_radius,
+                exclusion_strength=exclusion_strength,
+                opening_angle=opening_angle,
             )
         else:
             return None
@@ -92,7 +195,7 @@ class Simulation:
 
         return self.simulation_status
 
-    def start(
+    def prepare(
         self,
         number_of_instance: int,
         lifetime_seconds: float,
@@ -102,14 +205,50 @@ class Simulation:
         max_replicas: int,
         max_generation: int,
         max_match_limit: int,
+        batch_scoring: bool = False,
+        use_scheduler: bool = False,
+        use_store: bool = False,
+        workers: int = 1,
+        virtual_time: bool = False,
+        seed: int = None,
+        crossover_epoch: float = None,
+        crossover_deaths: int = None,
+        ramp_rate: float = None,
+        max_starting: int = None,
+        batch_physics: bool = False,
+        integrator: str = None,
+        tolerance: float = None,
+        time_step: float = None,
+        interaction_radius: float = None,
+        exclusion_strength: float = 1.0,
+        opening_angle: float = None,
     ):
         """
-        Simülasyonu başlatır.
+        Girişleri doğrular ve simülasyonun örnekleyicisini oluşturur; örnekleyici
+        başlatılmaz. Geçersiz girişlerde ValueError oluşur.
 
         :param number_of_instance: Oluşturulacak örnek sayısı
         :param lifetime_seconds: Örneklerin yaşam süresi saniye cinsinden.
         :param lifecycle: Örneklerin saniyedeki yaşam döngüsü.
         :param simulation_type: Simulasyonun türü
+        :param batch_scoring: Kod testleri tüm popülasyon için toplu yapılır.
+        :param use_scheduler: Örnekler ortak bir thread havuzunda çalışır.
+        :param use_store: Örneklerin durum bilgileri ortak NumPy sütunlarında tutulur.
+        :param workers: 1'den büyükse popülasyon bu sayıda sürece bölünür.
+        :param virtual_time: Örnekler sanal saatle gerçek zamandan hızlı çalışır.
+        :param seed: Rastgele sayı tohumu; aynı tohumla aynı kodlar üretilir.
+        :param crossover_epoch: Çaprazlama her ölümde değil, bu süreyle dönemler halinde yapılır.
+        :param crossover_deaths: Bu sayıda ölümde çaprazlama dönem beklenmeden yapılır.
+        :param ramp_rate: Örnekler saniyede en fazla bu sayıda oluşturulur.
+        :param max_starting: Aynı anda başlatılmakta olan en fazla örnek sayısı.
+        :param batch_physics: Parçacıkların kinematiği tüm popülasyon için toplu ilerletilir.
+        :param integrator: Parçacıkların konum ve hızını ilerleten yöntem (euler, semi_implicit_euler, verlet).
+        :param tolerance: Verilirse parçacık adımları bu hata toleransıyla uyarlamalı alt adımlara bölünür.
+        :param time_step: Parçacıkların sabit zaman adımı; verilmezse adımlar rastgele seçilir.
+        :param interaction_radius: Bu yarıçaptaki parçacıklara kısa menzilli dışlama ve Coulomb kuvvetleri uygulanır.
+        :param exclusion_strength: Aynı spinli parçacıkların dışlama itmesi.
+        :param opening_angle: Parçacıklara bu açılma açısıyla Barnes-Hut ağacından Coulomb kuvvetleri uygulanır.
+        :return: Örnekleyici.
         """
         self.number_of_instance = number_of_instance
         self.lifetime_seconds = lifetime_seconds
@@ -119,15 +258,29 @@ class Simulation:
         self.max_replicas = max_replicas
         self.max_generation = max_generation
         self.max_match_limit = max_match_limit
+        self.batch_scoring = batch_scoring
+        self.use_scheduler = use_scheduler
+        self.use_store = use_store
+        self.workers = workers
+        self.virtual_time = virtual_time
+        self.seed = seed
+        self.crossover_epoch = crossover_epoch
+        self.crossover_deaths = crossover_deaths
+        self.ramp_rate = ramp_rate
+        self.max_starting = max_starting
+        self.batch_physics = batch_physics
+        self.integrator = integrator
+        self.tolerance = tolerance
+        self.time_step = time_step
+        self.interaction_radius = interaction_radius
+        self.exclusion_strength = exclusion_strength
+        self.opening_angle = opening_angle
 
         # Geçersiz girişleri kontrol et
-        if not isinstance(simulation_type, SimulationType):
-            raise ValueError("Invalid simulation type")
-        if lifetime_seconds < 0:
-            raise ValueError("Lifetime seconds cannot be negative")
+        self.validate(simulation_type, lifetime_seconds)
 
         # swich simulation
-        self.sampler = self.switch_simulation(
+        return self.switch_simulation(
             number_of_instance=self.number_of_instance,
             lifetime_seconds=self.lifetime_seconds,
             lifecycle=self.lifecycle,
@@ -136,21 +289,110 @@ class Simulation:
             max_replicas=self.max_replicas,
             max_generation=self.max_generation,
             max_match_limit=self.max_match_limit,
+            batch_scoring=self.batch_scoring,
+            use_scheduler=self.use_scheduler,
+            use_store=self.use_store,
+            workers=self.workers,
+            virtual_time=self.virtual_time,
+            seed=self.seed,
+            crossover_epoch=self.crossover_epoch,
+            crossover_deaths=self.crossover_deaths,
+            ramp_rate=self.ramp_rate,
+            max_starting=self.max_starting,
+            batch_physics=self.batch_physics,
+            integrator=self.integrator,
+            tolerance=self.tolerance,
+            time_step=self.time_step,
+            interaction_radius=self.interaction_radius,
+            exclusion_strength=self.exclusion_strength,
+            opening_angle=self.opening_angle,
         )
 
-        # state
-        self.simulation_status = SimulationStatus.Running
-        # trigger
-        if self.simulation_event_function:
-            self.simulation_event_function(self)
-        # proccess
-        self.sampler.trigger_event(self.sampler_event_function).trigger_event_instance(
-            self.instance_event_function
-        )
-        self.sampler.start_simulation()
+    def start(self, **arguments):
+        """
+        Simülasyonu başlatır; örnekler oluşturulduktan sonra döner.
+
+        :param arguments: prepare işlevinin bilgileri.
+        """
+        return self.launch(self.prepare(**arguments))
+
+    def launch(self, sampler, job: StartJob = None):
+        """
+        Önceki simülasyonu durdurur ve hazırlanan örnekleyiciyi başlatır.
+        Örnekleyici kilit altında değiştirilir; iş önceki simülasyon
+        beklenirken iptal edildiyse örnekleyici başlatılmaz.
+
+        :param sampler: prepare ile oluşturulan örnekleyici.
+        :param job: Başlatma işi; örnekler oluşturulamazsa başarısız sayılır.
+        """
+        with self._start_lock:
+            # Önceki simülasyonun thread'leri yenisiyle birikmesin
+            if self.sampler:
+                self.sampler.stop_simulation(timeout=self.stop_timeout)
+            # Durdurma veya yeni başlatma isteği beklerken gelmiş olabilir
+            if job is not None and job.is_finished():
+                return self
+            self.sampler = sampler
+
+            # state
+            self.simulation_status = SimulationStatus.Running
+            # trigger
+            if self.simulation_event_function:
+                self.simulation_event_function(self)
+            # proccess
+            sampler.trigger_event(self.sampler_status).trigger_event_instance(
+                self.instance_event_function
+            )
+            # önceki simülasyonun bekleyen komutları uygulanmayacak
+            self.commands.clear()
+            sampler.commands = self.commands
+        sampler.start_simulation()
+        if job is not None and sampler.error is not None:
+            job.fail(sampler.error)
 
         return self
 
+    @staticmethod
+    def validate(simulation_type: SimulationType, lifetime_seconds: float):
+        if not isinstance(simulation_type, SimulationType):
+            raise ValueError("Invalid simulation type")
+        if lifetime_seconds < 0:
+            raise ValueError("Lifetime seconds cannot be negative")
+
+    def start_async(self, **arguments) -> StartJob:
+        """
+        Simülasyonu arka planda başlatır ve hemen döner. Örnekler ayrı bir
+        thread'de oluşturulur; ilerleme job_event_function ile bildirilir.
+
+        :param arguments: prepare işlevinin bilgileri.
+        :return: Başlatma işi; job.id ile sorgulanabilir.
+        """
+        # Geçersiz girişler iş oluşturulmadan bildirilir; örnekleyici burada kurulur
+        self.validate(
+            arguments.get("simulation_type"), arguments.get("lifetime_seconds", 0)
+        )
+        sampler = self.prepare(**arguments)
+        with self._job_lock:
+            # Önceki başlatma işi tamamlanmadıysa iptal edilir
+            if self.job is not None:
+                self.job.cancel()
+            job = StartJob(arguments, name=f"{self.name}.start")
+            job.trigger_event(self.job_event_function)
+            self.job = job
+            self.jobs[job.id] = job
+            # Eski işler silinir
+            while len(self.jobs) > self.JOB_HISTORY:
+                del self.jobs[next(iter(self.jobs))]
+        return job.start(lambda: self.launch(sampler, job))
+
+    def sampler_status(self, sampler):
+        # Oluşturulan örnek sayısı başlatma işine iletilir
+        job = self.job
+        if job is not None and sampler is self.sampler:
+            job.update(sampler.number_of_instance_created)
+        if self.sampler_event_function:
+            self.sampler_event_function(sampler)
+
     def pause(self):
         # state
         self.simulation_status = SimulationStatus.Paused
@@ -180,10 +422,28 @@ class Simulation:
         if self.simulation_event_function:
             self.simulation_event_function(self)
         # process
-        if self.sampler:
-            self.sampler.stop_simulation()
+        job = self.job
+        if job is not None:
+            job.cancel()
+        # Başlatma işi önceki simülasyonu bekliyorsa değişim tamamlanır
+        with self._start_lock:
+            sampler = self.sampler
+        if sampler:
+            sampler.stop_simulation(timeout=self.stop_timeout)
         return self
 
+    def submit(self, id: int, action: str, **arguments) -> dict:
+        # Komut örneğin bir sonraki adımında uygulanır
+        if not self.sampler:
+            raise ValueError("Simulation is not started")
+        return self.sampler.submit(id, action, **arguments)
+
+    def apply_formula(self, formula: str) -> dict:
+        # Formül tüm popülasyona tek seferde uygulanır
+        if not self.sampler:
+            return {"formula": formula, "count": 0}
+        return self.sampler.apply_formula(formula)
+
     def trigger_simulation(self, event_function):
         self.simulation_event_function = event_function
         return self
@@ -196,6 +456,14 @@ class Simulation:
         self.instance_event_function = event_function
         return self
 
+    def trigger_command(self, event_function):
+        self.commands.trigger_event(event_function)
+        return self
+
+    def trigger_job(self, event_function):
+        self.job_event_function = event_function
+        return self
+
 
 # Global değişkenlerin başlatılması
 
@@ -325,7 +593,7 @@ def simulation_instance_status(instance):
             if state == "Stopped":
                 pass
 
-        elif isinstance(instance, Core):
+        elif isinstance(instance, (Core, ShardInstance)):
             state = instance.status()
 
             if state == "Created":
@@ -0,0 +1,176 @@
+# src/web/controller/start_job.py
+
+import threading
+import time
+import uuid
+
+from src.package import Logger
+
+# İş durumları
+PENDING = "pending"  # başlatılmayı bekliyor
+RAMPING = "ramping"  # örnekler oluşturuluyor
+COMPLETED = "completed"  # tüm örnekler oluşturuldu
+CANCELLED = "cancelled"  # simülasyon örnekler oluşturulmadan durduruldu
+FAILED = "failed"  # başlatma hata ile sonuçlandı
+FINISHED = (COMPLETED, CANCELLED, FAILED)
+
+
+class StartJob:
+    """
+    Arka planda başlatılan simülasyonun iş kaydı.
+
+    Başlatma isteği iş kimliğiyle hemen döner; örnekler ayrı bir thread'de
+    oluşturulur ve ilerleme event_function ile bildirilir. İlerleme bildirimleri
+    progress_interval süresinde en fazla bir kez yapılır; durum değişiklikleri
+    her zaman bildirilir.
+    """
+
+    def __init__(
+        self,
+        arguments: dict,
+        progress_interval: float = 0.5,
+        name: str = "start",
+    ) -> None:
+        """
+        :param arguments: Simulation.start işlevine verilecek bilgiler.
+        :param progress_interval: İki ilerleme bildirimi arasındaki en kısa süre.
+        :param name: İş adı.
+        """
+        self.id = uuid.uuid4().hex
+        self.arguments = arguments
+        self.progress_interval = progress_interval
+        self.name = name
+        self.status = PENDING
+        self.created = 0  # oluşturulan kök örnek sayısı
+        self.total = arguments.get("number_of_instance", 0)
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._reported_at = 0.0
+        self._lock = threading.Lock()
+        self._thread = None
+        # events
+        self.event_function = None
+        # Log ayarlarını yapılandırma
+        self.logger = Logger(name=f"/simulation/{name}").get_logger()
+
+    def to_json(self) -> dict:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.time()) - self.started_at
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "created": self.created,
+            "total": self.total,
+            "progress": self.created / self.total if self.total else 1.0,
+            "elapsed": elapsed,
+            "error": self.error,
+        }
+
+    def is_finished(self) -> bool:
+        return self.status in FINISHED
+
+    def trigger_event(self, event_function):
+        """
+        İlerleme bildirimlerini alacak işlevi atar.
+
+        :param event_function: İşi alan işlev, event_function(job).
+        """
+        self.event_function = event_function
+        return self
+
+    def _notify(self):
+        self._reported_at = time.monotonic()
+        if self.event_function:
+            self.event_function(self)
+
+    def _finish(self, status: str, error: str = None) -> bool:
+        with self._lock:
+            if self.is_finished():
+                return False
+            self.status = status
+            self.error = error
+            self.finished_at = time.time()
+        self._notify()
+        return True
+
+    def update(self, created: int):
+        """
+        Oluşturulan örnek sayısını günceller; tümü oluşturulduysa işi tamamlar.
+
+        :param created: Oluşturulan kök örnek sayısı.
+        """
+        if self.is_finished():
+            return
+        self.created = created
+        if created >= self.total:
+            self._finish(COMPLETED)
+        elif time.monotonic() - self._reported_at >= self.progress_interval:
+            self._notify()
+
+    def cancel(self) -> bool:
+        """
+        Tamamlanmamış işi iptal edilmiş olarak işaretler.
+        """
+        return self._finish(CANCELLED)
+
+    def fail(self, error: str) -> bool:
+        """
+        Tamamlanmamış işi başarısız olarak işaretler.
+
+        :param error: Hata mesajı.
+        """
+        self.logger.error(f"Start Job Error : {error}")
+        return self._finish(FAILED, error=error)
+
+    def run(self, start):
+        """
+        Simülasyonu başlatır; start işlevi örnekler oluşturulurken bekler.
+        İş başlamadan iptal edildiyse start çağrılmaz.
+
+        :param start: Simülasyonu başlatan işlev; bilgi almaz.
+        """
+        with self._lock:
+            if self.is_finished():
+                return
+            self.started_at = time.time()
+            self.status = RAMPING
+        self._notify()
+        try:
+            start()
+        except Exception as e:
+            self.fail(str(e))
+
+    def start(self, start):
+        """
+        İşi ayrı bir thread'de çalıştırır.
+
+        :param start: Simülasyonu başlatan işlev; bilgi almaz.
+        """
+        self._thread = threading.Thread(
+            target=self.run, args=(start,), name=f"{self.name}.{self.id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def join(self, timeout: float = None):
+        """
+        İşin thread'inin bitmesini bekler.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self
+
+
+# Example Usage
+if __name__ == "__main__":
+
+    def start():
+        for created in range(1, job.total + 1):
+            time.sleep(0.01)
+            job.update(created)
+
+    job = StartJob({"number_of_instance": 50}, progress_interval=0.1)
+    job.trigger_event(lambda job: print(job.to_json()))
+    job.start(start).join()
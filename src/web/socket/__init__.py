@@ -1,14 +1,9 @@
 # src/web/socket/__init__.py
 
-import os
 import logging
-from flask_socketio import SocketIO
-import requests
-
-HOST_IP = os.environ.get("HOST_IP")
-HTTP_PORT = os.environ.get("HTTP_PORT")
-httpPortNumber = int(HTTP_PORT)
-PROTOCOL = "HTTP"
+from urllib.parse import urlsplit
+from flask import request
+from flask_socketio import SocketIO, emit
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -57,7 +52,7 @@ def initialize(app, paths):
         """
         logger.debug("WebSocket message received: %s", endpoint)
         response = checkEndpoint(endpoint)
-        io.emit("message", response)
+        emit("message", response)
 
     @io.on("get")
     def handle_ws_get(endpoint):
@@ -68,27 +63,64 @@ def initialize(app, paths):
         - endpoint: WebSocket endpoint
 
         Emits:
-        - Emits the response to the specified endpoint
+        - Emits the response to the specified endpoint, only to the requesting client
         """
         logger.debug("WebSocket GET request received: %s", endpoint)
         response = getApi(endpoint)
         logger.debug("WebSocket GET response: %s", response)
-        io.emit(endpoint, response)
+        emit(endpoint, response, to=request.sid)
+
+    @io.on("rpc")
+    def handle_ws_rpc(call):
+        """
+        Handle WebSocket 'rpc' event.
+
+        Only GET requests to the API paths are dispatched; other methods are
+        answered with 405 without reaching the Flask app.
+
+        Parameters:
+        - call: {"endpoint": str, "method": str (default GET)}
+
+        Returns:
+        - Acknowledgement with {"status": int, "data": response body}
+        """
+        call = call if isinstance(call, dict) else {"endpoint": call}
+        endpoint = call.get("endpoint")
+        logger.debug("WebSocket RPC request received: %s", call)
+        if not checkEndpoint(endpoint):
+            return {"status": 404, "data": None}
+        if str(call.get("method", "GET")).upper() != "GET":
+            return {"status": 405, "data": None}
+        status, data = dispatch(endpoint)
+        return {"status": status, "data": data}
 
     def checkEndpoint(endpoint):
-        for path in paths:
-            if endpoint in path:
-                return endpoint
+        # The path without the query string must equal one of the API paths
+        if not isinstance(endpoint, str):
+            return None
+        if urlsplit(endpoint).path in paths:
+            return endpoint
         return None
 
+    def dispatch(endpoint, method="GET", data=None):
+        """
+        Dispatch a request against the Flask URL map in-process, without a network hop.
+
+        Returns:
+        - (status code, JSON body or text)
+        """
+        with app.test_request_context(endpoint, method=method, json=data):
+            response = app.full_dispatch_request()
+        body = response.get_json(silent=True)
+        if body is None:
+            body = response.get_data(as_text=True)
+        return response.status_code, body
+
     def getUrl(endpoint):
-        try:
-            api_url = f"{PROTOCOL}://{HOST_IP}:{httpPortNumber}{endpoint}"
-            response = requests.get(api_url)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            return f"Error: {e}"
+        status, body = dispatch(endpoint)
+        if status >= 400:
+            return f"Error: {status} {body}"
+        return body
 
     def getApi(endpoint):
         if checkEndpoint(endpoint):
@@ -0,0 +1,115 @@
+# src/web/socket/delta.py
+
+import threading
+
+
+class DeltaEncoder:
+    """
+    Örnek durumlarını son gönderilen sürüme göre değişiklik olarak kodlar.
+
+    Her örnek için bir sürüm numarası, son gönderilen alanlar ve kodların
+    gönderilen uzunluğu tutulur. Mesajlar yalnızca değişen alanları ve
+    kodlara sonradan eklenen byte'ları taşır.
+
+    İstemci her örnek için sürümü saklar; gelen mesajın "base" değeri
+    sakladığı sürümle eşleşmiyorsa (ör. çalışma sırasında katıldıysa) tam
+    durumu yeniden ister. Kodlar her mesajda "codes_offset" konumundan
+    kesilip "codes" ile uzatılır.
+    """
+
+    def __init__(self) -> None:
+        self._states = {}  # örnek kimliği -> son gönderilen durum
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def version(self, id: int) -> int:
+        """
+        Örneğin son gönderilen sürümünü döndürür (hiç gönderilmediyse 0).
+        """
+        state = self._states.get(id)
+        return state["version"] if state is not None else 0
+
+    def fields(self, id: int) -> dict:
+        """
+        Örneğin son gönderilen tüm alanlarını döndürür.
+        """
+        with self._lock:
+            state = self._states.get(id)
+            return dict(state["fields"]) if state is not None else {}
+
+    def encode(self, instance, raw: bool = False) -> dict:
+        """
+        Örneğin son gönderimden bu yana değişen bilgilerini kodlar.
+
+        :param instance: Core veya Particle örneği.
+        :param raw: Eklenen kodlar tamsayı listesi yerine bytes olarak döndürülür.
+        :return: Değişiklik mesajı; değişiklik yoksa None.
+        """
+        fields = instance.to_json(codes=False)
+        codes = instance.codes
+        length = len(codes)
+        with self._lock:
+            state = self._states.get(instance.id)
+            if state is None:
+                state = {"version": 0, "fields": {}, "offset": 0}
+                self._states[instance.id] = state
+            sent = state["fields"]
+            changes = {
+                name: value
+                for name, value in fields.items()
+                if name not in sent or sent[name] != value
+            }
+            offset = state["offset"]
+            if length < offset:
+                # Kodlar değiştirildi; baştan gönderilir
+                offset = 0
+            if not changes and length == offset:
+                return None
+            base = state["version"]
+            state["version"] = base + 1
+            state["offset"] = length
+            sent.update(changes)
+        return {
+            "id": instance.id,
+            "version": base + 1,
+            "base": base,
+            "changes": changes,
+            "codes_offset": offset,
+            "codes": bytes(codes[offset:length]) if raw else list(codes[offset:length]),
+        }
+
+    def snapshot(self, instances: list) -> list:
+        """
+        Örneklerin tam durumlarını sürümleriyle birlikte döndürür.
+        Çalışma sırasında katılan istemcilerin eşitlenmesi için kullanılır.
+
+        :param instances: Core veya Particle örnekleri.
+        """
+        snapshot = []
+        for instance in instances:
+            data = instance.to_json()
+            data["version"] = self.version(instance.id)
+            snapshot.append(data)
+        return snapshot
+
+    def reset(self):
+        """
+        Tüm örneklerin gönderim durumlarını siler.
+        """
+        with self._lock:
+            self._states.clear()
+
+
+# Example Usage
+if __name__ == "__main__":
+    from src.life.particles.core import Core
+
+    core = Core(name="core", lifetime_seconds=10, lifecycle=1)
+    core.trigger_event(None)
+    encoder = DeltaEncoder()
+    print("First:", encoder.encode(core))
+    core.evolve()
+    print("Delta:", encoder.encode(core))
+    print("Unchanged:", encoder.encode(core))
@@ -0,0 +1,197 @@
+# src/web/socket/emitter.py
+
+import threading
+import time
+
+from src.package import Logger
+
+
+class PopulationEmitter:
+    """
+    Örnek olaylarını birleştirip sabit hızda toplu olarak gönderen yayıncı.
+
+    Örnekler her adımda yalnızca "değişti" olarak işaretlenir; iki gönderim
+    arasında aynı örnek için yalnızca son durum tutulur. Belirlenen hızda
+    değişen örneklerin son durumları tek bir population_frame mesajıyla
+    gönderilir. Kodlayıcı verilirse yalnızca değişen bilgiler gönderilir.
+    Yönlendirici verilirse her oda yalnızca süzgecine uyan örnekleri alır;
+    hiçbir odaya uymayan örnekler serileştirilmez.
+    """
+
+    def __init__(
+        self,
+        emit,
+        rate: float = 10.0,
+        event: str = "population_frame",
+        name: str = "emitter",
+        encoder=None,
+        raw_codes: bool = False,
+        router=None,
+    ) -> None:
+        """
+        :param emit: Mesajı gönderen işlev, emit(event, payload).
+        :param rate: Saniyedeki gönderim sayısı (ör. 5-20 Hz).
+        :param event: Gönderilecek olayın adı.
+        :param name: Yayıncı adı.
+        :param encoder: Değişiklik kodlayıcısı (DeltaEncoder); None ise tam durum gönderilir.
+        :param raw_codes: Değişikliklerdeki kodlar bytes olarak bırakılır; mesaj
+            biçimine emit işlevinde çevrilir.
+        :param router: Örnekleri odalara dağıtan yönlendirici (Subscriptions);
+            verilirse mesajlar emit(event, payload, room) ile gönderilir.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be a positive value.")
+        self.emit = emit
+        self.rate = rate
+        self.event = event
+        self.name = name
+        self.encoder = encoder
+        self.raw_codes = raw_codes
+        self.router = router
+        self._dirty = {}  # örnek kimliği -> örnek
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        # metrics
+        self.frames = 0  # gönderilen mesaj sayısı
+        self.updates = 0  # işaretlenen güncelleme sayısı
+        self.dropped = 0  # birleştirme nedeniyle gönderilmeyen güncelleme sayısı
+        self.unrouted = 0  # hiçbir odaya uymadığı için gönderilmeyen örnek sayısı
+        # Log ayarlarını yapılandırma
+        self.logger = Logger(name=f"/socket/{name}").get_logger()
+
+    @property
+    def interval(self) -> float:
+        """
+        İki gönderim arasındaki süre saniye cinsinden.
+        """
+        return 1 / self.rate
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Bir sonraki gönderimi bekleyen örnek sayısı.
+        """
+        return len(self._dirty)
+
+    def mark(self, instance):
+        """
+        Örneği değişti olarak işaretler. Örneğin thread'inde çağrılır ve
+        serileştirme yapmaz.
+
+        :param instance: Core veya Particle örneği.
+        """
+        with self._lock:
+            self.updates += 1
+            if instance.id in self._dirty:
+                # Önceki güncelleme gönderilmeden yenisi geldi
+                self.dropped += 1
+            self._dirty[instance.id] = instance
+
+    def flush(self) -> int:
+        """
+        Değişen örneklerin son durumlarını tek mesajla gönderir.
+
+        :return: Gönderilen örnek sayısı.
+        """
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = {}
+        selected = list(dirty.values())
+        routes = None
+        if self.router is not None:
+            routes = self.router.route(selected)
+            routed = set().union(*routes.values())
+            self.unrouted += len(selected) - len(routed)
+            selected = [instance for instance in selected if instance.id in routed]
+        if self.encoder is None:
+            instances = [instance.to_json() for instance in selected]
+        else:
+            instances = [
+                self.encoder.encode(instance, raw=self.raw_codes)
+                for instance in selected
+            ]
+            instances = [delta for delta in instances if delta is not None]
+        if not instances:
+            return 0
+        payload = {
+            "frame": self.frames,
+            "time": time.time(),
+            "delta": self.encoder is not None,
+            "instances": instances,
+        }
+        self.frames += 1
+        if routes is None:
+            self.emit(self.event, payload)
+            return len(instances)
+        for room, ids in routes.items():
+            matched = [data for data in instances if data["id"] in ids]
+            if matched:
+                self.emit(self.event, {**payload, "instances": matched}, room)
+        return len(instances)
+
+    def metrics(self) -> dict:
+        """
+        Yayıncının ölçümlerini döndürür.
+        """
+        return {
+            "rate": self.rate,
+            "queue_depth": self.queue_depth,
+            "frames": self.frames,
+            "updates": self.updates,
+            "dropped": self.dropped,
+            "unrouted": self.unrouted,
+        }
+
+    def _run_loop(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"Emitter Error : {e}")
+
+    def start(self):
+        """
+        Gönderim thread'ini başlatır.
+        """
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run_loop, name=self.name, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = None):
+        """
+        Gönderim thread'ini durdurur ve bekleyen güncellemeleri gönderir.
+
+        :param timeout: Thread'in bitmesi için beklenecek en fazla süre.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+        return self
+
+
+# Example Usage
+if __name__ == "__main__":
+
+    class Instance:
+        def __init__(self, id):
+            self.id = id
+
+        def to_json(self):
+            return {"id": self.id}
+
+    emitter = PopulationEmitter(lambda event, payload: print(event, payload), rate=5)
+    emitter.start()
+    instances = [Instance(id) for id in range(3)]
+    for _ in range(10):
+        for instance in instances:
+            emitter.mark(instance)
+    time.sleep(0.5)
+    emitter.stop()
+    print("Metrics:", emitter.metrics())
@@ -0,0 +1,233 @@
+# src/web/socket/subscription.py
+
+import heapq
+import threading
+
+from src.web.socket.wire import JSON
+
+# Süzgeç içermeyen abonelik tüm popülasyonu izler
+ALL = "*"
+
+
+class Subscription:
+    """
+    Bir istemcinin izlediği örnekleri tanımlayan süzgeç.
+
+    Verilen koşulların tümü sağlanmalıdır; verilmeyen koşullar süzmez.
+    """
+
+    def __init__(
+        self,
+        ids: list = None,
+        lineages: list = None,
+        generations: list = None,
+        top_k: int = None,
+    ) -> None:
+        """
+        :param ids: İzlenen örnek kimlikleri.
+        :param lineages: İzlenen soy köklerinin kimlikleri (lineage_id).
+        :param generations: [en küçük, en büyük] jenerasyon aralığı; None uç sınırsızdır.
+        :param top_k: Yalnızca uygunluğu (fitness) en yüksek k örnek izlenir.
+        """
+        if generations is not None and len(generations) != 2:
+            raise ValueError("Generations must be a [min, max] range.")
+        if top_k is not None and top_k <= 0:
+            raise ValueError("Top-k must be a positive value.")
+        self.ids = frozenset(ids) if ids else None
+        self.lineages = frozenset(lineages) if lineages else None
+        self.generations = tuple(generations) if generations is not None else None
+        self.top_k = top_k
+
+    @classmethod
+    def from_json(cls, data: dict = None):
+        """
+        İstemciden gelen süzgeç bilgilerinden abonelik oluşturur.
+        """
+        data = data or {}
+        return cls(
+            ids=data.get("ids"),
+            lineages=data.get("lineages"),
+            generations=data.get("generations"),
+            top_k=data.get("top_k"),
+        )
+
+    @property
+    def key(self) -> str:
+        """
+        Aboneliğin oda anahtarı; aynı süzgeci seçen istemciler aynı odayı paylaşır.
+        """
+        parts = []
+        if self.ids is not None:
+            parts.append("ids=" + ",".join(map(str, sorted(self.ids))))
+        if self.lineages is not None:
+            parts.append("lineages=" + ",".join(map(str, sorted(self.lineages))))
+        if self.generations is not None:
+            parts.append("generations={}-{}".format(*self.generations))
+        if self.top_k is not None:
+            parts.append(f"top_k={self.top_k}")
+        return ";".join(parts) or ALL
+
+    def matches(self, instance, top: set = None) -> bool:
+        """
+        Örneğin süzgece uyup uymadığını döndürür.
+
+        :param instance: Core veya Particle örneği.
+        :param top: top_k süzgeci için uygunluğu en yüksek örneklerin kimlikleri.
+        """
+        if self.ids is not None and instance.id not in self.ids:
+            return False
+        if self.lineages is not None and instance.lineage_id not in self.lineages:
+            return False
+        if self.generations is not None:
+            low, high = self.generations
+            if low is not None and instance.generation < low:
+                return False
+            if high is not None and instance.generation > high:
+                return False
+        if self.top_k is not None and (top is None or instance.id not in top):
+            return False
+        return True
+
+
+def top_ids(instances: list, k: int) -> set:
+    """
+    Uygunluğu en yüksek k örneğin kimliklerini döndürür.
+    """
+    return {
+        instance.id
+        for instance in heapq.nlargest(k, instances, key=lambda item: item.fitness)
+    }
+
+
+class Subscriptions:
+    """
+    İstemci aboneliklerini Socket.IO odalarıyla eşleştirir.
+
+    Oda adı mesaj biçimi ve süzgeç anahtarından oluşur; aynı biçimde aynı
+    süzgeci seçen istemciler tek odada toplanır ve mesaj her oda için bir
+    kez hazırlanır.
+    """
+
+    def __init__(self, population=None) -> None:
+        """
+        :param population: Tüm örnekleri döndüren işlev; top_k süzgeçleri için kullanılır.
+        """
+        self.population = population
+        self._clients = {}  # oturum kimliği -> oda
+        self._rooms = {}  # oda -> abonelik, biçim ve üyeler
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    @staticmethod
+    def room_name(subscription: Subscription, format: str = JSON) -> str:
+        return f"{format}:{subscription.key}"
+
+    def subscribe(self, sid: str, subscription: Subscription, format: str = JSON):
+        """
+        İstemciyi aboneliğin odasına kaydeder; önceki aboneliği kaldırılır.
+
+        :return: (yeni oda, önceki oda veya None)
+        """
+        room = self.room_name(subscription, format)
+        previous = self.unsubscribe(sid)
+        with self._lock:
+            entry = self._rooms.setdefault(
+                room, {"subscription": subscription, "format": format, "members": set()}
+            )
+            entry["members"].add(sid)
+            self._clients[sid] = room
+        return room, previous if previous != room else None
+
+    def unsubscribe(self, sid: str) -> str:
+        """
+        İstemcinin aboneliğini kaldırır; üyesi kalmayan oda silinir.
+
+        :return: İstemcinin ayrıldığı oda veya None.
+        """
+        with self._lock:
+            room = self._clients.pop(sid, None)
+            entry = self._rooms.get(room)
+            if entry is not None:
+                entry["members"].discard(sid)
+                if not entry["members"]:
+                    del self._rooms[room]
+        return room
+
+    def subscription(self, sid: str) -> Subscription:
+        """
+        İstemcinin aboneliğini döndürür; abone değilse None.
+        """
+        with self._lock:
+            entry = self._rooms.get(self._clients.get(sid))
+            return entry["subscription"] if entry is not None else None
+
+    def format(self, room: str) -> str:
+        """
+        Odadaki istemcilerin mesaj biçimini döndürür.
+        """
+        entry = self._rooms.get(room)
+        return entry["format"] if entry is not None else JSON
+
+    def _top(self, subscriptions: list, population: list = None) -> dict:
+        # Her farklı k için sıralama bir kez yapılır
+        sizes = {item.top_k for item in subscriptions if item.top_k is not None}
+        if not sizes:
+            return {}
+        if population is None:
+            population = list(self.population()) if self.population else []
+        return {k: top_ids(population, k) for k in sizes}
+
+    def route(self, instances: list) -> dict:
+        """
+        Örnekleri süzgeçlerine uyan odalara dağıtır.
+
+        :param instances: Değişen örnekler.
+        :return: oda -> örnek kimlikleri; hiçbir odaya uymayan örnekler yer almaz.
+        """
+        with self._lock:
+            rooms = [
+                (room, entry["subscription"]) for room, entry in self._rooms.items()
+            ]
+        if not rooms:
+            return {}
+        top = self._top([subscription for _, subscription in rooms])
+        routes = {}
+        for room, subscription in rooms:
+            ids = {
+                instance.id
+                for instance in instances
+                if subscription.matches(instance, top.get(subscription.top_k))
+            }
+            if ids:
+                routes[room] = ids
+        return routes
+
+    def select(self, sid: str, instances: list) -> list:
+        """
+        Örneklerden istemcinin aboneliğine uyanları döndürür (ör. tam durum için).
+        """
+        subscription = self.subscription(sid)
+        if subscription is None:
+            return []
+        top = self._top([subscription], population=instances)
+        return [
+            instance
+            for instance in instances
+            if subscription.matches(instance, top.get(subscription.top_k))
+        ]
+
+
+# Example Usage
+if __name__ == "__main__":
+    from src.life.particles.core import Core
+
+    cores = [Core(name=f"core_{i}", lifetime_seconds=10, lifecycle=1) for i in range(4)]
+    for index, core in enumerate(cores):
+        core.fitness = index
+    subscriptions = Subscriptions(population=lambda: cores)
+    subscriptions.subscribe("all", Subscription())
+    subscriptions.subscribe("best", Subscription(top_k=2))
+    subscriptions.subscribe("first", Subscription(ids=[cores[0].id]), format="binary")
+    print("Routes:", subscriptions.route(cores))
@@ -0,0 +1,250 @@
+# src/web/socket/wire.py
+
+import math
+import struct
+import threading
+
+# İstemcilerin bağlanırken seçebileceği mesaj biçimleri
+JSON = "json"
+BINARY = "binary"
+FORMATS = (JSON, BINARY)
+
+# Durum bilgilerinin ikili karşılıkları
+STATUS_CODES = ("Unknown", "Created", "Running", "Paused", "Resumed", "Stopped")
+
+# Çekirdek kaydının sabit şeması (alan adı, struct biçimi)
+CORE_FIELDS = (
+    ("id", "q"),
+    ("version", "q"),
+    ("base", "q"),
+    ("parent_id", "q"),
+    ("lineage_id", "q"),
+    ("lifetime_seconds", "d"),
+    ("life_created_time", "d"),
+    ("life_start_time", "d"),
+    ("elapsed_lifespan", "d"),
+    ("lifecycle", "d"),
+    ("fitness", "d"),
+    ("number_of_copies", "q"),
+    ("generation", "q"),
+    ("match_count", "q"),
+    ("codes_offset", "q"),
+    ("codes_length", "q"),
+    ("life_status", "B"),
+)
+
+# Parçacık kaydı çekirdek alanlarına ek olarak skaler ve vektör alanlarını taşır
+PARTICLE_SCALARS = ("charge", "mass", "spin", "energy")
+PARTICLE_VECTORS = ("position", "velocity", "momentum", "wave_function")
+PARTICLE_FIELDS = (
+    CORE_FIELDS
+    + tuple((name, "d") for name in PARTICLE_SCALARS)
+    + tuple((f"{name}.{axis}", "d") for name in PARTICLE_VECTORS for axis in "xyz")
+)
+
+SCHEMAS = {
+    "core": CORE_FIELDS,
+    "particle": PARTICLE_FIELDS,
+}
+RECORDS = {
+    schema: struct.Struct("<" + "".join(kind for _, kind in fields))
+    for schema, fields in SCHEMAS.items()
+}
+
+
+def schema_of(fields: dict) -> str:
+    """
+    Örnek bilgilerine uygun kayıt şemasının adını döndürür.
+    """
+    return "particle" if "charge" in fields else "core"
+
+
+def _number(value) -> float:
+    # "infinity" ve None değerleri float karşılıklarına çevrilir
+    if value == "infinity":
+        return math.inf
+    if value is None:
+        return math.nan
+    return value
+
+
+def pack_record(fields: dict, version: int, base: int, offset: int, length: int):
+    """
+    Örnek bilgilerini sabit şemalı ikili kayda dönüştürür.
+
+    :param fields: to_json(codes=False) çıktısı.
+    :param version: Kaydın sürümü.
+    :param base: Kaydın dayandığı önceki sürüm.
+    :param offset: Kodların kesileceği konum.
+    :param length: Kayıtla gönderilen kod byte sayısı.
+    :return: bytes
+    """
+    schema = schema_of(fields)
+    values = []
+    for name, _ in SCHEMAS[schema]:
+        if name == "version":
+            values.append(version)
+        elif name == "base":
+            values.append(base)
+        elif name == "codes_offset":
+            values.append(offset)
+        elif name == "codes_length":
+            values.append(length)
+        elif name == "life_status":
+            status = fields.get("life_status")
+            values.append(STATUS_CODES.index(status) if status in STATUS_CODES else 0)
+        elif "." in name:
+            vector, axis = name.split(".")
+            values.append(fields[vector][axis])
+        else:
+            values.append(_number(fields[name]))
+    return RECORDS[schema].pack(*values)
+
+
+def unpack_records(schema: str, records: bytes, codes: bytes = b"") -> list:
+    """
+    İkili kayıtları sözlüklere çevirir (istemci tarafının Python karşılığı).
+
+    :param schema: "core" veya "particle".
+    :param records: Birleştirilmiş kayıtlar.
+    :param codes: Birleştirilmiş kod byte'ları.
+    :return: Kayıt sözlükleri; kodlar "codes" anahtarında bytes olarak bulunur.
+    """
+    record = RECORDS[schema]
+    names = [name for name, _ in SCHEMAS[schema]]
+    decoded = []
+    position = 0
+    for values in record.iter_unpack(records):
+        data = dict(zip(names, values))
+        data["life_status"] = STATUS_CODES[data["life_status"]]
+        end = position + data["codes_length"]
+        data["codes"] = codes[position:end]
+        position = end
+        decoded.append(data)
+    return decoded
+
+
+def binary_frame(payload: dict, encoder) -> dict:
+    """
+    Değişiklik mesajlarından oluşan bir population_frame mesajını ikili biçime
+    çevirir. Kayıtlar tam sayısal durumu taşır; kodlar tek bir ikili ek olarak
+    gönderilir.
+
+    :param payload: PopulationEmitter mesajı (kodları bytes olan değişiklikler).
+    :param encoder: Son gönderilen alanları tutan DeltaEncoder.
+    """
+    records = []
+    codes = []
+    schema = "core"
+    for delta in payload["instances"]:
+        fields = encoder.fields(delta["id"])
+        schema = schema_of(fields)
+        records.append(
+            pack_record(
+                fields,
+                version=delta["version"],
+                base=delta["base"],
+                offset=delta["codes_offset"],
+                length=len(delta["codes"]),
+            )
+        )
+        codes.append(bytes(delta["codes"]))
+    return {
+        "frame": payload["frame"],
+        "time": payload["time"],
+        "schema": schema,
+        "records": b"".join(records),
+        "codes": b"".join(codes),
+    }
+
+
+def json_frame(payload: dict) -> dict:
+    """
+    Kodları bytes olan bir population_frame mesajını JSON biçimine çevirir.
+    """
+    instances = [
+        {**delta, "codes": list(delta["codes"])} for delta in payload["instances"]
+    ]
+    return {**payload, "instances": instances}
+
+
+def binary_snapshot(snapshot: list) -> dict:
+    """
+    Tam durum listesini ikili biçime çevirir.
+
+    :param snapshot: DeltaEncoder.snapshot çıktısı.
+    """
+    records = []
+    codes = []
+    schema = "core"
+    for data in snapshot:
+        schema = schema_of(data)
+        genome = bytes(data["codes"])
+        records.append(
+            pack_record(
+                data,
+                version=data["version"],
+                base=data["version"],
+                offset=0,
+                length=len(genome),
+            )
+        )
+        codes.append(genome)
+    return {"schema": schema, "records": b"".join(records), "codes": b"".join(codes)}
+
+
+class ClientFormats:
+    """
+    Bağlı istemcilerin bağlanırken seçtiği mesaj biçimlerini tutar.
+    """
+
+    def __init__(self) -> None:
+        self._formats = {}  # oturum kimliği -> biçim
+        self._lock = threading.Lock()
+
+    def connect(self, sid: str, format: str = None) -> str:
+        """
+        İstemcinin biçimini kaydeder; bilinmeyen biçimler için JSON kullanılır.
+
+        :return: Kaydedilen biçim.
+        """
+        format = format if format in FORMATS else JSON
+        with self._lock:
+            self._formats[sid] = format
+        return format
+
+    def disconnect(self, sid: str):
+        with self._lock:
+            self._formats.pop(sid, None)
+
+    def format(self, sid: str) -> str:
+        return self._formats.get(sid, JSON)
+
+    def count(self, format: str) -> int:
+        """
+        Verilen biçimi kullanan istemci sayısını döndürür.
+        """
+        with self._lock:
+            return sum(1 for value in self._formats.values() if value == format)
+
+
+# Example Usage
+if __name__ == "__main__":
+    fields = {
+        "id": 1,
+        "parent_id": 0,
+        "lineage_id": 1,
+        "lifetime_seconds": "infinity",
+        "life_created_time": 0.0,
+        "life_start_time": None,
+        "elapsed_lifespan": 0.5,
+        "lifecycle": 1.0,
+        "fitness": 0.25,
+        "number_of_copies": 0,
+        "generation": 1,
+        "match_count": 0,
+        "life_status": "Running",
+    }
+    record = pack_record(fields, version=1, base=0, offset=0, length=2)
+    print("Record size:", len(record))
+    print("Decoded:", unpack_records("core", record, b"\x01\x02"))
@@ -0,0 +1,102 @@
+# tests/life/particle/barnes_hut_test.py
+
+import unittest
+
+import numpy as np
+
+from src.life.particles.barnes_hut import (
+    BarnesHut,
+    benchmark,
+    direct_forces,
+    morton_keys,
+)
+
+
+class TestBarnesHut(unittest.TestCase):
+    def setUp(self):
+        generator = np.random.default_rng(1)
+        self.positions = generator.uniform(0, 1, (300, 3))
+        self.charges = generator.choice((-1.0, 1.0), 300)
+        self.exact = direct_forces(self.positions, self.charges, coulomb=1.0)
+
+    def relative_error(self, forces):
+        return np.linalg.norm(forces - self.exact, axis=1) / np.linalg.norm(
+            self.exact, axis=1
+        )
+
+    def test_direct_forces(self):
+        # İki yük: benzer yükler iter, kuvvetler eşit ve zıttır
+        forces = direct_forces(
+            [[0, 0, 0], [2, 0, 0]], [1.0, 1.0], coulomb=1.0, softening=0
+        )
+        np.testing.assert_allclose(forces, [[-0.25, 0, 0], [0.25, 0, 0]])
+        np.testing.assert_allclose(self.exact.sum(axis=0), 0, atol=1e-8)
+
+    def test_theta_zero_is_exact(self):
+        solver = BarnesHut(theta=0, coulomb=1.0)
+        np.testing.assert_allclose(
+            solver.forces(self.positions, self.charges), self.exact, rtol=1e-10
+        )
+        self.assertEqual(solver.interactions, 0)
+        self.assertEqual(solver.direct, 300 * 299)
+
+    def test_opening_angle(self):
+        # Açı büyüdükçe daha az hesaplama yapılır ve hata artar
+        errors, costs = [], []
+        for theta in (0.3, 0.5, 0.8):
+            solver = BarnesHut(theta=theta, coulomb=1.0)
+            forces = solver.forces(self.positions, self.charges)
+            errors.append(np.mean(self.relative_error(forces)))
+            costs.append(solver.interactions + solver.direct)
+        self.assertLess(errors[0], 0.01)
+        self.assertLess(errors[1], 0.05)
+        self.assertEqual(errors, sorted(errors))
+        self.assertEqual(costs, sorted(costs, reverse=True))
+        self.assertLess(costs[1], 300 * 299)
+
+    def test_non_finite_positions(self):
+        # Sonlu olmayan konumlar kuvvet almaz ve uygulamaz
+        positions = self.positions.copy()
+        positions[0] = np.inf
+        forces = BarnesHut(theta=0, coulomb=1.0).forces(positions, self.charges)
+        expected = direct_forces(positions[1:], self.charges[1:], coulomb=1.0)
+        np.testing.assert_array_equal(forces[0], 0)
+        np.testing.assert_allclose(forces[1:], expected, rtol=1e-10)
+
+    def test_coincident_positions(self):
+        # Aynı konumdaki parçacıklar en derin düzeyde yaprak olur
+        solver = BarnesHut(leaf_size=2)
+        forces = solver.forces(np.zeros((10, 3)), np.ones(10))
+        np.testing.assert_array_equal(forces, 0)
+        self.assertEqual(solver.metrics()["depth"], 21)
+        self.assertEqual(solver.metrics()["collapsed"], 1)
+        # Çakışık parçacıklar doğrudan toplanmaz
+        solver.forces(np.zeros((5000, 3)), np.ones(5000))
+        self.assertEqual(solver.direct, 0)
+        # Çakışık yaprak diğer parçacıklara özetle etki eder
+        positions = np.vstack((np.full((50, 3), 0.5), self.positions))
+        charges = np.concatenate((np.ones(50), self.charges))
+        forces = BarnesHut(theta=0, coulomb=1.0).forces(positions, charges)
+        np.testing.assert_allclose(
+            forces, direct_forces(positions, charges, coulomb=1.0), rtol=1e-8
+        )
+
+    def test_morton_keys(self):
+        keys = morton_keys(np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1]]))
+        self.assertEqual(keys.tolist(), [1, 2, 4, 7])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            BarnesHut(theta=-1)
+        with self.assertRaises(ValueError):
+            BarnesHut(leaf_size=0)
+
+    def test_benchmark(self):
+        results = benchmark(sizes=(200,), theta=0.5, seed=1)
+        self.assertEqual(results[0]["size"], 200)
+        self.assertLess(results[0]["mean_error"], 0.05)
+        self.assertGreater(results[0]["direct_seconds"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
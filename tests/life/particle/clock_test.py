@@ -0,0 +1,33 @@
+# tests/life/particle/clock_test.py
+
+import time
+import unittest
+from src.life.particles.clock import REAL_CLOCK, VirtualClock
+from src.life.particles.gate import Gate
+
+
+class TestClock(unittest.TestCase):
+    def test_real_clock(self):
+        self.assertAlmostEqual(REAL_CLOCK.time(), time.time(), delta=1)
+
+    def test_virtual_clock(self):
+        clock = VirtualClock()
+        self.assertEqual(clock.time(), 0.0)
+        self.assertEqual(clock.advance(600), 600)
+        # Saat geri alınmaz
+        self.assertEqual(clock.advance_to(10), 600)
+        self.assertEqual(clock.time(), 600)
+
+    def test_gate_uses_clock(self):
+        clock = VirtualClock()
+        gate = Gate(clock=clock)
+        gate.close()
+        clock.advance(5)
+        self.assertEqual(gate.closed_seconds(), 5)
+        gate.open()
+        clock.advance(5)
+        self.assertEqual(gate.closed_seconds(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
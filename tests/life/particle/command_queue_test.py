@@ -0,0 +1,67 @@
+# tests/life/particle/command_queue_test.py
+
+import unittest
+from unittest.mock import MagicMock
+from src.life.particles.command_queue import CommandQueue
+from src.life.particles.core import Core
+
+
+class TestCommandQueue(unittest.TestCase):
+    def setUp(self):
+        self.acks = []
+        self.queue = CommandQueue().trigger_event(self.acks.append)
+
+    def test_commands_are_kept_per_instance(self):
+        for value in range(100):
+            self.queue.push(1, "formula", formula=f"{value}")
+        self.queue.push(2, "formula", formula="1")
+        self.assertEqual(len(self.queue), 101)
+        commands = self.queue.drain(1)
+        # Komutlar kaybolmaz ve gönderim sırasıyla alınır
+        self.assertEqual(
+            [command["formula"] for command in commands][:3], ["0", "1", "2"]
+        )
+        self.assertEqual(len(commands), 100)
+        self.assertEqual(self.queue.pending(1), 0)
+        self.assertEqual(self.queue.pending(2), 1)
+        self.assertEqual(self.queue.drain(3), [])
+
+    def test_unknown_action(self):
+        with self.assertRaises(ValueError):
+            self.queue.push(1, "delete")
+
+    def test_acknowledge(self):
+        command = self.queue.push(1, "formula", formula="1", sid="client")
+        self.queue.acknowledge(command, result=1)
+        self.queue.acknowledge(command, error="failed")
+        self.assertEqual(self.acks[0]["status"], "applied")
+        self.assertEqual(self.acks[0]["sid"], "client")
+        self.assertEqual(self.acks[1]["status"], "failed")
+        self.assertEqual(self.queue.metrics()["acknowledged"], 2)
+
+    def test_clear(self):
+        self.queue.push(1, "formula", formula="1")
+        self.assertEqual(self.queue.clear(), 1)
+        self.assertEqual(len(self.queue), 0)
+        self.assertEqual(self.acks[0]["status"], "failed")
+
+    def test_core_drains_commands_at_tick(self):
+        core = Core(name="test", lifetime_seconds=10, lifecycle=1)
+        core.logger = MagicMock()
+        core.trigger_event(None)
+        core.commands = self.queue
+        core.batch_scoring = True  # kod testi yaşam süresini değiştirmez
+        self.queue.push(core.id, "formula", formula="2 * self.generation")
+        self.queue.push(core.id, "formula", formula="self.__class__")
+        self.queue.push(core.id, "formula", formula="3 * self.generation")
+        core.life_start_time = core.clock.time()
+        core.tick()
+        self.assertEqual(core.lifetime_seconds, 3)
+        self.assertEqual(
+            [ack["status"] for ack in self.acks], ["applied", "failed", "applied"]
+        )
+        self.assertEqual(self.acks[0]["result"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 # tests/life/particle/core_test.py
+import time
 import unittest
 from unittest.mock import MagicMock
 from src.life.particles.core import Core
+from src.life.particles.gate import Gate
+from src.life.particles.opcodes import OPCODE_TABLE
 
 
 class TestCore(unittest.TestCase):
@@ -89,6 +92,65 @@ class TestCore(unittest.TestCase):
             self.core_instance
         )  # event_function'ın çağrıldığını kontrol et
 
+    def test_incremental_test_matches_full_scan(self):
+        # Artımlı sayaçların tüm kodu baştan taramakla aynı sonucu verdiğini kontrol eder
+        self.core_instance.logger = MagicMock()
+        for _ in range(300):
+            self.core_instance.evolve()
+            lifetime_seconds = self.core_instance.lifetime_seconds
+            self.core_instance.test()
+            codes = self.core_instance.codes
+            valid = sum(OPCODE_TABLE[byte] for byte in codes)
+            amount = sum(byte / 1000 for byte in codes)
+            expected = (
+                lifetime_seconds + amount
+                if valid / len(codes) >= 0.5
+                else lifetime_seconds - amount
+            )
+            self.assertEqual(self.core_instance._valid_opcode_count, valid)
+            self.assertEqual(self.core_instance.lifetime_seconds, expected)
+
+    def test_replaced_codes_reset_counters(self):
+        # Kodlar değiştirildiğinde sayaçların yeniden hesaplandığını kontrol eder
+        self.core_instance.logger = MagicMock()
+        self.core_instance.codes = bytearray([0xB8, 0x00, 0x05])
+        self.core_instance.test()
+        self.assertEqual(self.core_instance._valid_opcode_count, 2)
+        self.core_instance.codes = bytearray([0x05])
+        self.core_instance.test()
+        self.assertEqual(self.core_instance._valid_opcode_count, 0)
+        self.assertEqual(self.core_instance._byte_sum, 5 / 1000)
+
+    def test_paused_core_waits_without_ticking(self):
+        # Duraklatılan örnek adım atmamalı ve duraklatılan süre yaşam süresinden sayılmamalı
+        core = Core(name="test", lifetime_seconds=10, lifecycle=0.01)
+        core.logger = MagicMock()
+        core.trigger_event(MagicMock())
+        core.start()
+        time.sleep(0.05)
+        core.pause()
+        time.sleep(0.02)
+        length = len(core.codes)
+        time.sleep(0.1)
+        self.assertEqual(len(core.codes), length)
+        self.assertLess(core.lived_seconds(), 0.1)
+        core.resume()
+        time.sleep(0.05)
+        self.assertGreater(len(core.codes), length)
+        core.stop()
+        core.join(1)
+        self.assertFalse(core.is_alive())
+
+    def test_shared_gate_pauses_core(self):
+        # Ortak kapı kapandığında örnek duraklatılmış sayılır
+        gate = Gate()
+        self.core_instance._gate = gate
+        self.assertEqual(self.core_instance.status(), "Created")
+        gate.close()
+        self.assertEqual(self.core_instance.status(), "Paused")
+        gate.open()
+        self.assertEqual(self.core_instance.status(), "Running")
+
 
 if __name__ == "__main__":
     unittest.main()
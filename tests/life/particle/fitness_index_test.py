@@ -0,0 +1,73 @@
+# tests/life/particle/fitness_index_test.py
+
+import unittest
+from src.life.particles.fitness_index import FitnessIndex
+
+
+class Instance:
+    def __init__(self, id):
+        self.id = id
+        self.match_count = 0
+
+
+class TestFitnessIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = FitnessIndex()
+        self.instances = [Instance(id) for id in range(6)]
+        for instance in self.instances:
+            self.index.update(instance, float(instance.id))
+
+    def ids(self, instances):
+        return [instance.id for instance in instances]
+
+    def test_top(self):
+        self.assertEqual(self.ids(self.index.top(3)), [5, 4, 3])
+        # Okuma dizini değiştirmez
+        self.assertEqual(self.ids(self.index.top(6)), [5, 4, 3, 2, 1, 0])
+        self.assertEqual(self.index.top(0), [])
+
+    def test_update_and_remove(self):
+        self.index.update(self.instances[0], 10.0)
+        self.index.remove(5)
+        self.assertEqual(self.ids(self.index.top(2)), [0, 4])
+        self.assertEqual(len(self.index), 5)
+        self.assertNotIn(5, self.index)
+        self.assertIs(self.index.get(0), self.instances[0])
+        self.assertEqual(self.index.fitness(0), 10.0)
+
+    def test_ties_keep_insertion_order(self):
+        index = FitnessIndex()
+        for instance in self.instances:
+            index.update(instance, 1.0)
+        self.assertEqual(self.ids(index.top(3)), [0, 1, 2])
+
+    def test_stale_entries_are_compacted(self):
+        for value in range(1000):
+            self.index.update(self.instances[0], float(value))
+        self.assertLessEqual(len(self.index._heap), 2 * len(self.index) + 65)
+        self.assertEqual(self.ids(self.index.top(1)), [0])
+
+    def test_pairs(self):
+        # Örneklerinden biri eşleşemeyen çift bütünüyle atlanır
+        self.instances[4].match_count = 2
+        pairs = self.index.pairs(can_pair=lambda instance: instance.match_count < 2)
+        self.assertEqual([(a.id, b.id) for a, b in pairs], [(3, 2), (1, 0)])
+        self.assertEqual(len(self.index.pairs(limit=1)), 1)
+        self.assertEqual(self.index.pairs(limit=0), [])
+
+    def test_pairs_reads_only_needed_entries(self):
+        # Yalnızca gereken kayıtlar yığından alınıp geri eklenir; atlanan eski
+        # kayıtlar atılır
+        for value in range(10):
+            self.index.update(self.instances[0], float(value))
+        heap = list(self.index._heap)
+        pairs = self.index.pairs(limit=1)
+        self.assertEqual([(a.id, b.id) for a, b in pairs], [(0, 5)])
+        self.assertEqual(len(self.index._heap), len(heap) - 4)
+        pairs = self.index.pairs()
+        self.assertEqual([(a.id, b.id) for a, b in pairs], [(0, 5), (4, 3), (2, 1)])
+        self.assertEqual(len(self.index._heap), len(self.index))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# tests/life/particle/formula_test.py
+
+import unittest
+from unittest.mock import MagicMock
+from src.life.particles.core import Core
+import numpy as np
+from src.life.particles.formula import (
+    FormulaError,
+    attribute_columns,
+    compile_formula,
+    evaluate_columns,
+    evaluate_formula,
+)
+from src.life.particles.particle import Particle
+from src.life.particles.vector import Vector
+
+
+class TestFormula(unittest.TestCase):
+    def setUp(self):
+        self.core = Core(name="test", lifetime_seconds=10, lifecycle=1)
+        self.core.logger = MagicMock()
+
+    def test_arithmetic(self):
+        self.assertEqual(evaluate_formula("5.5 * self.generation", self.core), 5.5)
+        self.assertEqual(
+            evaluate_formula("max(1, self.lifetime_seconds) - 2", self.core), 8
+        )
+        self.assertAlmostEqual(
+            evaluate_formula("sqrt(16) + -pi", self.core), 4 - 3.14159, 4
+        )
+
+    def test_vector_components(self):
+        particle = Particle(
+            name="particle",
+            lifetime_seconds=10,
+            lifecycle=1,
+            charge=1.0,
+            mass=2.0,
+            spin=0.5,
+            energy=0,
+            position=Vector(1.0, 2.0, 3.0),
+            velocity=Vector(0.0, 0.0, 0.0),
+            momentum=Vector(0.0, 0.0, 0.0),
+            wave_function=Vector(0.0, 0.0, 0.0),
+        )
+        particle.logger = MagicMock()
+        self.assertEqual(evaluate_formula("self.mass * self.position.z", particle), 6)
+
+    def test_rejected(self):
+        for formula in (
+            "__import__('os').system('ls')",
+            "self.__class__",
+            "self.logger",
+            "self.position",
+            "open('file')",
+            "[1, 2]",
+            "'text'",
+            "lambda: 1",
+            "abs(x=1)",
+            "5 *",
+        ):
+            with self.subTest(formula=formula):
+                with self.assertRaises(FormulaError):
+                    compile_formula(formula)
+
+    def test_power(self):
+        # Üs alma ondalık sayılarla yapılır; dev tamsayılar oluşturulmaz
+        self.assertEqual(evaluate_formula("2 ** 3 + self.generation", self.core), 9.0)
+        with self.assertRaises(OverflowError):
+            evaluate_formula("9**9**9**9", self.core)
+        with self.assertRaises(OverflowError):
+            evaluate_formula("(self.generation + 9) ** 10 ** 10", self.core)
+        values = evaluate_columns("9**9**9**9", lambda name: None, 2)
+        self.assertTrue(np.all(np.isinf(values)))
+        with self.assertRaises(FormulaError):
+            compile_formula("_power(9, 9)")
+
+    def test_cached(self):
+        compile_formula.cache_clear()
+        code = compile_formula("self.fitness + 1")
+        self.assertIs(compile_formula("self.fitness + 1"), code)
+        self.assertEqual(compile_formula.cache_info().hits, 1)
+
+    def test_evaluate_columns(self):
+        columns = {
+            "generation": np.array([1.0, 2.0, 3.0]),
+            "position": np.array([[0, 0, 1], [0, 0, 2], [0, 0, 3]], dtype=float),
+        }
+        values = evaluate_columns(
+            "max(self.generation, 2) * self.position.z", columns.get, 3
+        )
+        np.testing.assert_array_equal(values, [2, 4, 9])
+        # Sabit sonuç tüm örneklere yayılır
+        np.testing.assert_array_equal(evaluate_columns("7", columns.get, 3), [7, 7, 7])
+
+    def test_attribute_columns(self):
+        column = attribute_columns([self.core])
+        np.testing.assert_array_equal(column("lifecycle"), [1.0])
+
+    def test_apply_formula(self):
+        self.assertEqual(self.core.apply_formula("2 * self.lifecycle"), 2)
+        self.assertEqual(self.core.lifetime_seconds, 2)
+        # Geçersiz formül yaşam süresini değiştirmez
+        self.assertIsNone(self.core.apply_formula("self.__dict__"))
+        self.assertEqual(self.core.lifetime_seconds, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# tests/life/particle/gate_test.py
+
+import threading
+import time
+import unittest
+from src.life.particles.gate import Gate
+
+
+class TestGate(unittest.TestCase):
+    def setUp(self):
+        self.gate = Gate()
+
+    def test_open_close(self):
+        self.assertTrue(self.gate.is_open())
+        self.gate.close()
+        self.assertFalse(self.gate.is_open())
+        self.gate.open()
+        self.assertTrue(self.gate.is_open())
+
+    def test_closed_seconds(self):
+        self.assertEqual(self.gate.closed_seconds(), 0)
+        self.gate.close()
+        time.sleep(0.05)
+        self.assertGreaterEqual(self.gate.closed_seconds(), 0.05)
+        self.gate.open()
+        closed_seconds = self.gate.closed_seconds()
+        time.sleep(0.02)
+        self.assertEqual(self.gate.closed_seconds(), closed_seconds)
+
+    def test_wait_for_wakes_on_open(self):
+        # Kapı açıldığında bekleyen thread uyanmalı
+        self.gate.close()
+        woke = threading.Event()
+
+        def waiter():
+            self.gate.wait_for(self.gate.is_open)
+            woke.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        self.assertFalse(woke.wait(0.05))
+        self.gate.open()
+        self.assertTrue(woke.wait(1))
+        thread.join(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,299 @@
+# tests/life/particle/integrator_test.py
+
+import unittest
+
+import numpy as np
+
+from src.life.particles.integrator import (
+    AdaptiveIntegrator,
+    ExplicitEuler,
+    Integrator,
+    ParticleIntegrator,
+    SemiImplicitEuler,
+    VelocityVerlet,
+    create_integrator,
+)
+from src.life.particles.particle import Particle
+from src.life.particles.population import (
+    PARTICLE_COLUMNS,
+    PARTICLE_VECTOR_COLUMNS,
+    PopulationStore,
+)
+from src.life.particles.random_buffer import RandomBuffer
+from src.life.particles.vector import Vector
+
+
+class TestParticleIntegrator(unittest.TestCase):
+    def setUp(self):
+        self.store = PopulationStore(
+            columns=PARTICLE_COLUMNS, vector_columns=PARTICLE_VECTOR_COLUMNS
+        )
+        self.particles = []
+        for index in range(4):
+            particle = Particle(
+                "test",
+                1,
+                1,
+                charge=1,
+                mass=index + 1,
+                spin=0,
+                energy=0,
+                position=Vector(index, 1, 2),
+                velocity=Vector(1, index, 0.5),
+                wave_function=Vector(0.1, 0.2, 0.3),
+            )
+            particle.bind_store(self.store)
+            self.particles.append(particle)
+        self.integrator = ParticleIntegrator(random=RandomBuffer(seed=1))
+
+    def assert_matches_update(self, slots):
+        # Vektörel adım Particle.update ile aynı sonucu verir
+        forces = np.arange(len(slots) * 3, dtype=np.float64).reshape(-1, 3) / 10
+        time_steps = np.linspace(0.1, 0.4, len(slots))
+        expected = []
+        for slot, force, time_step in zip(slots, forces, time_steps):
+            particle = Particle(
+                "expected",
+                1,
+                1,
+                charge=1,
+                mass=self.particles[slot].mass,
+                spin=0,
+                energy=0,
+                position=self.particles[slot].position,
+                velocity=self.particles[slot].velocity,
+                wave_function=self.particles[slot].wave_function,
+            )
+            particle.update(force=Vector(*force), time_step=time_step)
+            expected.append(particle)
+
+        self.integrator.step(self.store, slots, forces, time_steps)
+        for slot, particle in zip(slots, expected):
+            for name in PARTICLE_VECTOR_COLUMNS:
+                np.testing.assert_allclose(
+                    list(getattr(self.particles[slot], name).to_json().values()),
+                    list(getattr(particle, name).to_json().values()),
+                )
+
+    def test_contiguous_slots(self):
+        self.assert_matches_update([0, 1, 2, 3])
+
+    def test_scattered_slots(self):
+        self.assert_matches_update([0, 2, 3])
+        # Seçilmeyen slot değişmez
+        self.assertEqual(self.particles[1].position, Vector(1, 1, 2))
+
+    def test_live_slots(self):
+        self.particles[2].stopped = True
+        self.assertEqual(self.integrator.step(self.store), 3)
+        self.assertEqual(self.particles[2].velocity, Vector(1, 2, 0.5))
+        self.assertNotEqual(self.particles[0].velocity, Vector(1, 0, 0.5))
+        self.assertEqual(self.integrator.integrated, 3)
+
+    def test_seed(self):
+        # Aynı tohumla aynı kuvvetler ve zaman adımları üretilir
+        other = ParticleIntegrator(random=RandomBuffer(seed=1))
+        np.testing.assert_array_equal(self.integrator.forces(5), other.forces(5))
+        np.testing.assert_array_equal(
+            self.integrator.time_steps(5), other.time_steps(5)
+        )
+        steps = self.integrator.time_steps(100)
+        self.assertTrue(np.all((steps >= 0.0001) & (steps < 0.001)))
+
+    def test_method_matches_update(self):
+        # Yarı örtük Euler yöntemi varsayılan yerinde adımla aynı sonucu verir
+        forces = np.arange(12, dtype=np.float64).reshape(-1, 3) / 10
+        time_steps = np.linspace(0.1, 0.4, 4)
+        other = PopulationStore(
+            columns=PARTICLE_COLUMNS, vector_columns=PARTICLE_VECTOR_COLUMNS
+        )
+        copies = []
+        for particle in self.particles:
+            copy = Particle(
+                "copy",
+                1,
+                1,
+                charge=1,
+                mass=particle.mass,
+                spin=0,
+                energy=0,
+                position=particle.position,
+                velocity=particle.velocity,
+                wave_function=particle.wave_function,
+            )
+            copy.bind_store(other)
+            copies.append(copy)
+        self.integrator.step(self.store, None, forces, time_steps)
+        method = ParticleIntegrator(method=SemiImplicitEuler())
+        method.step(other, None, forces, time_steps)
+        for particle, copy in zip(self.particles, copies):
+            for name in PARTICLE_VECTOR_COLUMNS:
+                np.testing.assert_allclose(
+                    list(getattr(particle, name).to_json().values()),
+                    list(getattr(copy, name).to_json().values()),
+                )
+        self.assertEqual(method.metrics()["steps"], 1)
+        self.assertEqual(method.metrics()["integrator"], "semi_implicit_euler")
+
+    def test_fixed_time_step(self):
+        integrator = ParticleIntegrator(time_step=0.01)
+        np.testing.assert_array_equal(integrator.time_steps(3), [0.01] * 3)
+
+    def harmonic(self, time_step, stiffness=4.0):
+        # F = -k x için analitik çözüm: x0 cos(ωt) + v0 / ω sin(ωt)
+        position = self.store.column("position").copy()
+        velocity = self.store.column("velocity").copy()
+        omega = np.sqrt(stiffness / self.store.column("mass"))[:, None]
+        angle = omega * time_step
+        return (
+            position * np.cos(angle) + velocity / omega * np.sin(angle),
+            velocity * np.cos(angle) - position * omega * np.sin(angle),
+        )
+
+    def test_field_is_evaluated_along_the_step(self):
+        # Konuma bağlı kuvvet ara konumlarda yeniden hesaplanır; uyarlamalı
+        # adım aralığı alt adımlara böler ve analitik çözüme yaklaşır
+        position, velocity = self.harmonic(1.0)
+        adaptive = AdaptiveIntegrator(tolerance=1e-7)
+        integrator = ParticleIntegrator(
+            method=adaptive, field=lambda position: -4.0 * position
+        )
+        integrator.step(self.store, forces=np.zeros((4, 3)), time_steps=1.0)
+        np.testing.assert_allclose(self.store.column("position"), position, atol=1e-5)
+        np.testing.assert_allclose(self.store.column("velocity"), velocity, atol=1e-5)
+        self.assertGreater(adaptive.substeps, 1)
+        self.assertGreater(adaptive.evaluated, 2)
+
+    def test_field_without_method(self):
+        # Yöntem yoksa kuvvet adım başındaki konumda bir kez hesaplanır
+        expected = self.store.column("position").copy()
+        velocity = self.store.column("velocity").copy()
+        mass = self.store.column("mass")[:, None]
+        velocity += -4.0 * expected / mass * 0.01
+        expected += velocity * 0.01
+        integrator = ParticleIntegrator(field=lambda position: -4.0 * position)
+        integrator.step(self.store, forces=np.zeros((4, 3)), time_steps=0.01)
+        np.testing.assert_allclose(self.store.column("position"), expected)
+
+
+class TestIntegrators(unittest.TestCase):
+    @staticmethod
+    def oscillator(position):
+        # Harmonik salınıcı: a = -x
+        return -position
+
+    def run_oscillator(self, method, time_step, steps):
+        position, velocity = np.array([1.0, 0.0, 0.0]), np.zeros(3)
+        for _ in range(steps):
+            position, velocity = method.step(
+                position, velocity, self.oscillator, time_step
+            )
+        return position
+
+    def test_constant_acceleration(self):
+        # Sabit ivmede Verlet tam çözümü verir, Euler yöntemleri vermez
+        position, velocity = np.zeros(3), np.ones(3)
+        acceleration = np.array([0.0, -9.8, 2.0])
+        expected = position + velocity * 0.5 + 0.5 * acceleration * 0.5**2
+        result, _ = VelocityVerlet().step(
+            position, velocity, lambda position: acceleration, 0.5
+        )
+        np.testing.assert_allclose(result, expected)
+        for method in (ExplicitEuler(), SemiImplicitEuler()):
+            result, _ = method.step(
+                position, velocity, lambda position: acceleration, 0.5
+            )
+            self.assertFalse(np.allclose(result, expected))
+
+    def test_order(self):
+        # İkinci mertebe yöntemin hatası birinci mertebeden küçüktür
+        exact = np.cos(1.0)
+        euler = self.run_oscillator(SemiImplicitEuler(), 0.01, 100)
+        verlet = self.run_oscillator(VelocityVerlet(), 0.01, 100)
+        self.assertLess(abs(verlet[0] - exact), abs(euler[0] - exact) / 10)
+
+    def test_adaptive_tolerance(self):
+        # Uyarlamalı adım tek büyük adımı toleransa kadar alt adımlara böler
+        exact = np.cos(2.0)
+        coarse = self.run_oscillator(VelocityVerlet(), 2.0, 1)
+        adaptive = AdaptiveIntegrator(tolerance=1e-6)
+        result = self.run_oscillator(adaptive, 2.0, 1)
+        self.assertGreater(abs(coarse[0] - exact), 0.1)
+        self.assertLess(abs(result[0] - exact), 1e-3)
+        metrics = adaptive.metrics()
+        self.assertEqual(metrics["steps"], 1)
+        self.assertGreater(metrics["substeps"], 1)
+        self.assertEqual(metrics["method"], "verlet")
+
+    def test_adaptive_cost(self):
+        # Aynı doğrulukta uyarlamalı adım sabit küçük adımdan az hesaplama yapar
+        exact = np.cos(10.0)
+        adaptive = AdaptiveIntegrator(tolerance=1e-4)
+        result = self.run_oscillator(adaptive, 1.0, 10)
+        error = abs(result[0] - exact)
+        fixed = VelocityVerlet()
+        steps = 10
+        while abs(self.run_oscillator(fixed, 10.0 / steps, steps)[0] - exact) > error:
+            steps *= 2
+        self.assertLess(adaptive.evaluated, 2 * fixed.evaluations * steps)
+        self.assertEqual(fixed.metrics()["cost_per_step"], 2)
+
+    def test_adaptive_remembers_step(self):
+        # Kabul edilen alt adım sonraki aralıkta ilk deneme olur
+        adaptive = AdaptiveIntegrator(tolerance=1e-8)
+        self.run_oscillator(adaptive, 1.0, 1)
+        self.assertLess(adaptive.fraction, 1.0)
+        rejected = adaptive.rejected
+        self.run_oscillator(adaptive, 1.0, 1)
+        self.assertLessEqual(adaptive.rejected - rejected, 1)
+
+    def test_particle_field(self):
+        # Parçacığın konuma bağlı kuvveti uyarlamalı adımda ara konumlarda
+        # yeniden hesaplanır
+        particle = Particle(
+            "test",
+            1,
+            1,
+            charge=1,
+            mass=1,
+            spin=0,
+            energy=0,
+            position=Vector(1, 0, 0),
+            velocity=Vector(0, 1, 0),
+        )
+        particle.integrator = AdaptiveIntegrator(tolerance=1e-7)
+        particle.field = self.oscillator
+        particle.update(force=Vector(0, 0, 0), time_step=2.0)
+        # x = cos(t), y = sin(t)
+        self.assertAlmostEqual(particle.position.x, np.cos(2.0), places=5)
+        self.assertAlmostEqual(particle.position.y, np.sin(2.0), places=5)
+        self.assertAlmostEqual(particle.velocity.x, -np.sin(2.0), places=5)
+        self.assertGreater(particle.integrator.substeps, 1)
+
+    def test_clone(self):
+        adaptive = AdaptiveIntegrator(method=ExplicitEuler(), tolerance=1e-3)
+        self.run_oscillator(adaptive, 0.1, 2)
+        clone = adaptive.clone()
+        self.assertEqual(clone.steps, 0)
+        self.assertEqual(clone.tolerance, 1e-3)
+        self.assertIsInstance(clone.method, ExplicitEuler)
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            Integrator()
+
+    def test_create_integrator(self):
+        self.assertIsNone(create_integrator())
+        self.assertIsInstance(create_integrator("verlet"), VelocityVerlet)
+        adaptive = create_integrator("euler", tolerance=1e-3)
+        self.assertIsInstance(adaptive, AdaptiveIntegrator)
+        self.assertIsInstance(adaptive.method, ExplicitEuler)
+        self.assertIsInstance(create_integrator(tolerance=1e-3).method, VelocityVerlet)
+        with self.assertRaises(ValueError):
+            create_integrator("rk4")
+        with self.assertRaises(ValueError):
+            create_integrator(tolerance=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
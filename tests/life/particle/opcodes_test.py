@@ -0,0 +1,28 @@
+# tests/life/particle/opcodes_test.py
+
+import unittest
+from src.life.particles.opcodes import (
+    OPCODE_RANGES,
+    OPCODE_TABLE,
+    count_valid_opcodes,
+)
+
+
+class TestOpcode(unittest.TestCase):
+    def test_table_size(self):
+        self.assertEqual(len(OPCODE_TABLE), 256)
+
+    def test_table_matches_ranges(self):
+        # Tablo, aralık listesindeki her byte için 1 değerini taşımalı
+        for byte in range(256):
+            expected = any(start <= byte <= end for start, end, _ in OPCODE_RANGES)
+            self.assertEqual(OPCODE_TABLE[byte], int(expected))
+
+    def test_count_valid_opcodes(self):
+        codes = bytearray([0xB8, 0xE9, 0x04, 0x7F, 0xFF])
+        self.assertEqual(count_valid_opcodes(codes), 3)
+        self.assertEqual(count_valid_opcodes(bytearray()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 # tests/life/particle/particle_test.py
 
 import unittest
+from src.life.particles.integrator import SemiImplicitEuler, VelocityVerlet
 from src.life.particles.particle import Particle
 from src.life.particles.vector import Vector
 
@@ -53,9 +54,9 @@ class TestParticle(unittest.TestCase):
 
     def test_particle_update(self):
         # Parçacığın güncellenmesini kontrol etme
-        initial_position = self.particle_1.position
-        initial_velocity = self.particle_1.velocity
-        initial_momentum = self.particle_1.momentum
+        initial_position = self.particle_1.position.copy()
+        initial_velocity = self.particle_1.velocity.copy()
+        initial_momentum = self.particle_1.momentum.copy()
         self.particle_1.update(force=Vector(0.1, 0.1, 0.1), time_step=0.2)
         self.assertNotEqual(self.particle_1.position.x, initial_position.x)
         self.assertNotEqual(self.particle_1.position.y, initial_position.y)
@@ -67,9 +68,54 @@ class TestParticle(unittest.TestCase):
         self.assertNotEqual(self.particle_1.momentum.y, initial_momentum.y)
         self.assertNotEqual(self.particle_1.momentum.z, initial_momentum.z)
 
+    def test_vectors_are_copied(self):
+        # Yerinde güncellenen vektörler parçacıklar arasında paylaşılmaz
+        velocity = Vector(0.1, 0.1, 0.1)
+        particles = [
+            Particle(
+                "test", 1, 1, charge=1, mass=1, spin=0, energy=0, velocity=velocity
+            )
+            for _ in range(2)
+        ]
+        particles[0].update(force=Vector(1, 1, 1), time_step=0.5)
+        self.assertEqual(velocity, Vector(0.1, 0.1, 0.1))
+        self.assertEqual(particles[1].velocity, Vector(0.1, 0.1, 0.1))
+        self.assertEqual(particles[1].position, Vector())
+        self.assertEqual(particles[0].velocity, Vector(0.6, 0.6, 0.6))
+        self.assertEqual(particles[0].momentum, particles[0].velocity)
+
+    def test_integrator(self):
+        # Yarı örtük Euler yöntemi varsayılan güncellemeyle aynı sonucu verir
+        particles = [
+            Particle(
+                "test",
+                1,
+                1,
+                charge=1,
+                mass=2,
+                spin=0,
+                energy=0,
+                position=Vector(1, 2, 3),
+                velocity=Vector(0.1, 0.2, 0.3),
+            )
+            for _ in range(3)
+        ]
+        particles[1].integrator = SemiImplicitEuler()
+        particles[2].integrator = VelocityVerlet()
+        for particle in particles:
+            particle.update(force=Vector(1, -1, 2), time_step=0.5)
+        self.assertEqual(particles[1].position, particles[0].position)
+        self.assertEqual(particles[1].velocity, particles[0].velocity)
+        self.assertEqual(particles[1].momentum, particles[0].momentum)
+        self.assertEqual(particles[1].wave_function, particles[0].wave_function)
+        # Verlet: x = x0 + v0 * t + (F / m) * t² / 2
+        self.assertEqual(particles[2].position, Vector(1.1125, 2.0375, 3.275))
+        self.assertEqual(particles[2].velocity, particles[0].velocity)
+        self.assertEqual(particles[2].integrator.steps, 1)
+
     def test_schrodinger_eq(self):
         # Schrödinger denkleminin hesaplanmasını kontrol etme
-        wave_function_before = self.particle_1.wave_function
+        wave_function_before = self.particle_1.wave_function.copy()
         self.particle_1.evolve()
         self.assertNotAlmostEqual(
             self.particle_1.wave_function.x, wave_function_before.x
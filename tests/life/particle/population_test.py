@@ -0,0 +1,212 @@
+# tests/life/particle/population_test.py
+
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock
+import numpy as np
+from src.life.particles.core import Core
+from src.life.particles.particle import Particle
+from src.life.particles.population import (
+    PARTICLE_COLUMNS,
+    PARTICLE_VECTOR_COLUMNS,
+    PopulationStore,
+)
+from src.life.particles.vector import Vector
+
+
+class TestPopulationStore(unittest.TestCase):
+    def setUp(self):
+        self.store = PopulationStore(capacity=2)
+
+    def create_core(self, lifetime_seconds=10):
+        core = Core(name="test", lifetime_seconds=lifetime_seconds, lifecycle=1)
+        core.logger = MagicMock()
+        core.trigger_event(None)
+        core.bind_store(self.store)
+        return core
+
+    def test_bind_moves_attributes_to_columns(self):
+        core = self.create_core()
+        self.assertNotIn("lifetime_seconds", core.__dict__)
+        self.assertEqual(core.lifetime_seconds, 10)
+        core.increase_lifespan(seconds=5)
+        self.assertEqual(self.store.column("lifetime_seconds")[core._slot], 15)
+        self.assertEqual(core.to_json()["lifetime_seconds"], 15)
+
+    def test_growth(self):
+        cores = [self.create_core(lifetime_seconds=index + 1) for index in range(5)]
+        self.assertGreaterEqual(self.store.capacity, 5)
+        self.assertEqual(len(self.store), 5)
+        for index, core in enumerate(cores):
+            self.assertEqual(core.lifetime_seconds, index + 1)
+
+    def test_calculate_fitness_matches_core(self):
+        cores = [self.create_core(), self.create_core(lifetime_seconds=float("inf"))]
+        lengths = []
+        for core in cores:
+            core.codes = bytearray([1, 2, 3])
+            core.elapsed_lifespan = 2.0
+            lengths.append(len(core.codes))
+        fitness = self.store.calculate_fitness(lengths)
+        for core, value in zip(cores, fitness.tolist()):
+            self.assertEqual(core.fitness, value)
+            self.assertEqual(core.calculate_fitness(), value)
+
+    def test_rank_and_snapshot(self):
+        cores = [self.create_core() for _ in range(3)]
+        for core, fitness in zip(cores, (0.5, 2.0, 1.0)):
+            core.fitness = fitness
+        ranked = self.store.rank().tolist()
+        self.assertEqual(ranked, [cores[1]._slot, cores[2]._slot, cores[0]._slot])
+        snapshot = self.store.snapshot()
+        self.assertEqual([item["id"] for item in snapshot], [core.id for core in cores])
+        self.assertEqual(snapshot[1]["fitness"], 2.0)
+        # Görüntü to_json ile aynı şemadadır
+        cores[0].lifetime_seconds = float("inf")
+        cores[0].status()
+        self.assertEqual(self.store.snapshot([cores[0]._slot])[0], cores[0].to_json())
+        # Yalnızca tutamacı olan slotlarda örnek bilgileri boştur
+        slot = self.store.allocate()
+        self.store.set("id", slot, 99)
+        data = self.store.snapshot([slot])[0]
+        self.assertEqual(set(data), set(cores[0].to_json()))
+        self.assertEqual((data["id"], data["name"], data["codes"]), (99, None, []))
+
+    def test_live_slots(self):
+        cores = [self.create_core() for _ in range(3)]
+        cores[1].stop()
+        self.assertEqual(self.store.live_slots().tolist(), [0, 2])
+
+    def test_particle_vector_columns(self):
+        store = PopulationStore(
+            columns=PARTICLE_COLUMNS, vector_columns=PARTICLE_VECTOR_COLUMNS
+        )
+        particle = Particle(
+            name="test",
+            lifetime_seconds=10,
+            lifecycle=1,
+            charge=-1.6e-19,
+            mass=9.1e-31,
+            spin=1 / 2,
+            energy=0,
+            position=Vector(1, 2, 3),
+            velocity=Vector(0.1, 0.1, 0.1),
+            momentum=Vector(0, 0, 0),
+        )
+        particle.bind_store(store)
+        self.assertEqual(particle.position, Vector(1, 2, 3))
+        particle.update(force=Vector(0, 0, 0), time_step=1)
+        self.assertEqual(store.column("position")[0].tolist(), [1.1, 2.1, 3.1])
+        self.assertEqual(particle.to_json()["position"]["x"], 1.1)
+        particle.status()
+        self.assertEqual(store.snapshot()[0], particle.to_json())
+
+    def test_handles(self):
+        # Tutamaç slotun sütunlarını örnekle aynı öznitelik adlarıyla okur ve yazar
+        core = self.create_core()
+        handle = self.store.handles[core._slot]
+        self.assertIs(core._handle, handle)
+        self.assertIs(self.store.instances[core._slot], core)
+        self.assertFalse(hasattr(handle, "__dict__"))
+        handle.lifetime_seconds = 3
+        self.assertEqual(core.lifetime_seconds, 3)
+        core.match_count = 2
+        self.assertEqual(handle.match_count, 2)
+        # Örneği olmayan slot yalnızca tutamaçla kullanılır
+        slot = self.store.allocate()
+        self.assertIsNone(self.store.instances[slot])
+        self.store.handles[slot].fitness = 1.5
+        self.assertEqual(self.store.column("fitness")[slot], 1.5)
+
+    def test_handle_memory(self):
+        # Tutamaçlı popülasyonun slot başına belleği Particle nesnelerinden
+        # en az bir mertebe azdır
+        size = 200
+
+        def measure(create):
+            tracemalloc.start()
+            items = create()
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            self.assertEqual(len(items), size)
+            return memory / size
+
+        def create_store():
+            store = PopulationStore(
+                columns=PARTICLE_COLUMNS,
+                vector_columns=PARTICLE_VECTOR_COLUMNS,
+                capacity=size,
+            )
+            for _ in range(size):
+                store.allocate()
+            return store.handles
+
+        def create_particles():
+            return [
+                Particle(
+                    name="test",
+                    lifetime_seconds=10,
+                    lifecycle=1,
+                    charge=-1.6e-19,
+                    mass=9.1e-31,
+                    spin=1 / 2,
+                    energy=0,
+                    position=Vector(0, 0, 0),
+                    velocity=Vector(0, 0, 0),
+                    momentum=Vector(0, 0, 0),
+                )
+                for _ in range(size)
+            ]
+
+        create_particles()  # modül ve logger önbellekleri ölçüme girmesin
+        handle_memory = measure(create_store)
+        particle_memory = measure(create_particles)
+        self.assertLess(handle_memory * 10, particle_memory)
+
+    def test_apply_formula(self):
+        first = self.create_core()
+        second = self.create_core()
+        second.generation = 3
+        stopped = self.create_core()
+        stopped.stopped = True
+        values = self.store.apply_formula("self.generation * self.lifecycle + 1")
+        np.testing.assert_array_equal(values, [2, 4])
+        self.assertEqual(first.lifetime_seconds, 2)
+        self.assertEqual(second.lifetime_seconds, 4)
+        # Durdurulan örnek güncellenmez
+        self.assertEqual(stopped.lifetime_seconds, 10)
+
+    def test_shared_store(self):
+        store = PopulationStore.shared(
+            columns=PARTICLE_COLUMNS, vector_columns=PARTICLE_VECTOR_COLUMNS, capacity=2
+        )
+        attached = PopulationStore.shared(
+            columns=PARTICLE_COLUMNS,
+            vector_columns=PARTICLE_VECTOR_COLUMNS,
+            capacity=2,
+            name=store.name,
+        )
+        try:
+            core = Core(name="test", lifetime_seconds=10, lifecycle=1)
+            core.trigger_event(None)
+            core.bind_store(attached)
+            core.fitness = 2.5
+            # Yazılan değer aynı bloğa bağlı diğer depodan okunur
+            self.assertEqual(store.get("fitness", core._slot), 2.5)
+            self.assertEqual(store.get("lifetime_seconds", core._slot), 10)
+            attached.set("position", 1, Vector(1, 2, 3))
+            self.assertEqual(store.get("position", 1), Vector(1, 2, 3))
+            # Paylaşılan depo büyütülemez
+            attached.allocate(None)
+            with self.assertRaises(RuntimeError):
+                attached.allocate(None)
+        finally:
+            attached.detach()
+            store.detach()
+        # Son değerler sürece özel bellekte kalır
+        self.assertIsNone(store.name)
+        self.assertEqual(store.get("fitness", 0), 2.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
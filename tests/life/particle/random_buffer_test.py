@@ -0,0 +1,59 @@
+# tests/life/particle/random_buffer_test.py
+
+import unittest
+from src.life.particles.random_buffer import RandomBuffer
+
+
+class TestRandomBuffer(unittest.TestCase):
+    def test_invalid_block_size(self):
+        with self.assertRaises(ValueError):
+            RandomBuffer(block_size=0)
+
+    def test_seeded_values_repeat(self):
+        first = RandomBuffer(seed=42, block_size=16)
+        second = RandomBuffer(seed=42, block_size=16)
+        # Blok sınırlarını aşan dizilerde de aynı değerler üretilir
+        self.assertEqual(
+            [first.byte() for _ in range(100)], [second.byte() for _ in range(100)]
+        )
+        self.assertEqual(
+            [first.uniform(-1, 1) for _ in range(10)],
+            [second.uniform(-1, 1) for _ in range(10)],
+        )
+
+    def test_ranges(self):
+        buffer = RandomBuffer(seed=1)
+        values = [buffer.byte() for _ in range(5000)]
+        self.assertTrue(all(0 <= value <= 255 for value in values))
+        self.assertGreater(len(set(values)), 200)
+        for _ in range(1000):
+            value = buffer.uniform(0.9, 1.1)
+            self.assertGreaterEqual(value, 0.9)
+            self.assertLess(value, 1.1)
+            self.assertIsInstance(value, float)
+
+    def test_spawn(self):
+        parent = RandomBuffer(seed=7)
+        child = parent.spawn(1)
+        self.assertEqual(child.seed.spawn_key, (1,))
+        self.assertEqual(child.spawn(2).seed.spawn_key, (1, 2))
+        self.assertEqual(child.byte(), RandomBuffer(seed=7).spawn(1).byte())
+        self.assertIsNone(RandomBuffer().spawn(1).seed)
+
+    def test_spawn_streams_are_distinct(self):
+        # Sıfır anahtarla türetilen tampon üst tamponun dizisini tekrarlamaz
+        def stream(buffer):
+            return bytes(buffer.byte() for _ in range(32))
+
+        buffers = [
+            RandomBuffer(seed=7),
+            RandomBuffer(seed=7).spawn(0),
+            RandomBuffer(seed=7).spawn(3),
+            RandomBuffer(seed=7).spawn(3).spawn(0),
+            RandomBuffer(seed=7).spawn(0).spawn(3),
+        ]
+        self.assertEqual(len(set(stream(buffer) for buffer in buffers)), len(buffers))
+
+
+if __name__ == "__main__":
+    unittest.main()
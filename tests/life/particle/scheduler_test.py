@@ -0,0 +1,193 @@
+# tests/life/particle/scheduler_test.py
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from src.life.particles.core import Core
+from src.life.particles.gate import Gate
+from src.life.particles.scheduler import DiscreteEventScheduler, TickScheduler
+
+
+class TestTickScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TickScheduler(number_of_workers=2, name="test").start()
+
+    def tearDown(self):
+        self.scheduler.stop(timeout=1)
+
+    def create_core(self, lifetime_seconds=10):
+        core = Core(name="test", lifetime_seconds=lifetime_seconds, lifecycle=0.01)
+        core.logger = MagicMock()
+        core.trigger_event(MagicMock())
+        core.scheduler = self.scheduler
+        return core
+
+    def wait_for(self, condition, timeout=2):
+        # Yoğun makinelerde thread'lerin adım atması gecikebilir
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+    def test_invalid_number_of_workers(self):
+        with self.assertRaises(ValueError):
+            TickScheduler(number_of_workers=0)
+
+    def test_cores_run_without_own_threads(self):
+        # Örnekler kendi thread'lerini açmadan adım atmalı
+        thread_count = threading.active_count()
+        cores = [self.create_core().start() for _ in range(50)]
+        time.sleep(0.2)
+        self.assertLessEqual(threading.active_count(), thread_count)
+        for core in cores:
+            self.assertFalse(core.is_alive())
+            self.assertGreater(len(core.codes), 0)
+            self.assertGreater(core.elapsed_lifespan, 0)
+
+    def test_core_finishes_after_lifetime(self):
+        core = self.create_core(lifetime_seconds=0.05)
+        core.batch_scoring = True  # test() yaşam süresini değiştirmesin
+        core.start()
+        time.sleep(0.3)
+        self.assertTrue(core._stop_event.is_set())
+        self.assertEqual(core.status(), "Stopped")
+        core.event_function.assert_called_with(core)
+
+    def test_paused_core_does_not_tick(self):
+        core = self.create_core().start()
+        core.pause()
+        self.assertTrue(self.wait_for(lambda: self.scheduler.parked == 1))
+        length = len(core.codes)
+        time.sleep(0.1)
+        self.assertEqual(len(core.codes), length)
+        # Duraklatılan örnek heap'te dönmez, bekletilir
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertEqual(self.scheduler.parked, 1)
+        core.resume()
+        time.sleep(0.1)
+        self.assertGreater(len(core.codes), length)
+        self.assertEqual(self.scheduler.parked, 0)
+
+    def test_closed_gate_parks_cores(self):
+        gate = Gate()
+        cores = [self.create_core() for _ in range(3)]
+        for core in cores:
+            core._gate = gate
+            core.start()
+        gate.close()
+        self.assertTrue(self.wait_for(lambda: self.scheduler.parked == 3))
+        lengths = [len(core.codes) for core in cores]
+        gate.open()
+        self.scheduler.resume()
+        time.sleep(0.1)
+        self.assertEqual(self.scheduler.parked, 0)
+        for core, length in zip(cores, lengths):
+            self.assertGreater(len(core.codes), length)
+
+    def test_stopped_parked_core_finishes(self):
+        core = self.create_core().start()
+        core.pause()
+        self.assertTrue(self.wait_for(lambda: self.scheduler.parked == 1))
+        core.stop()
+        self.assertTrue(self.wait_for(lambda: self.scheduler.parked == 0))
+        self.assertTrue(core.stopped)
+
+    def test_stop(self):
+        # Sıradaki ve bekletilen örneklerin yaşam döngüsü sonlandırılır
+        running = self.create_core().start()
+        paused = self.create_core().start()
+        paused.pause()
+        time.sleep(0.05)
+        self.scheduler.stop(timeout=1)
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertEqual(self.scheduler.parked, 0)
+        for core in (running, paused):
+            self.assertTrue(core.stopped)
+            self.assertTrue(core._stop_event.is_set())
+            core.event_function.assert_called_with(core)
+        length = len(running.codes)
+        time.sleep(0.05)
+        self.assertEqual(len(running.codes), length)
+
+
+class TestDiscreteEventScheduler(unittest.TestCase):
+    def setUp(self):
+        self.engine = DiscreteEventScheduler(name="test")
+
+    def tearDown(self):
+        self.engine.stop(timeout=1)
+
+    def create_core(self, lifetime_seconds=600, lifecycle=1):
+        core = Core(name="test", lifetime_seconds=lifetime_seconds, lifecycle=lifecycle)
+        core.logger = MagicMock()
+        core.trigger_event(MagicMock())
+        core.batch_scoring = True  # test() yaşam süresini değiştirmesin
+        core.clock = self.engine.clock
+        core._gate = Gate(clock=self.engine.clock)
+        core.scheduler = self.engine
+        return core
+
+    def wait_for_stop(self, core, timeout=5):
+        core._stop_event.wait(timeout)
+        return core._stop_event.is_set()
+
+    def test_lifetime_runs_faster_than_real_time(self):
+        core = self.create_core()
+        started = time.time()
+        self.engine.start()
+        core.start()
+        self.assertTrue(self.wait_for_stop(core))
+        self.assertLess(time.time() - started, 5)
+        # Adımlar sanal saatte yaşam süresi boyunca işlendi
+        self.assertEqual(self.engine.clock.time(), 600)
+        self.assertEqual(len(core.codes), 599)
+        self.assertEqual(core.elapsed_lifespan, 599)
+        self.assertEqual(core.fitness, (600 / 599 + 1) / 2)
+
+    def test_events_in_time_order(self):
+        fast = self.create_core(lifetime_seconds=10, lifecycle=1)
+        slow = self.create_core(lifetime_seconds=10, lifecycle=2)
+        fast.start()
+        slow.start()
+        self.engine.start()
+        self.assertTrue(self.wait_for_stop(fast))
+        self.assertTrue(self.wait_for_stop(slow))
+        self.assertEqual(len(fast.codes), 9)
+        self.assertEqual(len(slow.codes), 4)
+
+    def test_closed_gate_stops_virtual_time(self):
+        gate = Gate(clock=self.engine.clock)
+        self.engine.gate = gate
+        core = self.create_core()
+        core._gate = gate
+        gate.close()
+        self.engine.start()
+        core.start()
+        time.sleep(0.1)
+        self.assertEqual(self.engine.clock.time(), 0)
+        self.assertEqual(len(core.codes), 0)
+        gate.open()
+        self.assertTrue(self.wait_for_stop(core))
+        self.assertEqual(self.engine.clock.time(), 600)
+
+    def test_paused_core_stops_virtual_time(self):
+        # Duraklatılan örnek sıradan çıkarılır; sanal zaman onun için ilerlemez
+        core = self.create_core()
+        core.start()
+        core.pause()
+        self.engine.start()
+        time.sleep(0.1)
+        self.assertEqual(self.engine.clock.time(), 1)
+        self.assertEqual(len(self.engine), 0)
+        self.assertEqual(self.engine.parked, 1)
+        self.assertEqual(len(core.codes), 0)
+        core.resume()
+        self.assertTrue(self.wait_for_stop(core))
+        # Duraklatılan bir saniye yaşam süresinden sayılmaz
+        self.assertEqual(self.engine.clock.time(), 601)
+        self.assertEqual(len(core.codes), 599)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# tests/life/particle/scorer_test.py
+
+import random
+import unittest
+from unittest.mock import MagicMock
+from src.life.particles.core import Core
+from src.life.particles.opcodes import count_valid_opcodes
+from src.life.particles.scorer import BatchScorer
+
+
+class TestBatchScorer(unittest.TestCase):
+    def setUp(self):
+        self.scorer = BatchScorer()
+
+    def test_score_matches_per_genome_counts(self):
+        genomes = [
+            bytes(random.randint(0, 255) for _ in range(random.randint(0, 50)))
+            for _ in range(20)
+        ]
+        valid_counts, lengths, byte_sums = self.scorer.score(genomes)
+        for genome, valid, length, byte_sum in zip(
+            genomes, valid_counts, lengths, byte_sums
+        ):
+            self.assertEqual(valid, count_valid_opcodes(genome))
+            self.assertEqual(length, len(genome))
+            self.assertEqual(byte_sum, sum(byte / 1000 for byte in genome))
+
+    def test_score_empty_population(self):
+        valid_counts, lengths, byte_sums = self.scorer.score([])
+        self.assertEqual(len(valid_counts), 0)
+        self.assertEqual(len(lengths), 0)
+        self.assertEqual(len(byte_sums), 0)
+
+    def test_score_instances_applies_lifespan(self):
+        # Toplu puanlamanın Core.test ile aynı yaşam süresi değişimini verdiğini kontrol eder
+        batch = Core(name="batch", lifetime_seconds=10, lifecycle=1)
+        single = Core(name="single", lifetime_seconds=10, lifecycle=1)
+        empty = Core(name="empty", lifetime_seconds=10, lifecycle=1)
+        for core in (batch, single, empty):
+            core.logger = MagicMock()
+        batch.codes = bytearray([0xB8, 0x00, 0x05, 0xFF])
+        single.codes = bytearray(batch.codes)
+
+        scored = self.scorer.score_instances([batch, empty])
+        single.test()
+
+        self.assertEqual(scored, 1)
+        self.assertEqual(batch.lifetime_seconds, single.lifetime_seconds)
+        self.assertEqual(empty.lifetime_seconds, 10)
+
+    def test_score_instances_is_exact(self):
+        # Rastgele ve artımlı büyüyen kodlarda toplu ve tekil puanlar birebir eşittir
+        generator = random.Random(1)
+        batch_cores, single_cores = [], []
+        for index in range(30):
+            codes = bytearray(
+                generator.randint(0, 255) for _ in range(generator.randint(1, 400))
+            )
+            batch = Core(name=f"batch-{index}", lifetime_seconds=10, lifecycle=1)
+            single = Core(name=f"single-{index}", lifetime_seconds=10, lifecycle=1)
+            batch.codes, single.codes = codes, bytearray(codes)
+            batch_cores.append(batch)
+            single_cores.append(single)
+        for core in batch_cores + single_cores:
+            core.logger = MagicMock()
+
+        for _ in range(5):
+            self.scorer.score_instances(batch_cores)
+            for batch, single in zip(batch_cores, single_cores):
+                single.test()
+                extra = bytes(generator.randint(0, 255) for _ in range(7))
+                batch.codes.extend(extra)
+                single.codes.extend(extra)
+
+        for batch, single in zip(batch_cores, single_cores):
+            self.assertEqual(batch.lifetime_seconds, single.lifetime_seconds)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# tests/life/particle/spatial_hash_test.py
+
+import unittest
+
+import numpy as np
+
+from src.life.particles.spatial_hash import SpatialHash, pair_forces
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        generator = np.random.default_rng(1)
+        self.positions = generator.uniform(0, 10, (400, 3))
+        self.positions[7] = np.inf  # sonlu olmayan konum dizine alınmaz
+        self.index = SpatialHash(cell_size=1.0).build(self.positions)
+
+    def brute_force_pairs(self, positions, radius):
+        with np.errstate(invalid="ignore"):
+            distances = np.linalg.norm(positions[:, None] - positions[None], axis=2)
+        first, second = np.nonzero(np.triu(distances <= radius, 1))
+        return set(zip(first.tolist(), second.tolist()))
+
+    def found_pairs(self, radius=None):
+        first, second = self.index.pairs(radius)
+        pairs = set(
+            (min(a, b), max(a, b)) for a, b in zip(first.tolist(), second.tolist())
+        )
+        # Her çift bir kez bulunur
+        self.assertEqual(len(pairs), len(first))
+        return pairs
+
+    def test_pairs(self):
+        self.assertEqual(self.found_pairs(), self.brute_force_pairs(self.positions, 1))
+        self.assertEqual(
+            self.found_pairs(0.5), self.brute_force_pairs(self.positions, 0.5)
+        )
+        self.assertEqual(len(self.index), 399)
+        with self.assertRaises(ValueError):
+            self.index.pairs(2.0)
+
+    def test_update(self):
+        # Küçük hareketlerde ızgara yeniden kurulmaz, yalnızca yeniden sıralanır
+        moved = self.positions + 0.2
+        self.index.update(moved)
+        self.assertEqual(self.index.builds, 1)
+        self.assertEqual(self.index.resorts, 1)
+        self.assertGreater(self.index.moved, 0)
+        self.assertEqual(self.found_pairs(), self.brute_force_pairs(moved, 1))
+        # Hücre değiştiren nokta yoksa sıralama korunur
+        self.index.update(moved)
+        self.assertEqual(self.index.resorts, 1)
+        self.assertEqual(self.index.moved, 0)
+        # Izgaradan çıkan nokta yeniden kurmayı gerektirir
+        moved[0] = (50, 50, 50)
+        self.index.update(moved)
+        self.assertEqual(self.index.builds, 2)
+        self.assertEqual(self.found_pairs(), self.brute_force_pairs(moved, 1))
+
+    def test_query_radius(self):
+        point = np.array([5.0, 5.0, 5.0])
+        with np.errstate(invalid="ignore"):
+            distances = np.linalg.norm(self.positions - point, axis=1)
+        for radius in (0.5, 1.0, 2.5, 100.0):
+            expected = np.flatnonzero(distances <= radius)
+            expected = expected[np.argsort(distances[expected], kind="stable")]
+            np.testing.assert_array_equal(
+                self.index.query_radius(point, radius), expected
+            )
+        self.assertEqual(len(self.index.query_radius((50, 50, 50), 1)), 0)
+
+    def test_query_knn(self):
+        for point in ((5.0, 5.0, 5.0), (0.0, 10.0, 0.0), (-30.0, 4.0, 4.0)):
+            with np.errstate(invalid="ignore"):
+                distances = np.linalg.norm(self.positions - np.array(point), axis=1)
+            distances[~np.isfinite(distances)] = np.inf
+            expected = np.argsort(distances, kind="stable")[:5]
+            np.testing.assert_array_equal(self.index.query_knn(point, 5), expected)
+        self.assertEqual(len(self.index.query_knn((1, 1, 1), 1000)), 399)
+        self.assertEqual(len(self.index.query_knn((np.nan, 1, 1), 3)), 0)
+
+    def test_spread_positions(self):
+        # Çok dağınık konumlarda hücreler büyütülür; sonuçlar değişmez
+        positions = np.array([[0, 0, 0], [0.5, 0, 0], [1e12, 0, 0], [-1e12, 1, 1]])
+        index = SpatialHash(cell_size=1.0, max_cells=16).build(positions)
+        self.assertGreater(index.size[0], 1.0)
+        first, second = index.pairs()
+        self.assertEqual(sorted(zip(first.tolist(), second.tolist())), [(0, 1)])
+
+    def test_metrics(self):
+        self.found_pairs()
+        metrics = self.index.metrics()
+        self.assertEqual(metrics["points"], 399)
+        self.assertEqual(metrics["pairs"], len(self.found_pairs()))
+        self.assertGreater(metrics["cells"], 0)
+
+
+class TestPairForces(unittest.TestCase):
+    def test_exclusion(self):
+        # Aynı spinli çift birbirini iter; farklı spinli çift etkileşmez
+        positions = np.array([[0.0, 0, 0], [0.5, 0, 0], [5, 0, 0], [5.5, 0, 0]])
+        forces = pair_forces(
+            positions,
+            charges=np.zeros(4),
+            spins=np.array([0.5, 0.5, 0.5, -0.5]),
+            first=np.array([0, 2]),
+            second=np.array([1, 3]),
+            radius=1.0,
+        )
+        np.testing.assert_allclose(forces[0], [-0.5, 0, 0])
+        np.testing.assert_allclose(forces[1], [0.5, 0, 0])
+        np.testing.assert_allclose(forces[2:], 0)
+
+    def test_coulomb(self):
+        # Zıt yükler birbirini çeker; toplam kuvvet sıfırdır
+        positions = np.array([[0.0, 0, 0], [0, 0.5, 0]])
+        forces = pair_forces(
+            positions,
+            charges=np.array([1.0, -1.0]),
+            spins=np.array([0.5, -0.5]),
+            first=np.array([0]),
+            second=np.array([1]),
+            radius=1.0,
+            coulomb=1.0,
+        )
+        self.assertGreater(forces[0, 1], 0)
+        np.testing.assert_allclose(forces[0, 1], 1 / (0.25 + 1e-6))
+        np.testing.assert_allclose(forces.sum(axis=0), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,6 +57,41 @@ class TestVector(unittest.TestCase):
         v = Vector(0, 0, 0)
         self.assertTrue(v.is_zero())
 
+    def test_iadd(self):
+        v = Vector(1, 2, 3)
+        same = v
+        v += Vector(4, 5, 6)
+        self.assertIs(v, same)
+        self.assertEqual(v, Vector(5, 7, 9))
+        with self.assertRaises(TypeError):
+            v += 1
+
+    def test_imul(self):
+        v = Vector(1, 2, 3)
+        same = v
+        v *= 2
+        v *= Vector(1, 2, 3)
+        self.assertIs(v, same)
+        self.assertEqual(v, Vector(2, 8, 18))
+
+    def test_axpy(self):
+        v = Vector(1, 1, 1)
+        self.assertIs(v.axpy(2, Vector(1, 2, 3)), v)
+        self.assertEqual(v, Vector(3, 5, 7))
+        v.axpy(0.5, Vector(2, 2, 2), Vector(1, 2, 3))
+        self.assertEqual(v, Vector(4, 7, 10))
+
+    def test_assign_and_copy(self):
+        v = Vector(1, 2, 3)
+        copy = v.copy()
+        self.assertIsNot(copy, v)
+        self.assertEqual(copy.assign(Vector(1, 1, 2), 3), Vector(3, 3, 6))
+        self.assertEqual(v, Vector(1, 2, 3))
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            Vector().w = 1
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,10 @@
 # tests/web/controller/core_simulation_test.py
 
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock
+from src.life.particles.core import Core
 from src.web.controller.core_simulation import CoreSimulation
 
 
@@ -39,15 +42,296 @@ class TestCoreSimulation(unittest.TestCase):
         # pause_simulation method
         self.simulation.pause_simulation()
         self.assertTrue(self.simulation._paused)
+        self.assertFalse(self.simulation._gate.is_open())
         # resume_simulation method
         self.simulation.resume_simulation()
         self.assertFalse(self.simulation._paused)
+        self.assertTrue(self.simulation._gate.is_open())
 
     def test_stop_simulation(self):
         self.simulation.stop_simulation()
         self.assertTrue(self.simulation._stop_event.is_set())
         self.assertTrue(self.simulation._exit_flag)
 
+    def test_stop_simulation_joins_instances(self):
+        # Uzun yaşam döngüsündeki örnekler durdurma sinyaliyle hemen bitmeli
+        simulation = CoreSimulation(
+            name="test",
+            number_of_instance=3,
+            lifetime_seconds=float("inf"),
+            lifecycle=60,
+        )
+        simulation.start_simulation()
+        self.assertEqual(len(simulation._all_instances()), 3)
+        started = time.time()
+        stragglers = simulation.stop_simulation(timeout=5)
+        self.assertEqual(stragglers, [])
+        self.assertLess(time.time() - started, 1)
+        for instance in simulation._all_instances():
+            self.assertFalse(instance.is_alive())
+
     def test_status(self):
         status = self.simulation.status()
         self.assertIn(status, ["Paused", "Running"])
+
+    def test_score_population(self):
+        # Toplu puanlama yalnızca çalışan örnekleri tekil olarak işler
+        instance = self.simulation.create_instance("test", 10, 1, 0, 2, 2)
+        stopped = self.simulation.create_instance("test", 10, 1, 0, 2, 2)
+        for item in (instance, stopped):
+            item.logger = MagicMock()
+            item.codes = bytearray([0xB8, 0xB9])
+        stopped._stop_event.set()
+        self.simulation.instances.extend([instance, instance, stopped])
+        self.assertEqual(self.simulation.score_population(), 1)
+        self.assertGreater(instance.lifetime_seconds, 10)
+        self.assertEqual(stopped.lifetime_seconds, 10)
+
+    def test_apply_formula(self):
+        # Formül çalışan örneklere ve kopyalarına tek geçişte uygulanır
+        for simulation in (
+            self.simulation,
+            CoreSimulation(
+                name="test",
+                number_of_instance=3,
+                lifetime_seconds=float("inf"),
+                lifecycle=60 / 70,
+                use_store=True,
+            ),
+        ):
+            instance = simulation.create_instance("test", 10, 1, 0, 2, 2)
+            stopped = simulation.create_instance("test", 10, 1, 0, 2, 2)
+            for item in (instance, stopped):
+                simulation._bind_instance(item)
+            stopped._stop_event.set()
+            stopped.stopped = True
+            replica = Core(name="replica", lifetime_seconds=10, lifecycle=1)
+            replica.generation = 2
+            instance._inherit_runtime(replica)
+            instance.replicas.append(replica)
+            simulation.instances.extend([instance, stopped])
+            summary = simulation.apply_formula("5.5 * self.generation")
+            self.assertEqual(summary["count"], 2)
+            self.assertEqual(summary["max"], 11)
+            self.assertEqual(instance.lifetime_seconds, 5.5)
+            self.assertEqual(replica.lifetime_seconds, 11)
+            self.assertEqual(stopped.lifetime_seconds, 10)
+
+    def test_population_snapshot(self):
+        # Depodan alınan görüntü örneklerin to_json çıktısıyla aynıdır
+        simulation = CoreSimulation(
+            name="test",
+            number_of_instance=3,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 70,
+            use_store=True,
+        )
+        instance = simulation.create_instance("test", float("inf"), 1, 0, 2, 2)
+        simulation._bind_instance(instance)
+        simulation.instances.append(instance)
+        instance.status()
+        self.assertEqual(simulation.population_snapshot(), [instance.to_json()])
+
+    def test_submit(self):
+        # Çalışmayan örneklere gönderilen komutlar hemen reddedilir
+        acks = []
+        self.simulation.commands.trigger_event(acks.append)
+        instance = self.simulation.create_instance("test", 10, 1, 0, 2, 2)
+        self.simulation._bind_instance(instance)
+        self.simulation.instances.append(instance)
+        with self.assertRaises(ValueError):
+            self.simulation.submit(instance.id, "formula")
+        self.simulation.submit(instance.id + 1, "formula", formula="1")
+        self.assertEqual(acks[0]["status"], "failed")
+        self.assertEqual(len(self.simulation.commands), 0)
+        # Çalışan örneğin komutu sonraki adımında uygulanır
+        self.simulation.submit(instance.id, "formula", formula="5.5")
+        self.assertEqual(self.simulation.commands.pending(instance.id), 1)
+        instance.run_commands()
+        self.assertEqual(acks[1]["status"], "applied")
+        self.assertEqual(instance.lifetime_seconds, 5.5)
+        # Duran örneğin bekleyen komutları durma bildiriminde reddedilir
+        self.simulation.submit(instance.id, "formula", formula="1")
+        instance.created_printed = True
+        instance._stop_event.set()
+        self.simulation.instance_status(instance)
+        self.assertEqual(acks[2]["status"], "failed")
+        self.assertEqual(len(self.simulation.commands), 0)
+
+    def test_perform_crossover(self):
+        # En iyi çekirdekler eşleşir; sınıra ulaşanlar dizinden çıkarılır
+        cores = [
+            self.simulation.create_instance("test", 10, 1, 0, 2, 1) for _ in range(3)
+        ]
+        for index, core in enumerate(cores):
+            core.logger = MagicMock()
+            core.replicate = MagicMock(return_value=None)
+            core.fitness = float(index)
+            self.simulation.fitness_index.update(core, core.fitness)
+        self.assertEqual(self.simulation.perform_crossover(max_match_limit=1), 1)
+        self.assertEqual([core.match_count for core in cores], [0, 1, 1])
+        cores[2].replicate.assert_called_once()
+        self.assertEqual(len(self.simulation.fitness_index), 1)
+
+    def test_stopped_core_stays_in_fitness_index(self):
+        # Duran örnek son çaprazlamada eşleşebilir
+        core = self.simulation.create_instance("test", 10, 1, 0, 2, 1)
+        core.logger = MagicMock()
+        core.status = MagicMock(return_value="Running")
+        self.simulation.instance_status(core)
+        self.assertIn(core.id, self.simulation.fitness_index)
+        core.status = MagicMock(return_value="Stopped")
+        self.simulation.instance_status(core)
+        self.assertIn(core.id, self.simulation.fitness_index)
+
+    def test_epoch_drops_stopped_cores(self):
+        # Dönem çaprazlamasından sonra duran örnekler dizinden çıkarılır
+        simulation = CoreSimulation(
+            name="test",
+            number_of_instance=0,
+            lifetime_seconds=10,
+            lifecycle=1,
+            crossover_epoch=60,
+        )
+        cores = [simulation.create_instance("test", 10, 1, 0, 2, 1) for _ in range(2)]
+        for core in cores:
+            core.logger = MagicMock()
+            core.replicate = MagicMock(return_value=None)
+            core.status = MagicMock(return_value="Running")
+            simulation.instance_status(core)
+            core.status = MagicMock(return_value="Stopped")
+            simulation.instance_status(core)
+        self.assertEqual(simulation.crossover.run_once(), 1)
+        self.assertEqual(len(simulation.fitness_index), 0)
+
+    def test_default_run_performs_crossover(self):
+        # Tüm örnekler öldüğünde son çaprazlama duran örnekleri eşleştirir
+        simulation = CoreSimulation(
+            name="test",
+            number_of_instance=2,
+            lifetime_seconds=1,
+            lifecycle=0.1,
+            max_generation=3,
+        )
+        matches = CoreSimulation.match_count
+        simulation.start_simulation()
+        deadline = time.time() + 15
+        while time.time() < deadline and any(
+            instance.is_alive() for instance in simulation._all_instances()
+        ):
+            time.sleep(0.05)
+        simulation.stop_simulation(timeout=5)
+        self.assertGreater(CoreSimulation.match_count, matches)
+        self.assertGreater(len(simulation._all_instances()), 2)
+
+    def test_crossover_epoch(self):
+        # Ölümler çaprazlamayı çalıştırmaz; dönemde tek çalıştırmada birleşir
+        simulation = CoreSimulation(
+            name="test",
+            number_of_instance=0,
+            lifetime_seconds=10,
+            lifecycle=1,
+            crossover_epoch=60,
+        )
+        simulation.perform_crossover = MagicMock(return_value=0)
+        core = simulation.create_instance("test", 10, 1, 0, 2, 1)
+        core.logger = MagicMock()
+        core.status = MagicMock(return_value="Stopped")
+        for _ in range(3):
+            simulation.instance_status(core)
+        simulation.perform_crossover.assert_not_called()
+        self.assertEqual(simulation.crossover.pending, 3)
+        simulation.crossover.run_once()
+        simulation.perform_crossover.assert_called_once_with(2)
+        self.assertEqual(simulation.to_json()["crossover"]["collapsed"], 2)
+
+    def test_max_starting(self):
+        # İlk adımını bildirmeyen örnek varken yeni örnek başlatılmaz
+        simulation = CoreSimulation(
+            name="test",
+            number_of_instance=3,
+            lifetime_seconds=float("inf"),
+            lifecycle=60,
+            max_starting=1,
+        )
+        thread = threading.Thread(target=simulation._run_simulation_loop)
+        thread.start()
+        try:
+            time.sleep(0.3)
+            self.assertEqual(simulation.number_of_instance_created, 1)
+            simulation.instance_status(simulation.instances[0])
+            deadline = time.time() + 5
+            while time.time() < deadline and simulation.number_of_instance_created < 2:
+                time.sleep(0.01)
+            self.assertEqual(simulation.number_of_instance_created, 2)
+        finally:
+            simulation.stop_simulation(timeout=5)
+            thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(simulation.number_of_instance_created, 2)
+
+    def test_ramp_rate(self):
+        # Örnekler saniyede ramp_rate hızında oluşturulur
+        simulation = CoreSimulation(
+            name="test",
+            number_of_instance=5,
+            lifetime_seconds=float("inf"),
+            lifecycle=60,
+            ramp_rate=20,
+        )
+        started = time.monotonic()
+        simulation._run_simulation_loop()
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+        self.assertEqual(simulation.number_of_instance_created, 5)
+        self.assertEqual(simulation.stop_simulation(timeout=5), [])
+        with self.assertRaises(ValueError):
+            CoreSimulation("test", 1, 1, 1, ramp_rate=0)
+
+    def test_virtual_time(self):
+        # 10 dakikalık yaşam süresi sanal zamanda beklemeden tamamlanır
+        simulation = CoreSimulation(
+            name="test",
+            number_of_instance=3,
+            lifetime_seconds=600,
+            lifecycle=1,
+            max_generation=1,
+            virtual_time=True,
+        )
+        started = time.time()
+        simulation.start_simulation()
+        deadline = time.time() + 10
+        while time.time() < deadline and any(
+            not instance._stop_event.is_set()
+            for instance in simulation._all_instances()
+        ):
+            time.sleep(0.05)
+        self.assertEqual(simulation.stop_simulation(timeout=5), [])
+        self.assertLess(time.time() - started, 10)
+        self.assertGreater(simulation.clock.time(), 1)
+        for instance in simulation._all_instances():
+            self.assertIs(instance.clock, simulation.clock)
+            self.assertGreater(instance.elapsed_lifespan, 1)
+
+    def test_seed_reproduces_run(self):
+        def run(seed):
+            simulation = CoreSimulation(
+                name="test",
+                number_of_instance=3,
+                lifetime_seconds=20,
+                lifecycle=1,
+                virtual_time=True,
+                seed=seed,
+            )
+            simulation.start_simulation()
+            deadline = time.time() + 10
+            while time.time() < deadline and any(
+                not instance._stop_event.is_set()
+                for instance in simulation._all_instances()
+            ):
+                time.sleep(0.05)
+            simulation.stop_simulation(timeout=5)
+            instances = sorted(simulation._all_instances(), key=lambda x: x.id)
+            return [bytes(instance.codes) for instance in instances]
+
+        self.assertEqual(run(seed=7), run(seed=7))
+        self.assertNotEqual(run(seed=7), run(seed=8))
@@ -0,0 +1,80 @@
+# tests/web/controller/crossover_scheduler_test.py
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+from src.life.particles.gate import Gate
+from src.web.controller.crossover_scheduler import CrossoverScheduler
+
+
+class TestCrossoverScheduler(unittest.TestCase):
+    def setUp(self):
+        self.crossover = MagicMock(return_value=2)
+        self.scheduler = CrossoverScheduler(self.crossover, epoch=60)
+        self.scheduler.logger = MagicMock()
+
+    def tearDown(self):
+        self.scheduler.stop(timeout=1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CrossoverScheduler(self.crossover, epoch=0)
+        with self.assertRaises(ValueError):
+            CrossoverScheduler(self.crossover, deaths=0)
+
+    def test_collapse_requests(self):
+        # Dönem içindeki istekler tek çalıştırmada birleşir
+        for _ in range(5):
+            self.scheduler.request()
+        self.crossover.assert_not_called()
+        self.assertEqual(self.scheduler.run_once(), 2)
+        self.assertIsNone(self.scheduler.run_once())
+        self.crossover.assert_called_once()
+        metrics = self.scheduler.metrics()
+        self.assertEqual(metrics["requests"], 5)
+        self.assertEqual(metrics["runs"], 1)
+        self.assertEqual(metrics["collapsed"], 4)
+        self.assertEqual(metrics["last_pairs"], 2)
+        self.assertEqual(metrics["pending"], 0)
+
+    def test_closed_gate(self):
+        # Duraklatılan simülasyonda istekler bekletilir
+        gate = Gate()
+        gate.close()
+        scheduler = CrossoverScheduler(self.crossover, epoch=60, gate=gate)
+        scheduler.request()
+        self.assertIsNone(scheduler.run_once())
+        self.assertEqual(scheduler.pending, 1)
+        gate.open()
+        self.assertEqual(scheduler.run_once(), 2)
+
+    def test_deaths_threshold(self):
+        # Ölüm sınırına ulaşılınca dönem beklenmeden ayrı thread'de çalışır
+        ran = threading.Event()
+        threads = []
+
+        def crossover():
+            threads.append(threading.current_thread().name)
+            ran.set()
+            return 1
+
+        self.crossover.side_effect = crossover
+        self.scheduler.deaths = 3
+        self.scheduler.start()
+        for _ in range(2):
+            self.scheduler.request()
+        self.assertFalse(ran.wait(0.2))
+        self.scheduler.request()
+        self.assertTrue(ran.wait(5))
+        self.scheduler.stop(timeout=1)
+        self.assertEqual(self.scheduler.runs, 1)
+        self.assertEqual(threads, [self.scheduler.name])
+
+    def test_stop(self):
+        self.scheduler.start()
+        self.scheduler.stop(timeout=1)
+        self.assertIsNone(self.scheduler._thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
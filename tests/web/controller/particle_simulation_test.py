@@ -1,7 +1,9 @@
 # tests/web/controller/particle_simulation_test.py
 
+import time
 import unittest
 from unittest.mock import MagicMock
+from src.life.particles.vector import Vector
 from src.web.controller.particle_simulation import ParticleSimulation
 
 
@@ -47,6 +49,188 @@ class TestParticleSimulation(unittest.TestCase):
         status = self.simulation.status()
         self.assertIn(status, ["Paused", "Running"])
 
+    def test_batch_physics(self):
+        # Kinematik parçacık adımında değil, popülasyon için toplu ilerletilir
+        simulation = ParticleSimulation(
+            name="test",
+            number_of_instance=2,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 70,
+            batch_physics=True,
+            seed=1,
+        )
+        self.assertIsNotNone(simulation.store)
+        particles = []
+        for _ in range(2):
+            particle = simulation.create_instance("test", 10, 1, 0, 2, 1)
+            particle.logger = MagicMock()
+            simulation._bind_instance(particle)
+            particles.append(particle)
+        self.assertTrue(particles[0].batch_physics)
+        particles[0].evolve()
+        self.assertEqual(particles[0].position.to_json(), {"x": 0, "y": 0, "z": 0})
+        self.assertEqual(simulation.integrate_population(), 2)
+        for particle in particles:
+            self.assertNotEqual(particle.velocity.to_json(), {"x": 0, "y": 0, "z": 0})
+            self.assertEqual(
+                particle.to_json()["position"], particle.position.to_json()
+            )
+
+    def test_integrator(self):
+        # Her parçacık kendi yöntemini ve sabit zaman adımını alır
+        simulation = ParticleSimulation(
+            name="test",
+            number_of_instance=2,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 70,
+            integrator="verlet",
+            tolerance=1e-6,
+            time_step=0.01,
+            seed=1,
+        )
+        particles = []
+        for _ in range(2):
+            particle = simulation.create_instance("test", 10, 1, 0, 2, 1)
+            particle.logger = MagicMock()
+            simulation._bind_instance(particle)
+            simulation.instances.append(particle)
+            particles.append(particle)
+        self.assertIsNot(particles[0].integrator, particles[1].integrator)
+        self.assertEqual(particles[0].time_step, 0.01)
+        particles[0].calculate_new_position()
+        particles[1].calculate_new_position()
+        metrics = simulation.to_json()["integrator"]
+        self.assertEqual(metrics["integrator"], "adaptive")
+        self.assertEqual(metrics["steps"], 2)
+        self.assertGreaterEqual(metrics["cost_per_step"], 6)
+        with self.assertRaises(ValueError):
+            ParticleSimulation("test", 1, 1, 1, integrator="rk4")
+        with self.assertRaises(ValueError):
+            ParticleSimulation("test", 1, 1, 1, time_step=0)
+
+    def test_interactions(self):
+        # Yakın parçacıklar hücre listesiyle bulunur ve birbirini iter
+        simulation = ParticleSimulation(
+            name="test",
+            number_of_instance=3,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 70,
+            interaction_radius=1.0,
+            time_step=0.1,
+            seed=1,
+        )
+        self.assertIsNotNone(simulation.store)
+        particles = []
+        for x in (0.0, 0.5, 10.0):
+            particle = simulation.create_instance("test", 10, 1, 0, 2, 1)
+            particle.logger = MagicMock()
+            particle.position = Vector(x, 0, 0)
+            simulation._bind_instance(particle)
+            particles.append(particle)
+        self.assertEqual(simulation.apply_interactions(), 1)
+        self.assertLess(particles[0].velocity.x, 0)
+        self.assertGreater(particles[1].velocity.x, 0)
+        self.assertEqual(particles[2].velocity, Vector(0, 0, 0))
+        self.assertEqual(
+            particles[0].momentum.x, particles[0].velocity.x * particles[0].mass
+        )
+        self.assertEqual(simulation.neighbors_of(particles[0]), [particles[1]])
+        self.assertEqual(simulation.nearest(particles[2], 2), particles[1::-1])
+        self.assertEqual(simulation.to_json()["neighbors"]["pairs"], 1)
+        # Aynı slotlarla dizin artımlı güncellenir
+        simulation.apply_interactions()
+        self.assertEqual(simulation.neighbors.builds, 1)
+        self.assertEqual(simulation.neighbors.updates, 1)
+        with self.assertRaises(ValueError):
+            ParticleSimulation("test", 1, 1, 1, interaction_radius=0)
+
+    def test_long_range_forces(self):
+        # Rastgele kuvvet yerine Barnes-Hut kuvvetleri uygulanır
+        simulation = ParticleSimulation(
+            name="test",
+            number_of_instance=3,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 70,
+            opening_angle=0.5,
+            seed=1,
+        )
+        particles = []
+        for x in (0.0, 1.0, -1.0):
+            particle = simulation.create_instance("test", 10, 1, 0, 2, 1)
+            particle.logger = MagicMock()
+            particle.position = Vector(x, 0, 0)
+            simulation._bind_instance(particle)
+            particles.append(particle)
+        self.assertEqual(simulation.apply_long_range_forces(), 3)
+        # Benzer yükler iter; ortadaki parçacığa etkiyen kuvvetler dengelenir
+        self.assertGreater(particles[1].force.x, 0)
+        self.assertLess(particles[2].force.x, 0)
+        self.assertAlmostEqual(particles[0].force.x, 0)
+        particles[1].time_step = 0.1
+        particles[1].calculate_new_position()
+        self.assertGreater(particles[1].velocity.x, 0)
+        self.assertEqual(particles[1].velocity.y, 0)
+        self.assertEqual(simulation.to_json()["long_range"]["theta"], 0.5)
+        with self.assertRaises(ValueError):
+            ParticleSimulation("test", 1, 1, 1, opening_angle=-1)
+
+    def test_long_range_batch_physics(self):
+        simulation = ParticleSimulation(
+            name="test",
+            number_of_instance=2,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 70,
+            batch_physics=True,
+            opening_angle=0.5,
+            time_step=0.1,
+            seed=1,
+        )
+        particles = []
+        for x in (0.0, 1.0):
+            particle = simulation.create_instance("test", 10, 1, 0, 2, 1)
+            particle.logger = MagicMock()
+            particle.position = Vector(x, 0, 0)
+            simulation._bind_instance(particle)
+            particles.append(particle)
+        self.assertEqual(simulation.integrate_population(), 2)
+        self.assertLess(particles[0].velocity.x, 0)
+        self.assertGreater(particles[1].velocity.x, 0)
+        self.assertEqual(particles[0].velocity.y, 0)
+
+    def test_long_range_moves_population(self):
+        # Parçacıklar ayrı konumlarda doğar ve varsayılan yüklerle yalnızca
+        # uzun menzilli kuvvetlerle hareket eder
+        for batch_physics in (True, False):
+            simulation = ParticleSimulation(
+                name="test",
+                number_of_instance=20,
+                lifetime_seconds=float("inf"),
+                lifecycle=0.01,
+                batch_physics=batch_physics,
+                opening_angle=0.5,
+                time_step=0.01,
+                seed=1,
+            )
+            simulation.start_simulation()
+            try:
+                deadline = time.time() + 10
+                moved = 0
+                while time.time() < deadline and moved < 20:
+                    time.sleep(0.05)
+                    moved = sum(
+                        particle.force is not None or batch_physics
+                        for particle in simulation.instances
+                        if particle.velocity.to_json() != {"x": 0, "y": 0, "z": 0}
+                    )
+                positions = [
+                    tuple(particle.position.to_json().values())
+                    for particle in simulation.instances
+                ]
+            finally:
+                simulation.stop_simulation(timeout=5)
+            self.assertEqual(moved, 20)
+            self.assertEqual(len(set(positions)), 20)
+
     def test_force_function(self):
         t = 0.5
         ecpected = t**0.1
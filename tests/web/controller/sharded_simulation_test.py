@@ -0,0 +1,143 @@
+# tests/web/controller/sharded_simulation_test.py
+
+import time
+import unittest
+from unittest.mock import MagicMock
+from src.web.controller.sharded_simulation import SHARD_ID_RANGE, ShardedSimulation
+from src.web.controller.simulation_type import SimulationType
+
+
+class TestShardedSimulation(unittest.TestCase):
+    def create_simulation(self, simulation_type=SimulationType.Core, **options):
+        simulation = ShardedSimulation(
+            name="test",
+            number_of_instance=5,
+            lifetime_seconds=float("inf"),
+            lifecycle=0.05,
+            simulation_type=simulation_type,
+            workers=2,
+            scheduler_workers=2,
+            **options,
+        )
+        simulation.trigger_event(MagicMock())
+        simulation.trigger_event_instance(MagicMock())
+        return simulation
+
+    def wait_for_instances(self, simulation, timeout=30):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if simulation.number_of_instance_created == simulation.number_of_instance:
+                return True
+            time.sleep(0.1)
+        return False
+
+    def test_shard_sizes(self):
+        simulation = self.create_simulation()
+        self.assertEqual(simulation.shard_sizes(), [3, 2])
+
+    def test_sharded_run(self):
+        simulation = self.create_simulation()
+        simulation.start_simulation()
+        try:
+            self.assertTrue(self.wait_for_instances(simulation))
+            instances = simulation._all_instances()
+            # Kimlikler parçalar arasında çakışmaz
+            shards = {instance.id // SHARD_ID_RANGE for instance in instances}
+            self.assertEqual(shards, {0, 1})
+            time.sleep(0.3)
+            simulation.collect()
+            self.assertTrue(simulation.fitness_values)
+            instance = instances[0]
+            self.assertGreater(len(instance.codes), 0)
+            self.assertEqual(instance.to_json()["id"], instance.id)
+            simulation.event_function_instance.assert_called()
+        finally:
+            stragglers = simulation.stop_simulation(timeout=10)
+        self.assertEqual(stragglers, [])
+        for shard in simulation.shards:
+            self.assertFalse(shard.process.is_alive())
+            self.assertIsNone(shard.store.name)
+
+    def test_pause_resume(self):
+        simulation = self.create_simulation(SimulationType.Particles)
+        simulation.start_simulation()
+        try:
+            self.assertTrue(self.wait_for_instances(simulation))
+            simulation.pause_simulation()
+            time.sleep(0.3)
+            instance = simulation._all_instances()[0]
+            self.assertEqual(instance.status(), "Paused")
+            length = instance.code_length
+            time.sleep(0.3)
+            self.assertEqual(instance.code_length, length)
+            simulation.resume_simulation()
+            time.sleep(0.3)
+            self.assertGreater(instance.code_length, length)
+            self.assertIn("position", instance.to_json())
+        finally:
+            self.assertEqual(simulation.stop_simulation(timeout=10), [])
+
+    def test_forwarded_options(self):
+        # Örnek ayarları parçalara, çaprazlama ana sürece iletilir
+        simulation = self.create_simulation(
+            SimulationType.Particles,
+            crossover_epoch=0.05,
+            integrator="verlet",
+            time_step=0.01,
+        )
+        simulation.start_simulation()
+        try:
+            self.assertTrue(self.wait_for_instances(simulation))
+            instance = simulation._all_instances()[0]
+            position = instance.position.to_json()
+            time.sleep(0.3)
+            self.assertNotEqual(instance.position.to_json(), position)
+            self.assertTrue(simulation.crossover._thread.is_alive())
+        finally:
+            self.assertEqual(simulation.stop_simulation(timeout=10), [])
+
+    def test_genome_truncated(self):
+        # Kapasiteyi aşan kodlar paylaşılan bellekte kesilir
+        simulation = self.create_simulation()
+        simulation.genome_capacity = 4
+        simulation.start_simulation()
+        try:
+            self.assertTrue(self.wait_for_instances(simulation))
+            instance = simulation._all_instances()[0]
+            deadline = time.time() + 10
+            while time.time() < deadline and instance.code_length <= 4:
+                time.sleep(0.05)
+            self.assertGreater(instance.code_length, 4)
+            self.assertEqual(len(instance.codes), 4)
+        finally:
+            self.assertEqual(simulation.stop_simulation(timeout=10), [])
+
+    def test_apply_formula(self):
+        # Sonuçlar parçalara gönderilir ve parça süreçlerinde yazılır
+        simulation = self.create_simulation()
+        simulation.start_simulation()
+        try:
+            self.assertTrue(self.wait_for_instances(simulation))
+            # Duraklatılan örneklerin yaşam süreleri yalnızca formülle değişir
+            simulation.pause_simulation()
+            time.sleep(0.3)
+            live = [
+                instance
+                for instance in simulation._all_instances()
+                if instance.status() == "Paused"
+            ]
+            summary = simulation.apply_formula("5.5")
+            self.assertEqual(summary["count"], len(live))
+            deadline = time.time() + 10
+            while time.time() < deadline and any(
+                instance.lifetime_seconds != 5.5 for instance in live
+            ):
+                time.sleep(0.05)
+            for instance in live:
+                self.assertEqual(instance.lifetime_seconds, 5.5)
+        finally:
+            self.assertEqual(simulation.stop_simulation(timeout=10), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
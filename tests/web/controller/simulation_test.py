@@ -1,6 +1,10 @@
 # tests/web/controller/simulation_test.py
 
+import threading
+import time
 import unittest
+from unittest.mock import MagicMock, patch
+from src.web.controller.core_simulation import CoreSimulation
 from src.web.controller.simulation import (
     Simulation,
     simulation_status,
@@ -85,6 +89,161 @@ class TestSimulation(unittest.TestCase):
                 simulation_type=SimulationType.Particles,
             )
 
+    def test_sharded_options(self):
+        # Parçalara iletilebilen ayarlar iletilir, diğerleri reddedilir
+        arguments = dict(
+            number_of_instance=4,
+            lifetime_seconds=1,
+            lifecycle=0.1,
+            simulation_type=SimulationType.Particles,
+            max_replicas=2,
+            max_generation=2,
+            max_match_limit=2,
+            workers=2,
+        )
+        sampler = self.simulation.switch_simulation(
+            **arguments,
+            crossover_epoch=0.5,
+            integrator="verlet",
+            tolerance=1e-3,
+            time_step=0.01,
+        )
+        self.assertIsNotNone(sampler.crossover)
+        self.assertEqual(
+            sampler.options,
+            {"integrator": "verlet", "tolerance": 1e-3, "time_step": 0.01},
+        )
+        for option in (
+            {"batch_scoring": True},
+            {"virtual_time": True},
+            {"ramp_rate": 10},
+            {"max_starting": 2},
+            {"batch_physics": True},
+            {"interaction_radius": 1.0},
+            {"exclusion_strength": 2.0},
+            {"opening_angle": 0.5},
+        ):
+            with self.assertRaises(ValueError) as context:
+                self.simulation.switch_simulation(**arguments, **option)
+            self.assertIn(next(iter(option)), str(context.exception))
+
+    def test_start_async(self):
+        # Başlatma iş kimliğiyle hemen döner; örnekler arka planda oluşturulur
+        events = []
+        self.simulation.trigger_job(lambda job: events.append(job.status))
+        job = self.simulation.start_async(
+            number_of_instance=3,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 1,
+            simulation_type=SimulationType.Core,
+            max_replicas=2,
+            max_generation=2,
+            max_match_limit=2,
+            ramp_rate=100,
+            max_starting=3,
+        )
+        self.assertIs(self.simulation.jobs[job.id], job)
+        job.join(5)
+        self.assertEqual(job.status, "completed")
+        self.assertEqual(job.created, 3)
+        self.assertEqual(events[0], "ramping")
+        self.assertEqual(events[-1], "completed")
+
+    def test_start_async_invalid(self):
+        with self.assertRaises(ValueError):
+            self.simulation.start_async(
+                number_of_instance=3,
+                lifetime_seconds=-10,
+                lifecycle=60 / 1,
+                simulation_type=SimulationType.Core,
+            )
+        self.assertEqual(self.simulation.jobs, {})
+        # Parçalı simülasyonun desteklemediği ayarlar da iş oluşturulmadan reddedilir
+        with self.assertRaises(ValueError):
+            self.simulation.start_async(
+                number_of_instance=3,
+                lifetime_seconds=1,
+                lifecycle=60 / 1,
+                simulation_type=SimulationType.Core,
+                max_replicas=2,
+                max_generation=2,
+                max_match_limit=2,
+                workers=2,
+                batch_scoring=True,
+            )
+        self.assertEqual(self.simulation.jobs, {})
+
+    def test_stop_while_previous_simulation_stops(self):
+        # Önceki simülasyon beklenirken gelen durdurma isteği kaybolmaz
+        previous = MagicMock()
+        stopping, release = threading.Event(), threading.Event()
+
+        def stop_simulation(timeout=None):
+            stopping.set()
+            release.wait(5)
+            return []
+
+        previous.stop_simulation.side_effect = stop_simulation
+        self.simulation.sampler = previous
+        job = self.simulation.start_async(
+            number_of_instance=3,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 1,
+            simulation_type=SimulationType.Core,
+            max_replicas=2,
+            max_generation=2,
+            max_match_limit=2,
+        )
+        self.assertTrue(stopping.wait(5))
+        stopper = threading.Thread(target=self.simulation.stop)
+        stopper.start()
+        deadline = time.time() + 5
+        while time.time() < deadline and job.status != "cancelled":
+            time.sleep(0.01)
+        release.set()
+        stopper.join(5)
+        job.join(5)
+        self.assertEqual(job.status, "cancelled")
+        self.assertIs(self.simulation.sampler, previous)
+
+    def test_overlapping_start_async(self):
+        # Yeni başlatma önceki işi iptal eder; yalnızca son örnekleyici çalışır
+        arguments = dict(
+            number_of_instance=2,
+            lifetime_seconds=float("inf"),
+            lifecycle=60 / 1,
+            simulation_type=SimulationType.Core,
+            max_replicas=2,
+            max_generation=2,
+            max_match_limit=2,
+        )
+        first = self.simulation.start_async(**arguments)
+        second = self.simulation.start_async(**arguments)
+        first.join(5)
+        second.join(5)
+        self.assertEqual(second.status, "completed")
+        self.assertIn(first.status, ("completed", "cancelled"))
+        self.assertIs(self.simulation.job, second)
+        self.assertEqual(self.simulation.sampler.number_of_instance_created, 2)
+
+    def test_start_async_failed(self):
+        # Örnekler oluşturulamazsa iş başarısız olur
+        with patch.object(
+            CoreSimulation, "create_instance", side_effect=RuntimeError("boom")
+        ):
+            job = self.simulation.start_async(
+                number_of_instance=3,
+                lifetime_seconds=float("inf"),
+                lifecycle=60 / 1,
+                simulation_type=SimulationType.Core,
+                max_replicas=2,
+                max_generation=2,
+                max_match_limit=2,
+            )
+            job.join(5)
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.error, "boom")
+
 
 if __name__ == "__main__":
     unittest.main()
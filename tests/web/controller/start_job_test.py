@@ -0,0 +1,61 @@
+# tests/web/controller/start_job_test.py
+
+import unittest
+from unittest.mock import MagicMock
+from src.web.controller.start_job import StartJob
+
+
+class TestStartJob(unittest.TestCase):
+    def setUp(self):
+        self.job = StartJob({"number_of_instance": 3}, progress_interval=60)
+        self.job.logger = MagicMock()
+        self.events = []
+        self.job.trigger_event(lambda job: self.events.append(job.to_json()))
+
+    def test_progress(self):
+        # İlerleme bildirimleri aralıkla sınırlanır; tamamlanma her zaman bildirilir
+        def start():
+            for created in range(1, self.job.total + 1):
+                self.job.update(created)
+
+        self.job.start(start).join(5)
+        self.assertEqual(
+            [event["status"] for event in self.events], ["ramping", "completed"]
+        )
+        self.assertEqual(self.events[-1]["created"], 3)
+        self.assertEqual(self.events[-1]["progress"], 1.0)
+        self.assertTrue(self.job.is_finished())
+
+    def test_failed(self):
+        def start():
+            raise ValueError("Invalid simulation type")
+
+        self.job.start(start).join(5)
+        self.assertEqual(self.job.status, "failed")
+        self.assertEqual(self.job.to_json()["error"], "Invalid simulation type")
+
+    def test_cancel(self):
+        self.job.update(1)
+        self.assertTrue(self.job.cancel())
+        self.assertFalse(self.job.cancel())
+        self.job.update(3)
+        self.assertEqual(self.job.status, "cancelled")
+        self.assertEqual(self.job.created, 1)
+
+    def test_cancelled_job_does_not_start(self):
+        start = MagicMock()
+        self.job.cancel()
+        self.job.start(start).join(5)
+        start.assert_not_called()
+        self.assertEqual(self.job.status, "cancelled")
+        self.assertIsNone(self.job.started_at)
+
+    def test_fail(self):
+        self.assertTrue(self.job.fail("Sampler error"))
+        self.assertFalse(self.job.cancel())
+        self.assertEqual(self.job.status, "failed")
+        self.assertEqual(self.job.to_json()["error"], "Sampler error")
+
+
+if __name__ == "__main__":
+    unittest.main()
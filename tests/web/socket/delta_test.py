@@ -0,0 +1,73 @@
+# tests/web/socket/delta_test.py
+
+import unittest
+from unittest.mock import MagicMock
+from src.life.particles.core import Core
+from src.web.socket.delta import DeltaEncoder
+
+
+class TestDeltaEncoder(unittest.TestCase):
+    def setUp(self):
+        self.encoder = DeltaEncoder()
+        self.core = Core(name="test", lifetime_seconds=10, lifecycle=1)
+        self.core.logger = MagicMock()
+        self.core.trigger_event(None)
+        self.core.status()  # Created durumu tüketilir
+
+    def test_first_message_is_full(self):
+        self.core.codes.extend(b"\x01\x02")
+        delta = self.encoder.encode(self.core)
+        self.assertEqual(delta["version"], 1)
+        self.assertEqual(delta["base"], 0)
+        self.assertEqual(delta["changes"]["id"], self.core.id)
+        self.assertNotIn("codes", delta["changes"])
+        self.assertEqual(delta["codes_offset"], 0)
+        self.assertEqual(delta["codes"], [1, 2])
+
+    def test_only_changes_and_appended_codes(self):
+        self.core.codes.extend(b"\x01\x02")
+        self.encoder.encode(self.core)
+        self.core.codes.extend(b"\x03")
+        self.core.fitness = 1.5
+        delta = self.encoder.encode(self.core)
+        self.assertEqual(delta["base"], 1)
+        self.assertEqual(delta["version"], 2)
+        self.assertEqual(delta["changes"], {"fitness": 1.5})
+        self.assertEqual(delta["codes_offset"], 2)
+        self.assertEqual(delta["codes"], [3])
+
+    def test_unchanged_instance_is_skipped(self):
+        self.encoder.encode(self.core)
+        self.assertIsNone(self.encoder.encode(self.core))
+        self.assertEqual(self.encoder.version(self.core.id), 1)
+
+    def test_replaced_codes_are_resent(self):
+        self.core.codes.extend(b"\x01\x02\x03")
+        self.encoder.encode(self.core)
+        self.core.codes = bytearray(b"\x09")
+        delta = self.encoder.encode(self.core)
+        self.assertEqual(delta["codes_offset"], 0)
+        self.assertEqual(delta["codes"], [9])
+
+    def test_snapshot_for_resync(self):
+        self.core.codes.extend(b"\x01")
+        self.encoder.encode(self.core)
+        self.core.codes.extend(b"\x02")
+        snapshot = self.encoder.snapshot([self.core])
+        self.assertEqual(snapshot[0]["version"], 1)
+        self.assertEqual(snapshot[0]["codes"], [1, 2])
+        # Sonraki mesaj istemcinin kodlarını doğru konumdan uzatır
+        delta = self.encoder.encode(self.core)
+        self.assertEqual(delta["base"], 1)
+        codes = snapshot[0]["codes"][: delta["codes_offset"]] + delta["codes"]
+        self.assertEqual(codes, [1, 2])
+
+    def test_reset(self):
+        self.encoder.encode(self.core)
+        self.encoder.reset()
+        self.assertEqual(len(self.encoder), 0)
+        self.assertEqual(self.encoder.encode(self.core)["base"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
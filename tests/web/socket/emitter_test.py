@@ -0,0 +1,116 @@
+# tests/web/socket/emitter_test.py
+
+import time
+import unittest
+from unittest.mock import MagicMock
+from src.web.socket.delta import DeltaEncoder
+from src.web.socket.emitter import PopulationEmitter
+from src.web.socket.subscription import Subscription, Subscriptions
+
+
+class Instance:
+    def __init__(self, id):
+        self.id = id
+        self.value = 0
+        self.codes = b""
+        self.lineage_id = id
+        self.generation = 1
+        self.fitness = 0.0
+
+    def to_json(self, codes=True):
+        return {"id": self.id, "value": self.value}
+
+
+class TestPopulationEmitter(unittest.TestCase):
+    def setUp(self):
+        self.emit = MagicMock()
+        self.emitter = PopulationEmitter(self.emit, rate=20)
+
+    def tearDown(self):
+        self.emitter.stop(timeout=1)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            PopulationEmitter(self.emit, rate=0)
+
+    def test_coalesces_to_latest_state(self):
+        instances = [Instance(id) for id in range(3)]
+        for value in range(5):
+            for instance in instances:
+                instance.value = value
+                self.emitter.mark(instance)
+        self.assertEqual(self.emitter.queue_depth, 3)
+        self.assertEqual(self.emitter.dropped, 12)
+        self.assertEqual(self.emitter.flush(), 3)
+        # Tek mesajda yalnızca son durumlar gönderilir
+        self.emit.assert_called_once()
+        event, payload = self.emit.call_args[0]
+        self.assertEqual(event, "population_frame")
+        self.assertEqual(payload["frame"], 0)
+        self.assertEqual(
+            payload["instances"],
+            [{"id": 0, "value": 4}, {"id": 1, "value": 4}, {"id": 2, "value": 4}],
+        )
+        self.assertEqual(self.emitter.queue_depth, 0)
+
+    def test_empty_flush(self):
+        self.assertEqual(self.emitter.flush(), 0)
+        self.emit.assert_not_called()
+
+    def test_delta_frames(self):
+        emitter = PopulationEmitter(self.emit, rate=20, encoder=DeltaEncoder())
+        instance = Instance(1)
+        emitter.mark(instance)
+        self.assertEqual(emitter.flush(), 1)
+        # Değişmeyen örnek için mesaj gönderilmez
+        emitter.mark(instance)
+        self.assertEqual(emitter.flush(), 0)
+        instance.value = 5
+        emitter.mark(instance)
+        self.assertEqual(emitter.flush(), 1)
+        payload = self.emit.call_args[0][1]
+        self.assertTrue(payload["delta"])
+        self.assertEqual(payload["instances"][0]["changes"], {"value": 5})
+        self.assertEqual(self.emit.call_count, 2)
+
+    def test_routed_frames(self):
+        subscriptions = Subscriptions()
+        subscriptions.subscribe("client", Subscription(ids=[1]))
+        encoder = DeltaEncoder()
+        encode = MagicMock(side_effect=encoder.encode)
+        encoder.encode = encode
+        emitter = PopulationEmitter(
+            self.emit, rate=20, encoder=encoder, router=subscriptions
+        )
+        for id in range(3):
+            emitter.mark(Instance(id))
+        self.assertEqual(emitter.flush(), 1)
+        event, payload, room = self.emit.call_args[0]
+        self.assertEqual(room, "json:ids=1")
+        # Hiçbir odaya uymayan örnekler serileştirilmez
+        self.assertEqual(encode.call_count, 1)
+        self.assertEqual(emitter.metrics()["unrouted"], 2)
+        # Abone yoksa hiçbir şey gönderilmez
+        subscriptions.unsubscribe("client")
+        emitter.mark(Instance(1))
+        self.assertEqual(emitter.flush(), 0)
+        self.assertEqual(self.emit.call_count, 1)
+
+    def test_rate_limited_frames(self):
+        self.emitter.start()
+        instance = Instance(1)
+        started = time.time()
+        while time.time() - started < 0.3:
+            self.emitter.mark(instance)
+            time.sleep(0.001)
+        self.emitter.stop(timeout=1)
+        metrics = self.emitter.metrics()
+        # 20 Hz ile 0.3 saniyede en fazla birkaç mesaj gönderilir
+        self.assertLessEqual(metrics["frames"], 8)
+        self.assertGreater(metrics["frames"], 0)
+        self.assertEqual(metrics["updates"] - metrics["dropped"], metrics["frames"])
+        self.assertEqual(metrics["queue_depth"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
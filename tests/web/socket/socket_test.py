@@ -0,0 +1,76 @@
+# tests/web/socket/socket_test.py
+
+import unittest
+from src.web.app import create_app
+
+# Ensure that create_app returns the app instance directly
+app = create_app()
+
+
+class SocketTest(unittest.TestCase):
+    def setUp(self):
+        self.io = app.extensions["socketio"]
+        self.client = self.io.test_client(app)
+        self.other = self.io.test_client(app)
+        # Bağlantı sırasında gönderilen mesajlar temizlenir
+        self.client.get_received()
+        self.other.get_received()
+
+    def tearDown(self):
+        self.client.disconnect()
+        self.other.disconnect()
+
+    def test_get_is_dispatched_in_process(self):
+        self.client.emit("get", "/api/v1/time")
+        received = self.client.get_received()
+        self.assertEqual(received[0]["name"], "/api/v1/time")
+        self.assertIn("current_time", received[0]["args"][0])
+        # Yanıt yalnızca isteyen istemciye gönderilir
+        self.assertEqual(self.other.get_received(), [])
+
+    def test_rpc_ack(self):
+        response = self.client.emit("rpc", {"endpoint": "/api/v1/time"}, callback=True)
+        self.assertEqual(response["status"], 200)
+        self.assertIn("current_time", response["data"])
+
+    def test_rpc_unknown_endpoint(self):
+        response = self.client.emit("rpc", {"endpoint": "/unknown"}, callback=True)
+        self.assertEqual(response["status"], 404)
+
+    def test_rpc_matches_exact_paths(self):
+        # Yolun bir parçası API yolu sayılmaz
+        for endpoint in ("/api", "/api/v1/tim", "/v1/time", None):
+            response = self.client.emit("rpc", {"endpoint": endpoint}, callback=True)
+            self.assertEqual(response["status"], 404)
+        response = self.client.emit(
+            "rpc", {"endpoint": "/api/v1/time?format=json"}, callback=True
+        )
+        self.assertEqual(response["status"], 200)
+
+    def test_rpc_only_dispatches_get(self):
+        # Durum değiştiren istekler RPC ile iletilmez
+        for method in ("POST", "PUT", "DELETE"):
+            response = self.client.emit(
+                "rpc",
+                {"endpoint": "/api/v1/simulation/start", "method": method},
+                callback=True,
+            )
+            self.assertEqual(response, {"status": 405, "data": None})
+        response = self.client.emit(
+            "rpc", {"endpoint": "/api/v1/time", "method": "get"}, callback=True
+        )
+        self.assertEqual(response["status"], 200)
+
+    def test_update_requires_started_simulation(self):
+        response = self.client.emit(
+            "update", {"id": 1, "formula": "self.generation"}, callback=True
+        )
+        self.assertIn("error", response)
+
+    def test_update_requires_formula(self):
+        response = self.client.emit("update", {"id": 1}, callback=True)
+        self.assertIn("error", response)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# tests/web/socket/subscription_test.py
+
+import unittest
+from unittest.mock import MagicMock
+from src.life.particles.core import Core
+from src.web.socket.subscription import ALL, Subscription, Subscriptions
+
+
+class TestSubscriptions(unittest.TestCase):
+    def setUp(self):
+        self.root = Core(name="root", lifetime_seconds=10, lifecycle=1)
+        self.child = Core(
+            name="child", lifetime_seconds=10, lifecycle=1, parent_id=self.root.id
+        )
+        self.other = Core(name="other", lifetime_seconds=10, lifecycle=1)
+        self.cores = [self.root, self.child, self.other]
+        for index, core in enumerate(self.cores):
+            core.logger = MagicMock()
+            core.fitness = float(index)
+        self.subscriptions = Subscriptions(population=lambda: self.cores)
+
+    def test_lineage(self):
+        self.assertEqual(self.child.lineage_id, self.root.id)
+        self.assertEqual(self.other.lineage_id, self.other.id)
+
+    def test_filters(self):
+        subscription = Subscription(lineages=[self.root.id], generations=[2, None])
+        self.assertFalse(subscription.matches(self.root))
+        self.assertTrue(subscription.matches(self.child))
+        self.assertFalse(subscription.matches(self.other))
+        self.assertTrue(Subscription(ids=[self.other.id]).matches(self.other))
+        self.assertEqual(Subscription().key, ALL)
+
+    def test_invalid_filter(self):
+        with self.assertRaises(ValueError):
+            Subscription.from_json({"top_k": 0})
+        with self.assertRaises(ValueError):
+            Subscription.from_json({"generations": [1]})
+
+    def test_route(self):
+        self.subscriptions.subscribe("all", Subscription())
+        self.subscriptions.subscribe("best", Subscription(top_k=1), format="binary")
+        self.subscriptions.subscribe("lineage", Subscription(lineages=[self.root.id]))
+        routes = self.subscriptions.route([self.root, self.other])
+        self.assertEqual(routes["json:*"], {self.root.id, self.other.id})
+        self.assertEqual(routes["binary:top_k=1"], {self.other.id})
+        self.assertEqual(routes[f"json:lineages={self.root.id}"], {self.root.id})
+        self.assertEqual(self.subscriptions.format("binary:top_k=1"), "binary")
+        # Uymayan odalar yönlendirmede yer almaz
+        self.assertNotIn("binary:top_k=1", self.subscriptions.route([self.root]))
+
+    def test_subscribe_replaces_room(self):
+        self.subscriptions.subscribe("client", Subscription())
+        room, previous = self.subscriptions.subscribe(
+            "client", Subscription(ids=[self.root.id])
+        )
+        self.assertEqual(previous, "json:*")
+        self.assertEqual(len(self.subscriptions), 1)
+        self.assertEqual(self.subscriptions.unsubscribe("client"), room)
+        self.assertEqual(len(self.subscriptions), 0)
+        self.assertEqual(self.subscriptions.route(self.cores), {})
+
+    def test_select(self):
+        self.subscriptions.subscribe("client", Subscription(top_k=2))
+        selected = self.subscriptions.select("client", self.cores)
+        self.assertEqual(selected, [self.child, self.other])
+        self.assertEqual(self.subscriptions.select("unknown", self.cores), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# tests/web/socket/wire_test.py
+
+import json
+import math
+import unittest
+from unittest.mock import MagicMock
+from src.life.particles.core import Core
+from src.life.particles.particle import Particle
+from src.life.particles.vector import Vector
+from src.web.socket.delta import DeltaEncoder
+from src.web.socket.wire import (
+    BINARY,
+    JSON,
+    RECORDS,
+    ClientFormats,
+    binary_frame,
+    binary_snapshot,
+    json_frame,
+    pack_record,
+    unpack_records,
+)
+
+
+class TestWire(unittest.TestCase):
+    def setUp(self):
+        self.encoder = DeltaEncoder()
+        self.core = Core(name="test", lifetime_seconds=float("inf"), lifecycle=1)
+        self.core.logger = MagicMock()
+        self.core.trigger_event(None)
+        self.core.status()  # Created durumu tüketilir
+
+    def payload(self, *instances):
+        return {
+            "frame": 3,
+            "time": 1.0,
+            "delta": True,
+            "instances": [
+                self.encoder.encode(instance, raw=True) for instance in instances
+            ],
+        }
+
+    def test_core_record_round_trip(self):
+        fields = self.core.to_json(codes=False)
+        record = pack_record(fields, version=2, base=1, offset=0, length=3)
+        self.assertEqual(len(record), RECORDS["core"].size)
+        data = unpack_records("core", record, b"\x01\x02\x03")[0]
+        self.assertEqual(data["id"], self.core.id)
+        self.assertEqual(data["version"], 2)
+        self.assertEqual(data["base"], 1)
+        self.assertTrue(math.isinf(data["lifetime_seconds"]))
+        self.assertEqual(data["life_status"], fields["life_status"])
+        self.assertEqual(data["codes"], b"\x01\x02\x03")
+
+    def test_particle_record_round_trip(self):
+        particle = Particle(
+            name="particle",
+            lifetime_seconds=10,
+            lifecycle=1,
+            charge=-1.0,
+            mass=2.0,
+            spin=0.5,
+            energy=0,
+            position=Vector(1.0, 2.0, 3.0),
+            velocity=Vector(0.1, 0.1, 0.1),
+            momentum=Vector(0.1, 0.1, 0.1),
+            wave_function=Vector(0.1, 0.1, 0.1),
+        )
+        particle.logger = MagicMock()
+        particle.trigger_event(None)
+        record = pack_record(
+            particle.to_json(codes=False), version=1, base=0, offset=0, length=0
+        )
+        data = unpack_records("particle", record)[0]
+        self.assertEqual(data["mass"], 2.0)
+        self.assertEqual(data["position.z"], 3.0)
+
+    def test_binary_frame(self):
+        self.core.codes.extend(b"\x01\x02")
+        frame = binary_frame(self.payload(self.core), self.encoder)
+        self.assertEqual(frame["frame"], 3)
+        self.assertEqual(frame["schema"], "core")
+        self.assertEqual(frame["codes"], b"\x01\x02")
+        # Sonraki mesaj yalnızca eklenen kodları taşır
+        self.core.codes.extend(b"\x03")
+        frame = binary_frame(self.payload(self.core), self.encoder)
+        data = unpack_records(frame["schema"], frame["records"], frame["codes"])[0]
+        self.assertEqual(data["base"], 1)
+        self.assertEqual(data["codes_offset"], 2)
+        self.assertEqual(data["codes"], b"\x03")
+
+    def test_binary_frame_is_smaller(self):
+        self.core.codes.extend(bytes(range(64)))
+        payload = self.payload(self.core)
+        binary = binary_frame(payload, self.encoder)
+        text = json.dumps(json_frame(payload))
+        self.assertLess(len(binary["records"]) + len(binary["codes"]), len(text))
+
+    def test_json_frame(self):
+        self.core.codes.extend(b"\x01\x02")
+        frame = json_frame(self.payload(self.core))
+        self.assertEqual(frame["instances"][0]["codes"], [1, 2])
+        json.dumps(frame)
+
+    def test_binary_snapshot(self):
+        self.core.codes.extend(b"\x05\x06")
+        self.encoder.encode(self.core)
+        snapshot = binary_snapshot(self.encoder.snapshot([self.core]))
+        data = unpack_records("core", snapshot["records"], snapshot["codes"])[0]
+        self.assertEqual(data["version"], 1)
+        self.assertEqual(data["codes"], b"\x05\x06")
+
+    def test_client_formats(self):
+        formats = ClientFormats()
+        self.assertEqual(formats.connect("a", "binary"), BINARY)
+        self.assertEqual(formats.connect("b", "xml"), JSON)
+        self.assertEqual(formats.connect("c"), JSON)
+        self.assertEqual(formats.count(JSON), 2)
+        formats.disconnect("a")
+        self.assertEqual(formats.count(BINARY), 0)
+        self.assertEqual(formats.format("a"), JSON)
+
+
+if __name__ == "__main__":
+    unittest.main()